@@ -0,0 +1,250 @@
+import os
+import re
+import sys
+import json
+import mmap
+import time
+import hashlib
+import argparse
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import question_bank
+
+
+SECTION_KEY = re.compile(rb'(?<!\\)"(easy|medium|hard)"\s*:\s*\[')
+BOUNDARY = re.compile(rb"\}\s*,\s*\{")
+MAX_ERRORS_PER_CHUNK = 100
+
+
+class ChunkParseError(Exception):
+    pass
+
+
+def check_records(questions, first_index):
+    blob = bytearray()
+    lengths = array("Q")
+    digests = bytearray()
+    errors = []
+    error_count = 0
+    checked = 0
+    for i, question in enumerate(questions):
+        error, arithmetic = question_bank.check_question(question)
+        if error:
+            error_count += 1
+            if len(errors) < MAX_ERRORS_PER_CHUNK:
+                errors.append((first_index + i, error))
+            lengths.append(0)
+            digests += bytes(8)
+            continue
+        checked += arithmetic
+        raw = question_bank.encode_question(question)
+        blob += raw
+        lengths.append(len(raw))
+        digests += hashlib.blake2b(question["question"].encode("utf-8"), digest_size=8).digest()
+    return {
+        "blob": bytes(blob),
+        "lengths": lengths,
+        "digests": bytes(digests),
+        "errors": errors,
+        "error_count": error_count,
+        "checked": checked,
+        "count": len(questions)
+    }
+
+
+def check_chunk(path, start, end):
+    with open(path, "rb") as f:
+        f.seek(start)
+        raw = f.read(end - start)
+    try:
+        questions = json.loads(b"[" + raw + b"]")
+    except ValueError:
+        raise ChunkParseError(f"could not parse bytes {start}-{end}")
+    return check_records(questions, 0)
+
+
+def find_sections(raw):
+    headers = [(match.group(1).decode(), match.end()) for match in SECTION_KEY.finditer(raw)]
+    names = [name for name, _ in headers]
+    if not headers or len(set(names)) != len(names):
+        return None
+
+    sections = {}
+    for n, (name, start) in enumerate(headers):
+        end = headers[n + 1][1] if n + 1 < len(headers) else len(raw)
+        close = raw.rfind(b"]", start, end)
+        if close < 0:
+            return None
+        sections[name] = (start, close)
+    if not check_skeleton(raw, sections):
+        return None
+    return sections
+
+
+def check_skeleton(raw, sections):
+    spans = sorted(sections.values())
+    pieces = [raw[:spans[0][0]]]
+    for n, (start, close) in enumerate(spans):
+        pieces.append(raw[close:spans[n + 1][0]] if n + 1 < len(spans) else raw[close:])
+    try:
+        top = json.loads(b"".join(pieces))
+    except ValueError:
+        return False
+    return isinstance(top, dict) and all(top.get(name) == [] for name in sections)
+
+
+def split_section(raw, start, end, chunk_size):
+    cuts = [start]
+    while end - cuts[-1] > chunk_size:
+        match = BOUNDARY.search(raw, cuts[-1] + chunk_size, end)
+        if not match:
+            break
+        cuts.append(match.start() + 1)
+    chunks = []
+    for a, b in zip(cuts, cuts[1:] + [end]):
+        a = raw.find(b"{", a, b) if a != start else a
+        chunks.append((a, b))
+    return [chunk for chunk in chunks if raw[chunk[0]:chunk[1]].strip(b" \t\r\n,")]
+
+
+def check_parallel(path, jobs, chunk_size):
+    with open(path, "rb") as f:
+        raw = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        sections = find_sections(raw)
+        if sections is None:
+            return None
+        plan = []
+        for name in question_bank.DIFFICULTIES:
+            if name not in sections:
+                continue
+            start, end = sections[name]
+            for a, b in split_section(raw, start, end, chunk_size):
+                plan.append((name, a, b))
+    finally:
+        raw.close()
+
+    results = {name: [] for name in question_bank.DIFFICULTIES}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [(name, pool.submit(check_chunk, path, a, b)) for name, a, b in plan]
+        try:
+            for name, future in futures:
+                results[name].append(future.result())
+        except ChunkParseError:
+            for _, future in futures:
+                future.cancel()
+            return None
+    for chunks in results.values():
+        first = 0
+        for chunk in chunks:
+            chunk["errors"] = [(first + i, error) for i, error in chunk["errors"]]
+            first += chunk["count"]
+    return results
+
+
+def check_serial(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise question_bank.BankError("questions.json must be an object of easy/medium/hard lists.")
+    results = {}
+    for name in question_bank.DIFFICULTIES:
+        questions = data.get(name, [])
+        if not isinstance(questions, list):
+            raise question_bank.BankError(f"\"{name}\" must be a list of questions.")
+        results[name] = [check_records(questions, 0)]
+    return results
+
+
+def find_duplicates(results):
+    errors = []
+    cross = 0
+    owner = {}
+    for name in question_bank.DIFFICULTIES:
+        seen = set()
+        index = 0
+        for chunk in results[name]:
+            digests = chunk["digests"]
+            for n in range(chunk["count"]):
+                if not chunk["lengths"][n]:
+                    index += 1
+                    continue
+                digest = digests[n * 8:n * 8 + 8]
+                if digest in seen:
+                    errors.append((name, index, "duplicate question"))
+                elif owner.get(digest, name) != name:
+                    cross += 1
+                seen.add(digest)
+                owner.setdefault(digest, name)
+                index += 1
+    return errors, cross
+
+
+def records(chunks):
+    for chunk in chunks:
+        view = memoryview(chunk["blob"])
+        position = 0
+        for length in chunk["lengths"]:
+            yield view[position:position + length]
+            position += length
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Validate a questions.json bank and compile it for mathquiz.py")
+    parser.add_argument("source", nargs="?", default=os.path.join(script_dir, "questions.json"), help="question bank to check (default questions.json)")
+    parser.add_argument("-o", "--output", help="compiled bank to write (default: next to the source, .qbank)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-mb", type=int, default=16, help="bytes of JSON per worker task, in MB (default 16)")
+    parser.add_argument("--check", action="store_true", help="validate only, do not write the compiled bank")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        results = check_parallel(args.source, args.jobs, args.chunk_mb << 20)
+        mode = f"{args.jobs} workers"
+        if results is None:
+            results = check_serial(args.source)
+            mode = "serial fallback"
+    except FileNotFoundError:
+        print(f"Error: {args.source} not found.")
+        return 2
+    except json.JSONDecodeError as e:
+        print(f"Error: could not parse {args.source}: {e}")
+        return 2
+    except question_bank.BankError as e:
+        print(f"Error: {e}")
+        return 2
+
+    errors = [(name, i, error) for name in question_bank.DIFFICULTIES for chunk in results[name] for i, error in chunk["errors"]]
+    error_count = sum(chunk["error_count"] for name in results for chunk in results[name])
+    duplicates, cross = find_duplicates(results)
+    errors += duplicates
+    error_count += len(duplicates)
+    elapsed = time.perf_counter() - start
+
+    for name in question_bank.DIFFICULTIES:
+        chunks = results[name]
+        total = sum(chunk["count"] for chunk in chunks)
+        checked = sum(chunk["checked"] for chunk in chunks)
+        print(f"{name:<8}{total:>12,} questions  {checked:>12,} arithmetic-checked")
+    section_order = {name: rank for rank, name in enumerate(question_bank.DIFFICULTIES)}
+    for name, i, error in sorted(errors, key=lambda e: (section_order[e[0]], e[1]))[:20]:
+        print(f"  {name} question {i + 1}: {error}")
+    if error_count > 20:
+        print(f"  ... and {error_count - 20:,} more")
+    if cross:
+        print(f"note: {cross:,} questions appear in more than one difficulty")
+    print(f"{error_count:,} errors, checked in {elapsed:.2f}s ({mode})")
+
+    if error_count:
+        return 1
+    if not args.check:
+        output = args.output or question_bank.bank_path_for(args.source)
+        question_bank.save_bank([(name, records(results[name])) for name in question_bank.DIFFICULTIES], output)
+        print(f"wrote {output} ({os.path.getsize(output):,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,17 @@
 import tkinter as tk
 from tkinter import font as tkfont
-import random
 import json
 import os
+import question_bank
 
 EASY_QUESTIONS = []
 MEDIUM_QUESTIONS = []
 HARD_QUESTIONS = []
 ALL_QUESTIONS = []
 QUIZ_DATA_BY_DIFFICULTY = {}
+QUESTION_BANK = None
+AVOID_REPEATS = True
+recent_questions = {}
 
 score = 0
 current_question_index = 0
@@ -20,6 +23,13 @@ next_button = None
 option_buttons = []
 score_label = None
 main_menu_button = None
+question_tracker_label = None
+question_label = None
+error_label = None
+result_labels = {}
+
+screens = {}
+current_screen = None
 
 app = tk.Tk()
 app.title("Simple Math Quiz")
@@ -37,49 +47,65 @@ SMALL_FONT = ("Helvetica", 10)
 content_frame = tk.Frame(app, bg="#f0f0f0")
 content_frame.pack(fill="both", expand=True)
 
-def clear_frame():
-    for widget in content_frame.winfo_children():
-        widget.destroy()
+def show_screen(name):
+    global current_screen
+    
+    if current_screen == name:
+        return screens[name]
+    if current_screen is not None:
+        screens[current_screen].pack_forget()
+    
+    if name not in screens:
+        screens[name] = SCREEN_BUILDERS[name]()
+    screens[name].pack(fill="both", expand=True)
+    current_screen = name
+    return screens[name]
 
-def show_error_screen(message):
-    clear_frame()
-    content_frame.grid_rowconfigure(0, weight=1)
-    content_frame.grid_rowconfigure(2, weight=1)
-    content_frame.grid_columnconfigure(0, weight=1)
+def build_error_screen():
+    global error_label
+    
+    frame = tk.Frame(content_frame, bg="#f0f0f0")
+    frame.grid_rowconfigure(0, weight=1)
+    frame.grid_rowconfigure(2, weight=1)
+    frame.grid_columnconfigure(0, weight=1)
     
-    error_label = tk.Label(content_frame, 
-                           text=message,
+    error_label = tk.Label(frame, 
+                           text="",
                            font=QUESTION_FONT,
                            fg="red",
                            bg="#f0f0f0",
                            wraplength=450)
     error_label.grid(row=0, column=0, pady=20)
     
-    quit_button = tk.Button(content_frame, text="Quit", 
+    quit_button = tk.Button(frame, text="Quit", 
                             font=SMALL_FONT,
                             command=app.quit,
                             bg="#6c757d", fg="white", width=10)
     quit_button.grid(row=1, column=0, pady=20)
+    return frame
+
+def show_error_screen(message):
+    show_screen("error")
+    error_label.config(text=message)
 
 
 def load_questions_from_file():
-    global EASY_QUESTIONS, MEDIUM_QUESTIONS, HARD_QUESTIONS, ALL_QUESTIONS, QUIZ_DATA_BY_DIFFICULTY
+    global EASY_QUESTIONS, MEDIUM_QUESTIONS, HARD_QUESTIONS, ALL_QUESTIONS, QUIZ_DATA_BY_DIFFICULTY, QUESTION_BANK
     
     try:
         script_dir = os.path.dirname(os.path.abspath(__file__))
         json_path = os.path.join(script_dir, "questions.json")
 
-        with open(json_path, "r") as f:
-            data = json.load(f)
+        QUESTION_BANK = question_bank.load_bank(json_path)
             
-        EASY_QUESTIONS = data.get("easy", [])
-        MEDIUM_QUESTIONS = data.get("medium", [])
-        HARD_QUESTIONS = data.get("hard", [])
+        EASY_QUESTIONS = QUESTION_BANK.section("easy")
+        MEDIUM_QUESTIONS = QUESTION_BANK.section("medium")
+        HARD_QUESTIONS = QUESTION_BANK.section("hard")
         
         if not EASY_QUESTIONS and not MEDIUM_QUESTIONS and not HARD_QUESTIONS:
             return False, "Error: questions.json is empty or has wrong format."
             
-        ALL_QUESTIONS = EASY_QUESTIONS + MEDIUM_QUESTIONS + HARD_QUESTIONS
+        ALL_QUESTIONS = QUESTION_BANK.section("marathon")
         
         QUIZ_DATA_BY_DIFFICULTY = {
             "easy": EASY_QUESTIONS,
@@ -93,27 +119,30 @@ def load_questions_from_file():
         return False, f"Error: questions.json file not found.\nI looked for it here:\n{json_path}\nMake sure it's in the same folder as the .py file."
     except json.JSONDecodeError:
         return False, "Error: Could not read questions.json.\nCheck for syntax errors (e.g., missing comma)."
+    except question_bank.BankError as e:
+        return False, f"Error: questions.json has a bad entry.\n{e}"
+    except (KeyError, ValueError, TypeError):
+        return False, "Error: questions.json is empty or has wrong format."
     except Exception as e:
         return False, f"An unexpected error occurred: {e}"
 
 
-def show_welcome_screen():
-    clear_frame()
-    
-    content_frame.grid_rowconfigure(0, weight=1)
-    content_frame.grid_rowconfigure(5, weight=1)
-    content_frame.grid_rowconfigure(6, weight=1)
-    content_frame.grid_columnconfigure(0, weight=1)
+def build_welcome_screen():
+    frame = tk.Frame(content_frame, bg="#f0f0f0")
+    frame.grid_rowconfigure(0, weight=1)
+    frame.grid_rowconfigure(5, weight=1)
+    frame.grid_rowconfigure(6, weight=1)
+    frame.grid_columnconfigure(0, weight=1)
 
-    title_label = tk.Label(content_frame, text="Welcome to the Simple Math Quiz!", 
+    title_label = tk.Label(frame, text="Welcome to the Simple Math Quiz!", 
                            font=TITLE_FONT, pady=10, bg="#f0f0f0")
     title_label.grid(row=1, column=0, pady=(20, 10))
 
-    subtitle_label = tk.Label(content_frame, text="Select your mode:", 
+    subtitle_label = tk.Label(frame, text="Select your mode:", 
                               font=QUESTION_FONT, pady=10, bg="#f0f0f0")
     subtitle_label.grid(row=2, column=0, pady=(0, 20))
 
-    mode_frame = tk.Frame(content_frame, bg="#f0f0f0")
+    mode_frame = tk.Frame(frame, bg="#f0f0f0")
     mode_frame.grid(row=3, column=0)
     
     easy_button = tk.Button(mode_frame, text="Easy", 
@@ -140,7 +169,7 @@ def show_welcome_screen():
                             activebackground="#c82333", activeforeground="white")
     hard_button.grid(row=0, column=2, padx=5, pady=5)
     
-    marathon_button = tk.Button(content_frame, text="Marathon", 
+    marathon_button = tk.Button(frame, text="Marathon", 
                                 font=BUTTON_FONT, 
                                 command=lambda: start_quiz("marathon"),
                                 bg="#007bff", fg="white", width=20, height=2,
@@ -148,13 +177,17 @@ def show_welcome_screen():
                                 activebackground="#0069d9", activeforeground="white")
     marathon_button.grid(row=4, column=0, pady=15)
     
-    quit_button = tk.Button(content_frame, text="Quit", 
+    quit_button = tk.Button(frame, text="Quit", 
                             font=SMALL_FONT,
                             command=app.quit,
                             bg="#6c757d", fg="white", width=10,
                             relief="raised", borderwidth=2,
                             activebackground="#5a6268", activeforeground="white")
     quit_button.grid(row=5, column=0, pady=10, sticky="s")
+    return frame
+
+def show_welcome_screen():
+    show_screen("welcome")
 
 def start_quiz(mode):
     global quiz_mode, score, current_question_index, quiz_data
@@ -164,74 +197,58 @@ def start_quiz(mode):
     current_question_index = 0
     
     questions_list = QUIZ_DATA_BY_DIFFICULTY.get(mode, MEDIUM_QUESTIONS)
-    quiz_data = list(questions_list)
-    random.shuffle(quiz_data)
+    avoid = recent_questions.get(mode, ()) if AVOID_REPEATS else ()
+    quiz_data = question_bank.shuffled(questions_list, avoid=avoid)
+    recent_questions[mode] = quiz_data.seen()
     
     show_quiz_screen()
 
-def show_quiz_screen():
+def build_quiz_screen():
     global feedback_label, next_button, option_buttons, score_label, main_menu_button
+    global question_tracker_label, question_label
     
-    clear_frame()
+    frame = tk.Frame(content_frame, bg="#f0f0f0")
     
-    content_frame.grid_rowconfigure(0, weight=0)
-    content_frame.grid_rowconfigure(1, weight=0)
-    content_frame.grid_rowconfigure(2, weight=0)
-    content_frame.grid_rowconfigure(3, weight=0)
-    content_frame.grid_rowconfigure(4, weight=0)
-    content_frame.grid_rowconfigure(5, weight=0)
-    content_frame.grid_rowconfigure(6, weight=0)
-    
-    question_data = quiz_data[current_question_index]
-    question_num = current_question_index + 1
-    
-    status_frame = tk.Frame(content_frame, pady=10, bg="#f0f0f0")
+    status_frame = tk.Frame(frame, pady=10, bg="#f0f0f0")
     status_frame.pack(fill="x", padx=20)
-    
-    if quiz_mode == "marathon":
-        tracker_text = f"Question: {question_num}"
-    else:
-        total_questions = len(quiz_data)
-        tracker_text = f"Question: {question_num} / {total_questions}"
         
-    question_tracker_label = tk.Label(status_frame, text=tracker_text, 
+    question_tracker_label = tk.Label(status_frame, text="", 
                                            font=SMALL_FONT, bg="#f0f0f0")
     question_tracker_label.pack(side="left")
     
-    score_label = tk.Label(status_frame, text=f"Score: {score}", 
+    score_label = tk.Label(status_frame, text="", 
                                 font=SMALL_FONT, bg="#f0f0f0")
     score_label.pack(side="right")
 
-    question_label = tk.Label(content_frame, text=question_data["question"], 
+    question_label = tk.Label(frame, text="", 
                                     font=QUESTION_FONT, wraplength=450,
                                     pady=20, bg="#f0f0f0")
     question_label.pack(pady=10)
 
-    options_frame = tk.Frame(content_frame, bg="#f0f0f0")
+    options_frame = tk.Frame(frame, bg="#f0f0f0")
     options_frame.pack(pady=10)
     
     option_buttons = []
     btn_grid_frame = tk.Frame(options_frame, bg="#f0f0f0")
     btn_grid_frame.pack()
     
-    options = question_data["options"]
     for i in range(4):
-        button = tk.Button(btn_grid_frame, text=options[i], 
+        button = tk.Button(btn_grid_frame, text="", 
                            font=BUTTON_FONT, width=18, height=2,
                            relief="raised", borderwidth=2, bg="#ffffff",
                            activebackground="#e2e6ea",
-                           command=lambda opt=options[i]: check_answer(opt))
+                           command=lambda i=i: check_answer(quiz_data[current_question_index]["options"][i]))
         
         row = i // 2
         col = i % 2
         button.grid(row=row, column=col, pady=5, padx=5)
         option_buttons.append(button)
 
-    feedback_label = tk.Label(content_frame, text="", 
+    feedback_label = tk.Label(frame, text="", 
                                     font=FEEDBACK_FONT, pady=10, bg="#f0f0f0")
     feedback_label.pack(pady=5)
 
-    navigation_frame = tk.Frame(content_frame, bg="#f0f0f0")
+    navigation_frame = tk.Frame(frame, bg="#f0f0f0")
     navigation_frame.pack(pady=20)
 
     main_menu_button = tk.Button(navigation_frame, text="Main Menu",
@@ -251,6 +268,31 @@ def show_quiz_screen():
                                  bg="#007bff", fg="white",
                                  activebackground="#0069d9")
     next_button.pack(side="right", padx=10)
+    return frame
+
+def show_quiz_screen():
+    show_screen("quiz")
+    
+    question_data = quiz_data[current_question_index]
+    question_num = current_question_index + 1
+    
+    if quiz_mode == "marathon":
+        tracker_text = f"Question: {question_num}"
+    else:
+        total_questions = len(quiz_data)
+        tracker_text = f"Question: {question_num} / {total_questions}"
+    
+    question_tracker_label.config(text=tracker_text)
+    score_label.config(text=f"Score: {score}")
+    question_label.config(text=question_data["question"])
+    
+    options = question_data["options"]
+    for i, button in enumerate(option_buttons):
+        button.config(text=options[i], state="normal")
+    
+    feedback_label.config(text="")
+    next_button.config(state="disabled")
+    main_menu_button.config(state="normal")
 
 def check_answer(selected_option):
     global score, feedback_label, next_button, option_buttons, score_label
@@ -297,12 +339,50 @@ def next_question():
     else:
         show_results()
 
-def show_results():
-    clear_frame()
+def build_results_screen():
+    frame = tk.Frame(content_frame, bg="#f0f0f0")
+    frame.grid_rowconfigure(0, weight=1)
+    frame.grid_rowconfigure(6, weight=1)
+    frame.grid_columnconfigure(0, weight=1)
+
+    result_labels["title"] = tk.Label(frame, text="", 
+                           font=TITLE_FONT, pady=10, bg="#f0f0f0")
+    result_labels["title"].grid(row=1, column=0, pady=20)
+    
+    score_summary_label = tk.Label(frame, text="You scored:", 
+                                   font=QUESTION_FONT, bg="#f0f0f0")
+    score_summary_label.grid(row=2, column=0, pady=5)
+    
+    result_labels["score"] = tk.Label(frame, text="", 
+                                      font=SCORE_FONT, bg="#f0f0f0")
+    result_labels["score"].grid(row=3, column=0, pady=10)
+    
+    result_labels["comment"] = tk.Label(frame, text="", 
+                                  font=QUESTION_FONT, bg="#f0f0f0")
+    result_labels["comment"].grid(row=4, column=0, pady=10)
+    
+    buttons_frame = tk.Frame(frame, bg="#f0f0f0")
+    buttons_frame.grid(row=5, column=0, pady=30)
+
+    play_again_button = tk.Button(buttons_frame, text="Play Again", 
+                                  font=BUTTON_FONT,
+                                  command=show_welcome_screen,
+                                  bg="#28a745", fg="white", width=15, height=2,
+                                  relief="raised", borderwidth=2,
+                                  activebackground="#218838")
+    play_again_button.pack(side="left", padx=10)
     
-    content_frame.grid_rowconfigure(0, weight=1)
-    content_frame.grid_rowconfigure(6, weight=1)
-    content_frame.grid_columnconfigure(0, weight=1)
+    quit_button = tk.Button(buttons_frame, text="Quit", 
+                            font=BUTTON_FONT,
+                            command=app.quit,
+                            bg="#dc3545", fg="white", width=15, height=2,
+                            relief="raised", borderwidth=2,
+                            activebackground="#c82333")
+    quit_button.pack(side="right", padx=10)
+    return frame
+
+def show_results():
+    show_screen("results")
     
     final_title = "Quiz Complete!"
     final_comment = ""
@@ -331,40 +411,16 @@ def show_results():
         else:
             final_comment = "Keep practicing!"
 
-    title_label = tk.Label(content_frame, text=final_title, 
-                           font=TITLE_FONT, pady=10, bg="#f0f0f0")
-    title_label.grid(row=1, column=0, pady=20)
-    
-    score_summary_label = tk.Label(content_frame, text="You scored:", 
-                                   font=QUESTION_FONT, bg="#f0f0f0")
-    score_summary_label.grid(row=2, column=0, pady=5)
-    
-    final_score_label = tk.Label(content_frame, text=score_text, 
-                                      font=SCORE_FONT, bg="#f0f0f0")
-    final_score_label.grid(row=3, column=0, pady=10)
-    
-    comment_label = tk.Label(content_frame, text=final_comment, 
-                                  font=QUESTION_FONT, bg="#f0f0f0")
-    comment_label.grid(row=4, column=0, pady=10)
-    
-    buttons_frame = tk.Frame(content_frame, bg="#f0f0f0")
-    buttons_frame.grid(row=5, column=0, pady=30)
+    result_labels["title"].config(text=final_title)
+    result_labels["score"].config(text=score_text)
+    result_labels["comment"].config(text=final_comment)
 
-    play_again_button = tk.Button(buttons_frame, text="Play Again", 
-                                  font=BUTTON_FONT,
-                                  command=show_welcome_screen,
-                                  bg="#28a745", fg="white", width=15, height=2,
-                                  relief="raised", borderwidth=2,
-                                  activebackground="#218838")
-    play_again_button.pack(side="left", padx=10)
-    
-    quit_button = tk.Button(buttons_frame, text="Quit", 
-                            font=BUTTON_FONT,
-                            command=app.quit,
-                            bg="#dc3545", fg="white", width=15, height=2,
-                            relief="raised", borderwidth=2,
-                            activebackground="#c82333")
-    quit_button.pack(side="right", padx=10)
+SCREEN_BUILDERS = {
+    "error": build_error_screen,
+    "welcome": build_welcome_screen,
+    "quiz": build_quiz_screen,
+    "results": build_results_screen
+}
 
 if __name__ == "__main__":
     success, error_message = load_questions_from_file()
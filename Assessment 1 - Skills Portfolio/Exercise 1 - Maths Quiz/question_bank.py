@@ -0,0 +1,371 @@
+import io
+import os
+import re
+import json
+import math
+import mmap
+import struct
+import bisect
+import random
+import tempfile
+from collections import deque
+from fractions import Fraction
+
+
+MAGIC = b"QBK1"
+DIFFICULTIES = ("easy", "medium", "hard")
+HEADER = struct.Struct("<4sI")
+SECTION = struct.Struct("<16sQQ")
+OFFSET = struct.Struct("<Q")
+OPTION_COUNT = 4
+
+SIMPLE = re.compile(r"^What is (\d+) ([-+x*/]) (\d+)\?$")
+SQUARE_ROOT = re.compile(r"^the square root of (\d+)$")
+SQUARED = re.compile(r"^(\d+) squared(?: \(.*\))?$")
+PERCENT_OF = re.compile(r"^(\d+(?:\.\d+)?)% of (\d+(?:\.\d+)?)$")
+FACTORIAL = re.compile(r"^(\d+)!(?: \(.*\))?$")
+NOTE = re.compile(r" \([^()]*[a-z][^()]*\)$")
+TOKEN = re.compile(r"\s*(\d+(?:\.\d+)?|[-+x*/^()])")
+
+
+class BankError(ValueError):
+    pass
+
+
+def tokenize(text):
+    tokens = []
+    position = 0
+    while position < len(text):
+        match = TOKEN.match(text, position)
+        if not match:
+            return None
+        tokens.append(match.group(1))
+        position = match.end()
+    return tokens
+
+
+def parse_expression(tokens):
+    value = parse_term(tokens)
+    while tokens and tokens[0] in "+-":
+        op = tokens.pop(0)
+        right = parse_term(tokens)
+        value = value + right if op == "+" else value - right
+    return value
+
+
+def parse_term(tokens):
+    value = parse_power(tokens)
+    while tokens and tokens[0] in "x*/":
+        op = tokens.pop(0)
+        right = parse_power(tokens)
+        value = value / right if op == "/" else value * right
+    return value
+
+
+def parse_power(tokens):
+    value = parse_atom(tokens)
+    if tokens and tokens[0] == "^":
+        tokens.pop(0)
+        exponent = parse_power(tokens)
+        if exponent.denominator != 1 or abs(exponent) > 64:
+            raise ValueError("unsupported exponent")
+        value = value ** int(exponent)
+    return value
+
+
+def parse_atom(tokens):
+    token = tokens.pop(0)
+    if token == "(":
+        value = parse_expression(tokens)
+        if tokens.pop(0) != ")":
+            raise ValueError("missing )")
+        return value
+    if token == "-":
+        return -parse_atom(tokens)
+    return Fraction(token)
+
+
+def evaluate_simple(match):
+    a, op, b = int(match.group(1)), match.group(2), int(match.group(3))
+    if op == "+":
+        return a + b
+    if op == "-":
+        return a - b
+    if op in "x*":
+        return a * b
+    if b == 0:
+        return None
+    return a // b if a % b == 0 else Fraction(a, b)
+
+
+def evaluate_question(text):
+    match = SIMPLE.match(text)
+    if match:
+        return evaluate_simple(match)
+    if not (text.startswith("What is ") and text.endswith("?")):
+        return None
+    body = text[len("What is "):-1].strip()
+
+    match = SQUARE_ROOT.match(body)
+    if match:
+        n = int(match.group(1))
+        root = math.isqrt(n)
+        return Fraction(root) if root * root == n else None
+    match = SQUARED.match(body)
+    if match:
+        return Fraction(int(match.group(1)) ** 2)
+    match = PERCENT_OF.match(body)
+    if match:
+        return Fraction(match.group(1)) * Fraction(match.group(2)) / 100
+    match = FACTORIAL.match(body)
+    if match and int(match.group(1)) <= 100:
+        return Fraction(math.factorial(int(match.group(1))))
+
+    tokens = tokenize(NOTE.sub("", body))
+    if not tokens:
+        return None
+    try:
+        value = parse_expression(tokens)
+    except (ValueError, IndexError, ZeroDivisionError):
+        return None
+    return value if not tokens else None
+
+
+def check_question(question):
+    if not isinstance(question, dict):
+        return "entry is not an object", None
+    text = question.get("question")
+    options = question.get("options")
+    answer = question.get("answer")
+    if not isinstance(text, str) or not text.strip():
+        return "missing question text", None
+    if not isinstance(options, list) or len(options) != OPTION_COUNT:
+        return f"needs exactly {OPTION_COUNT} options", None
+    if not all(isinstance(option, str) for option in options):
+        return "options must be strings", None
+    if len(set(options)) != len(options):
+        return "duplicate options", None
+    if not isinstance(answer, str) or answer not in options:
+        return "answer is not one of the options", None
+
+    expected = evaluate_question(text)
+    if expected is None:
+        return None, False
+    try:
+        if isinstance(expected, int) and answer.isdigit():
+            correct = int(answer) == expected
+        else:
+            correct = Fraction(answer) == expected
+    except (ValueError, ZeroDivisionError):
+        correct = False
+    if not correct:
+        return f"answer {answer} does not match the question (expected {format_number(expected)})", True
+    return None, True
+
+
+def format_number(value):
+    value = Fraction(value)
+    return str(value.numerator) if value.denominator == 1 else str(float(value))
+
+
+def validate_data(data):
+    if not isinstance(data, dict):
+        raise BankError("questions.json must be an object of easy/medium/hard lists.")
+    for name in DIFFICULTIES:
+        questions = data.get(name, [])
+        if not isinstance(questions, list):
+            raise BankError(f"\"{name}\" must be a list of questions.")
+        seen = set()
+        for i, question in enumerate(questions):
+            error, _ = check_question(question)
+            if error is None and question["question"] in seen:
+                error = "duplicate question"
+            if error:
+                raise BankError(f"{name} question {i + 1}: {error}")
+            seen.add(question["question"])
+
+
+def encode_question(question):
+    record = [question["question"], question["options"], question["answer"]]
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def decode_question(raw):
+    text, options, answer = json.loads(raw)
+    return {"question": text, "options": options, "answer": answer}
+
+
+def write_bank(sections, out):
+    names = [name for name, _ in sections]
+    start = HEADER.size + SECTION.size * len(names)
+    out.write(b"\0" * start)
+    position = start
+    offsets = []
+    for name, records in sections:
+        table = [position]
+        for raw in records:
+            out.write(raw)
+            position += len(raw)
+            table.append(position)
+        offsets.append(table)
+
+    entries = []
+    for name, table in zip(names, offsets):
+        entries.append((name, len(table) - 1, position))
+        out.write(struct.pack(f"<{len(table)}Q", *table))
+        position += OFFSET.size * len(table)
+
+    out.seek(0)
+    out.write(HEADER.pack(MAGIC, len(entries)))
+    for name, count, index_offset in entries:
+        out.write(SECTION.pack(name.encode("utf-8"), count, index_offset))
+
+
+def bank_sections(data):
+    return [(name, (encode_question(q) for q in data.get(name, []))) for name in DIFFICULTIES]
+
+
+def compile_bank(data, path):
+    save_bank(bank_sections(data), path)
+
+
+def save_bank(sections, path):
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".qbank-", dir=folder)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            write_bank(sections, out)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class BankSection:
+    def __init__(self, bank, parts):
+        self.bank = bank
+        self.parts = parts
+        self.starts = []
+        total = 0
+        for index_offset, count in parts:
+            self.starts.append(total)
+            total += count
+        self.count = total
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("question index out of range")
+        part = bisect.bisect_right(self.starts, i) - 1
+        index_offset, _ = self.parts[part]
+        return self.bank.record(index_offset, i - self.starts[part])
+
+
+class ShuffledSection:
+    def __init__(self, section, rng=random, avoid=()):
+        self.section = section
+        self.rng = rng
+        self.avoid = set(avoid)
+        self.swaps = {}
+        self.position = 0
+        self.deferred = deque()
+        self.order = []
+
+    def __len__(self):
+        return len(self.section)
+
+    def draw(self):
+        count = len(self.section)
+        while self.position < count:
+            i = self.position
+            j = self.rng.randrange(i, count)
+            top = self.swaps.pop(i, i)
+            if j == i:
+                picked = top
+            else:
+                picked = self.swaps.get(j, j)
+                self.swaps[j] = top
+            self.position += 1
+            if picked not in self.avoid:
+                return picked
+            self.deferred.append(picked)
+        return self.deferred.popleft()
+
+    def __getitem__(self, i):
+        if not 0 <= i < len(self.section):
+            raise IndexError("question index out of range")
+        while len(self.order) <= i:
+            self.order.append(self.draw())
+        return self.section[self.order[i]]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def seen(self):
+        return self.order
+
+
+def shuffled(section, rng=random, avoid=()):
+    return ShuffledSection(section, rng, avoid)
+
+
+class QuestionBank:
+    def __init__(self, buffer, source=None):
+        self.buffer = buffer
+        self.source = source
+        magic, section_count = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("not a compiled question bank")
+        self.index = {}
+        for n in range(section_count):
+            name, count, index_offset = SECTION.unpack_from(buffer, HEADER.size + SECTION.size * n)
+            self.index[name.rstrip(b"\0").decode("utf-8")] = (index_offset, count)
+
+    @classmethod
+    def open(cls, path):
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, path)
+
+    def record(self, index_offset, i):
+        start, = OFFSET.unpack_from(self.buffer, index_offset + OFFSET.size * i)
+        end, = OFFSET.unpack_from(self.buffer, index_offset + OFFSET.size * (i + 1))
+        return decode_question(self.buffer[start:end])
+
+    def section(self, name):
+        if name == "marathon":
+            return BankSection(self, [self.index[d] for d in DIFFICULTIES if d in self.index])
+        return BankSection(self, [self.index[name]] if name in self.index else [])
+
+    def close(self):
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+
+def bank_path_for(json_path):
+    return os.path.splitext(json_path)[0] + ".qbank"
+
+
+def load_bank(json_path, bank_path=None):
+    if bank_path is None:
+        bank_path = bank_path_for(json_path)
+
+    if os.path.exists(bank_path):
+        if not os.path.exists(json_path) or os.path.getmtime(bank_path) >= os.path.getmtime(json_path):
+            return QuestionBank.open(bank_path)
+
+    with open(json_path, "r") as f:
+        data = json.load(f)
+    validate_data(data)
+    try:
+        compile_bank(data, bank_path)
+        return QuestionBank.open(bank_path)
+    except OSError:
+        out = io.BytesIO()
+        write_bank(bank_sections(data), out)
+        return QuestionBank(out.getvalue())
@@ -0,0 +1,83 @@
+import sys
+import math
+import random
+import itertools
+from collections import Counter
+import question_bank
+
+
+Z_999 = 3.0902
+
+
+def chi_square_limit(df):
+    return df * (1 - 2 / (9 * df) + Z_999 * math.sqrt(2 / (9 * df))) ** 3
+
+
+def chi_square(counts, expected):
+    return sum((count - expected) ** 2 / expected for count in counts)
+
+
+def draw(rng, n, count, avoid=()):
+    order = question_bank.shuffled(range(n), rng, avoid)
+    return tuple(order[i] for i in range(count))
+
+
+def check_permutations(rng):
+    for n in (0, 1, 2, 7, 100, 1000):
+        for avoid in ((), range(0, n, 3)):
+            order = list(question_bank.shuffled(range(n), rng, avoid))
+            if sorted(order) != list(range(n)):
+                return f"n={n}: draw is not a permutation"
+            kept = n - len(set(avoid))
+            if set(order[:kept]) & set(avoid):
+                return f"n={n}: an avoided question came before a fresh one"
+    return None
+
+
+def check_orders(rng, n, trials, avoid=()):
+    kept = n - len(set(avoid))
+    counts = Counter(draw(rng, n, kept, avoid) for _ in range(trials))
+    orders = math.factorial(kept)
+    cells = [counts[order] for order in itertools.permutations(sorted(set(range(n)) - set(avoid)))]
+    if sum(cells) != trials or len(counts) > orders:
+        return None, f"n={n}: draws outside the expected orders"
+    return chi_square(cells, trials / orders), orders - 1
+
+
+def check_positions(rng, n, trials):
+    counts = [[0] * n for _ in range(n)]
+    for _ in range(trials):
+        for position, item in enumerate(question_bank.shuffled(range(n), rng)):
+            counts[position][item] += 1
+    expected = trials / n
+    return chi_square([count for row in counts for count in row], expected), n * (n - 1)
+
+
+def main():
+    trials = int(sys.argv[1]) if len(sys.argv) > 1 else 120000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    rng = random.Random(seed)
+
+    error = check_permutations(rng)
+    if error:
+        print(error)
+        return 1
+
+    failed = False
+    for label, (statistic, detail) in (
+            ("4 questions, all 24 orders", check_orders(rng, 4, trials)),
+            ("6 questions, 2 avoided, 24 orders", check_orders(rng, 6, trials, avoid=(1, 4))),
+            ("50 questions, item per position", check_positions(rng, 50, trials // 10))):
+        if statistic is None:
+            print(detail)
+            return 1
+        df = detail
+        limit = chi_square_limit(df)
+        verdict = "ok" if statistic <= limit else "NOT UNIFORM"
+        failed |= statistic > limit
+        print(f"{label:<36} chi2={statistic:10.1f}  df={df:<4}  99.9% limit={limit:8.1f}  {verdict}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
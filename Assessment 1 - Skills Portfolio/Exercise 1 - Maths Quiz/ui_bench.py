@@ -0,0 +1,53 @@
+import sys
+import os
+import time
+import importlib.util
+
+
+def load_quiz(path):
+    spec = importlib.util.spec_from_file_location("mathquiz_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def count_widgets(widget):
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(script_dir, "mathquiz.py")
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    quiz = load_quiz(path)
+    success, error_message = quiz.load_questions_from_file()
+    if not success:
+        print(error_message)
+        return
+    quiz.show_welcome_screen()
+    quiz.app.update()
+
+    samples = []
+    for n in range(rounds):
+        quiz.start_quiz("easy")
+        while quiz.current_question_index < len(quiz.quiz_data) - 1:
+            start = time.perf_counter()
+            quiz.next_question()
+            quiz.app.update_idletasks()
+            samples.append((time.perf_counter() - start) * 1000)
+        quiz.show_results()
+        quiz.show_welcome_screen()
+        quiz.app.update_idletasks()
+        if n in (0, rounds - 1):
+            print(f"after round {n + 1}: widgets={count_widgets(quiz.app)}")
+
+    samples.sort()
+    p50 = samples[len(samples) // 2]
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"{len(samples)} transitions: p50={p50:.3f} ms p99={p99:.3f} ms max={samples[-1]:.3f} ms")
+    quiz.app.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,11 @@
 import tkinter as tk # Import tkinter library
 from tkinter import messagebox # Import messagebox module
-import random # Import random module
 import os # Import os module
-import time # Import time module
-import imageio # Import imageio library
 from PIL import Image, ImageTk # Import PIL library
+import sys # Import sys module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "shared")) # Modules shared by the exercises
+from video_stream import VideoBackground # Import background video player
+from quiz_engine import QuizSession, QuestionPool, CORRECT, RETRY # Import headless quiz engine
 
 COLOR_BG = "#000000" # Background color
 COLOR_PRIMARY = "#ff0099" # Primary neon pink color
@@ -25,28 +26,24 @@ class MathQuizApp: # Define class
         self.root.geometry(f"{self.win_width}x{self.win_height}") # Apply geometry
         self.root.configure(bg=COLOR_BG) # Set background color
 
-        self.score = 0 # Initialize score
-        self.question_count = 0 # Initialize question count
-        self.max_questions = 10 # Set max questions
-        self.difficulty = "easy" # Set default difficulty
-        self.current_answer = 0 # Initialize answer variable
-        self.attempts_on_current = 0 # Initialize attempts counter
-        
-        self.marathon_start_time = 0 # Initialize timer start
-        self.is_marathon = False # Initialize marathon flag
+        self.session = None # Initialize quiz session
+        self.question_pools = {} # Initialize pre-generated pools per mode
         self.timer_id = None # Initialize timer ID
 
         self.scene_canvas = tk.Canvas(root, bg="black", highlightthickness=0) # Create background canvas
         self.scene_canvas.place(relx=0, rely=0, relwidth=1, relheight=1) # Place canvas
 
-        self.video_reader = None # Initialize video reader
+        self.video = None # Initialize video player
         self.bg_item_id = None # Initialize bg item ID
         self.init_video_background() # Call video setup
+        self.root.bind("<F3>", self.print_video_stats) # Bind video stats key
 
         self.box_img_id = None # Initialize box image ID
         self.border_id = None # Initialize border ID
-        self.text_ids = [] # Initialize text ID list
-        self.ui_elements = [] # Initialize UI elements list
+        self.overlay_cache = {} # Initialize panel image cache
+        self.screens = {} # Initialize retained screens
+        self.current_screen = None # Initialize visible screen name
+        self.timer_text_id = None # Initialize timer text ID
 
         self.show_menu() # Show menu screen
 
@@ -54,202 +51,153 @@ class MathQuizApp: # Define class
         try: # Try block
             base_folder = os.path.dirname(os.path.abspath(__file__)) # Get base folder
             video_path = os.path.join(base_folder, "assets", "hld_mainmenu.mp4") # Build video path
-            self.video_reader = imageio.get_reader(video_path) # Create video reader
-            self.bg_item_id = self.scene_canvas.create_image(0, 0, anchor="nw") # Create placeholder image
-            self.stream_video() # Start stream
+            self.video = VideoBackground(self.root, self.scene_canvas, video_path, (self.win_width, self.win_height), cache="auto", disk_cache=True) # Create player; the loop cache mode is picked from the clip size
+            self.bg_item_id = self.video.item_id # Store bg item ID
+            self.video.start() # Start stream
         except Exception: # Catch errors
             self.scene_canvas.create_text(500, 300, text="VIDEO ERROR", fill="red") # Show error text
 
-    def stream_video(self): # Define stream loop
-        try: # Try block
-            frame_data = self.video_reader.get_next_data() # Get next frame
-            img = Image.fromarray(frame_data) # Convert to PIL image
-            img = img.resize((self.win_width, self.win_height)) # Resize image
-            self.current_frame_img = ImageTk.PhotoImage(img) # Convert to Tkinter image
-            self.scene_canvas.itemconfig(self.bg_item_id, image=self.current_frame_img) # Update canvas
-            self.root.after(33, self.stream_video) # Schedule next frame
-        except IndexError: # Handle end of video
-            self.video_reader.set_image_index(0) # Reset video
-            self.stream_video() # Restart stream
-        except: # Catch other errors
-            pass # Ignore
-
-    def draw_transparent_box(self, x, y, w, h, border_color=COLOR_PRIMARY): # Define draw box function
-        alpha_img = Image.new('RGBA', (w, h), (10, 5, 15, 220)) # Create transparent image
-        self.tk_alpha_img = ImageTk.PhotoImage(alpha_img) # Convert to Tkinter image
-        
-        if self.box_img_id: self.scene_canvas.delete(self.box_img_id) # Delete old box
-        self.box_img_id = self.scene_canvas.create_image(x, y, image=self.tk_alpha_img, anchor="center") # Draw new box
-        
-        if self.border_id: self.scene_canvas.delete(self.border_id) # Delete old border
-        self.border_id = self.scene_canvas.create_rectangle( # Draw new border
-            x - w//2, y - h//2, x + w//2, y + h//2, # Coordinates
-            outline=border_color, width=3 # Style
-        )
-
-    def clear_ui(self): # Define clear UI function
-        for widget in self.ui_elements: # Loop widgets
-            widget.destroy() # Destroy widget
-        self.ui_elements = [] # Clear list
+    def print_video_stats(self, event=None): # Define stats printer
+        if self.video: print(f"Video: {self.video.stats()}") # Print queue depth and drops
+
+    def get_overlay(self, w, h, color=(10, 5, 15), alpha=220): # Define panel image lookup
+        key = (w, h, color, alpha) # Cache key
+        if key not in self.overlay_cache: # First time this panel is needed
+            alpha_img = Image.new('RGBA', (w, h), color + (alpha,)) # Create transparent image
+            self.overlay_cache[key] = ImageTk.PhotoImage(alpha_img) # Convert once and keep
+        return self.overlay_cache[key] # Return cached image
+
+    def draw_transparent_box(self, x, y, w, h, border_color=COLOR_PRIMARY, color=(10, 5, 15), alpha=220): # Define draw box function
+        self.tk_alpha_img = self.get_overlay(w, h, color, alpha) # Get cached panel image
+        coords = (x - w//2, y - h//2, x + w//2, y + h//2) # Border coordinates
         
-        for tid in self.text_ids: # Loop text IDs
-            self.scene_canvas.delete(tid) # Delete text
-        self.text_ids = [] # Clear list
+        if self.box_img_id is None: # First panel
+            self.box_img_id = self.scene_canvas.create_image(x, y, image=self.tk_alpha_img, anchor="center") # Draw box
+        else: # Reuse the existing item
+            self.scene_canvas.itemconfig(self.box_img_id, image=self.tk_alpha_img) # Swap panel image
+            self.scene_canvas.coords(self.box_img_id, x, y) # Move box
         
-        self.scene_canvas.delete("timer_tag") # Delete timer text
+        if self.border_id is None: # First border
+            self.border_id = self.scene_canvas.create_rectangle(*coords, outline=border_color, width=3) # Draw border
+        else: # Reuse the existing item
+            self.scene_canvas.itemconfig(self.border_id, outline=border_color) # Recolor border
+            self.scene_canvas.coords(self.border_id, *coords) # Resize border
+
+    def build_menu_screen(self): # Define menu screen builder
+        texts = {"title": self.scene_canvas.create_text(500, 150, text="MATH QUIZ", font=FONT_TITLE, fill=COLOR_WHITE)} # Create title
+        widgets = [ # Create mode buttons
+            self.create_menu_btn("EASY", 0.45, "easy"), # Create Easy button
+            self.create_menu_btn("MEDIUM", 0.55, "medium"), # Create Medium button
+            self.create_menu_btn("HARD", 0.65, "hard"), # Create Hard button
+            self.create_menu_btn("MARATHON", 0.75, "marathon") # Create Marathon button
+        ]
+        return {"texts": texts, "widgets": widgets} # Return screen
+
+    def build_question_screen(self): # Define question screen builder
+        texts = { # Create canvas texts
+            "mode": self.scene_canvas.create_text(500, 180, text="", font=("Courier", 16, "bold"), fill=COLOR_TURQUOISE), # Mode text
+            "question": self.scene_canvas.create_text(500, 250, text="", font=FONT_QUESTION, fill=COLOR_WHITE), # Question text
+            "progress": self.scene_canvas.create_text(320, 432, text="", font=("Courier", 14, "bold"), fill=COLOR_WHITE) # Progress text
+        }
+
+        self.entry_ans = tk.Entry(self.root, font=("Courier", 20), justify='center', bg="#222", fg=COLOR_TURQUOISE, insertbackground=COLOR_PRIMARY) # Create entry
+        self.entry_ans.bind('<Return>', self.check_answer) # Bind Enter key
+
+        btn_submit = tk.Button(self.root, text="SUBMIT", font=FONT_MAIN, # Create submit button
+                               bg="#0d0212", fg=COLOR_PRIMARY, command=lambda: self.check_answer(None)) # Command
+
+        btn_exit = tk.Button(self.root, text="QUIT", font=("Courier", 12, "bold"), # Create quit button
+                             bg=COLOR_EXIT, fg=COLOR_WHITE, bd=0, 
+                             activebackground="#a3006b", command=self.show_menu) # Command
+
+        widgets = [ # Widgets with their placement
+            (self.entry_ans, {"relx": 0.5, "rely": 0.55, "anchor": "center", "width": 200}), # Entry placement
+            (btn_submit, {"relx": 0.5, "rely": 0.68, "anchor": "center"}), # Submit placement
+            (btn_exit, {"relx": 0.25, "rely": 0.72, "anchor": "center"}) # Quit placement
+        ]
+        return {"texts": texts, "widgets": widgets} # Return screen
+
+    def build_result_screen(self): # Define result screen builder
+        texts = { # Create canvas texts
+            "title": self.scene_canvas.create_text(500, 200, text="SESSION COMPLETE", font=FONT_TITLE, fill=COLOR_TURQUOISE), # Title text
+            "score": self.scene_canvas.create_text(500, 300, text="", font=("Courier", 30, "bold"), fill=COLOR_WHITE, justify="center") # Score text
+        }
+        btn_menu = tk.Button(self.root, text="RETURN TO MENU", font=FONT_MAIN, # Create menu button
+                             bg="#0d0212", fg=COLOR_PRIMARY, command=self.show_menu) # Command
+        widgets = [(btn_menu, {"relx": 0.5, "rely": 0.75, "anchor": "center"})] # Widget with its placement
+        return {"texts": texts, "widgets": widgets} # Return screen
+
+    def show_screen(self, name): # Define screen switch function
+        if self.current_screen == name: return self.screens[name] # Already visible
+        if self.current_screen: # Hide the visible screen
+            old = self.screens[self.current_screen] # Get screen
+            for widget, _ in old["widgets"]: widget.place_forget() # Hide widgets
+            for tid in old["texts"].values(): self.scene_canvas.itemconfig(tid, state="hidden") # Hide texts
+            if self.current_screen == "question": self.root.focus_set() # Hidden entry must not keep Enter
+
+        if name not in self.screens: # First visit
+            builders = {"menu": self.build_menu_screen, "question": self.build_question_screen, "result": self.build_result_screen} # Builder table
+            self.screens[name] = builders[name]() # Build once
+        screen = self.screens[name] # Get screen
+        for widget, options in screen["widgets"]: widget.place(**options) # Show widgets
+        for tid in screen["texts"].values(): self.scene_canvas.itemconfig(tid, state="normal") # Show texts
+        self.current_screen = name # Remember screen
+        return screen # Return screen
+
+    def set_timer_text(self, text): # Define timer text updater
+        if self.timer_text_id is None: # First use
+            self.timer_text_id = self.scene_canvas.create_text(900, 50, text="", fill="red", font=FONT_TITLE) # Create timer text
+        self.scene_canvas.itemconfig(self.timer_text_id, text=text, state="normal" if text else "hidden") # Update or hide
 
     def show_menu(self): # Define show menu function
-        self.clear_ui() # Clear screen
-        self.is_marathon = False # Reset marathon flag
+        self.session = None # Drop current session
         if self.timer_id: self.root.after_cancel(self.timer_id) # Cancel timer
+        self.set_timer_text("") # Hide timer text
         
         self.draw_transparent_box(500, 300, 400, 500, COLOR_PRIMARY) # Draw menu box
-
-        tid = self.scene_canvas.create_text(500, 150, text="MATH QUIZ", font=FONT_TITLE, fill=COLOR_WHITE) # Create title
-        self.text_ids.append(tid) # Store ID
-
-        self.create_menu_btn("EASY", 0.45, "easy") # Create Easy button
-        self.create_menu_btn("MEDIUM", 0.55, "medium") # Create Medium button
-        self.create_menu_btn("HARD", 0.65, "hard") # Create Hard button
-        self.create_menu_btn("MARATHON", 0.75, "marathon") # Create Marathon button
+        self.show_screen("menu") # Show menu widgets
 
     def create_menu_btn(self, text, rely, mode): # Define menu button creator
         btn = tk.Button(self.root, text=text, font=FONT_MAIN, # Create button
                         bg="#0d0212", fg=COLOR_PRIMARY, bd=0, activebackground=COLOR_PRIMARY, # Style
                         command=lambda: self.start_game(mode)) # Command
-        btn.place(relx=0.5, rely=rely, anchor="center") # Place button
-        self.ui_elements.append(btn) # Store widget
+        return (btn, {"relx": 0.5, "rely": rely, "anchor": "center"}) # Return widget and placement
 
     def start_game(self, mode): # Define start game function
-        self.difficulty = mode # Set difficulty
-        self.score = 0 # Reset score
-        self.question_count = 0 # Reset count
-        
-        if mode == "marathon": # Check marathon mode
-            self.is_marathon = True # Set flag
-            self.max_questions = 15 # Set max questions
-            self.marathon_duration = 30 # Set duration
-            self.marathon_start_time = time.time() # Set start time
-            self.update_timer() # Start timer
-        else: # Normal mode
-            self.max_questions = 10 # Set max questions
-            self.is_marathon = False # Set flag
-        
+        if mode not in self.question_pools: self.question_pools[mode] = QuestionPool(mode) # Create pool on first use
+        self.session = QuizSession(mode, self.question_pools[mode]) # Start headless session
+        if self.session.is_marathon: self.update_timer() # Start timer
         self.next_question() # Start first question
 
     def update_timer(self): # Define timer function
-        if not self.is_marathon: return # Return if not marathon
+        if not self.session or not self.session.is_marathon: return # Return if not marathon
         
-        elapsed = time.time() - self.marathon_start_time # Calculate elapsed
-        remaining = int(self.marathon_duration - elapsed) # Calculate remaining
-        
-        self.scene_canvas.delete("timer_tag") # Clear old timer text
+        remaining = self.session.time_left() # Calculate remaining
         if remaining > 0: # Check if time left
-            self.scene_canvas.create_text( # Draw timer text
-                900, 50, text=f"TIME: {remaining}", fill="red", # Settings
-                font=FONT_TITLE, tags="timer_tag" # Tags
-            )
+            self.set_timer_text(f"TIME: {remaining}") # Update timer text
             self.timer_id = self.root.after(1000, self.update_timer) # Schedule next update
         else: # Time over
             self.game_over() # End game
 
-    def generate_math(self): # Define math generator
-        if self.difficulty == "easy": # Easy mode
-            ops = ['+', '-'] # Operations
-            op = random.choice(ops) # Pick operation
-            a, b = random.randint(1, 100), random.randint(1, 100) # Pick numbers
-            if op == '-': a, b = max(a,b), min(a,b) # Ensure positive result
-            return f"{a} {op} {b}", eval(f"{a} {op} {b}") # Return Q and A
-
-        elif self.difficulty == "medium": # Medium mode
-            ops = ['+', '-', '*', '/'] # Operations
-            op = random.choice(ops) # Pick operation
-            if op in ['+', '-']: # + or -
-                a, b = random.randint(50, 500), random.randint(10, 200) # Pick numbers
-            elif op == '*': # Multiply
-                a, b = random.randint(10, 50), random.randint(2, 12) # Pick numbers
-            else: # Divide
-                b = random.randint(2, 20) # Divisor
-                ans = random.randint(2, 50) # Answer
-                a = b * ans # Calculate Dividend
-            expression = f"{a} {op} {b}" # Create string
-            return expression.replace('/', '÷'), int(eval(expression)) # Return formatted
-
-        elif self.difficulty == "hard": # Hard mode
-            ops = ['+', '-', '*', '/', '**'] # Operations
-            op = random.choice(ops) # Pick operation
-            if op == '**': # Power
-                a, b = random.randint(2, 15), random.randint(2, 3) # Pick numbers
-            elif op == '*': # Multiply
-                a, b = random.randint(20, 100), random.randint(10, 50) # Pick numbers
-            elif op == '/': # Divide
-                b = random.randint(5, 50) # Divisor
-                ans = random.randint(10, 100) # Answer
-                a = b * ans # Dividend
-            else: # + or -
-                a, b = random.randint(100, 1000), random.randint(100, 1000) # Pick numbers
-            expression = f"{a} {op} {b}" # Create string
-            display_expr = expression.replace('**', '^').replace('/', '÷') # Format string
-            return display_expr, int(eval(expression)) # Return Q and A
-            
-        return self.generate_math_difficulty("medium") # Fallback to medium
-        
-    def generate_math_difficulty(self, diff): # Define helper
-        temp = self.difficulty # Save current
-        self.difficulty = diff # Switch difficulty
-        q, a = self.generate_math() # Generate
-        self.difficulty = temp # Restore difficulty
-        return q, a # Return result
-
     def next_question(self): # Define next question function
-        if self.question_count >= self.max_questions: # Check limit
+        q_text = self.session.next_question() # Advance session
+        if q_text is None: # Session over
             self.game_over() # End game
             return # Exit
 
-        self.clear_ui() # Clear screen
-        self.question_count += 1 # Increment count
-        self.attempts_on_current = 0 # Reset attempts
-        
-        q_text, ans = self.generate_math() # Generate Q and A
-        self.current_answer = ans # Store answer
-
         self.draw_transparent_box(500, 300, 800, 350, COLOR_PRIMARY) # Draw game box
+        texts = self.show_screen("question")["texts"] # Show retained question screen
 
-        mode_str = f"/// {self.difficulty.upper()} MODE ///" # Create mode string
-        tid_mode = self.scene_canvas.create_text( # Draw mode text
-            500, 180, text=mode_str, font=("Courier", 16, "bold"), fill=COLOR_TURQUOISE
-        )
-        self.text_ids.append(tid_mode) # Store ID
-
-        tid_q = self.scene_canvas.create_text( # Draw question text
-            500, 250, text=f"{q_text} = ?", font=FONT_QUESTION, fill=COLOR_WHITE
-        )
-        self.text_ids.append(tid_q) # Store ID
+        self.scene_canvas.itemconfig(texts["mode"], text=f"/// {self.session.mode.upper()} MODE ///") # Update mode text
+        self.scene_canvas.itemconfig(texts["question"], text=f"{q_text} = ?") # Update question text
+        self.scene_canvas.itemconfig(texts["progress"], text=f"{self.session.question_count}/{self.session.max_questions}") # Update progress text
 
-        self.entry_ans = tk.Entry(self.root, font=("Courier", 20), justify='center', bg="#222", fg=COLOR_TURQUOISE, insertbackground=COLOR_PRIMARY) # Create entry
-        self.entry_ans.place(relx=0.5, rely=0.55, anchor="center", width=200) # Place entry
+        self.entry_ans.delete(0, 'end') # Clear previous answer
         self.entry_ans.focus_set() # Focus entry
-        self.entry_ans.bind('<Return>', self.check_answer) # Bind Enter key
-        self.ui_elements.append(self.entry_ans) # Store widget
-
-        btn_submit = tk.Button(self.root, text="SUBMIT", font=FONT_MAIN, # Create submit button
-                               bg="#0d0212", fg=COLOR_PRIMARY, command=lambda: self.check_answer(None)) # Command
-        btn_submit.place(relx=0.5, rely=0.68, anchor="center") # Place button
-        self.ui_elements.append(btn_submit) # Store widget
-
-        btn_exit = tk.Button(self.root, text="QUIT", font=("Courier", 12, "bold"), # Create quit button
-                             bg=COLOR_EXIT, fg=COLOR_WHITE, bd=0, 
-                             activebackground="#a3006b", command=self.show_menu) # Command
-        btn_exit.place(relx=0.25, rely=0.72, anchor="center") # Place button
-        self.ui_elements.append(btn_exit) # Store widget
-
-        progress_str = f"{self.question_count}/{self.max_questions}" # Create progress string
-        tid_prog = self.scene_canvas.create_text( # Draw progress text
-            320, 432, text=progress_str, font=("Courier", 14, "bold"), fill=COLOR_WHITE
-        )
-        self.text_ids.append(tid_prog) # Store ID
 
     def check_answer(self, event): # Define check answer function
+        if self.current_screen != "question" or not self.session: return # Enter outside a question
+        if self.session.finished or self.session.expired(): return # Time ran out or session over
         user_input = self.entry_ans.get() # Get input
         try: # Try block
             val = int(user_input) # Convert to int
@@ -257,48 +205,25 @@ class MathQuizApp: # Define class
              messagebox.showwarning("System", "Please enter a valid number.") # Show warning
              return # Return
 
-        if val == self.current_answer: # Check correct
-            if self.attempts_on_current == 0: # Check first try
-                points = 10 # 10 points
-            else: # Second try
-                points = 5 # 5 points
-            
-            self.score += points # Add score
+        result, points = self.session.submit(val) # Score the answer
+        if result == CORRECT: # Correct
             messagebox.showinfo("Result", f"CORRECT! [ +{points} POINTS ]") # Show success
             self.next_question() # Next question
-            
-        else: # Incorrect
-            self.attempts_on_current += 1 # Increment attempts
-            
-            if self.attempts_on_current < 2: # Check attempts left
-                messagebox.showwarning("Result", "WRONG. Try Again for 5 points.") # Show warning
-                self.entry_ans.delete(0, 'end') # Clear input
-            else: # No attempts left
-                messagebox.showerror("Result", f"WRONG AGAIN. The answer was {self.current_answer}.") # Show error
-                self.next_question() # Next question
+        elif result == RETRY: # First miss
+            messagebox.showwarning("Result", "WRONG. Try Again for 5 points.") # Show warning
+            self.entry_ans.delete(0, 'end') # Clear input
+        else: # No attempts left
+            messagebox.showerror("Result", f"WRONG AGAIN. The answer was {self.session.answer}.") # Show error
+            self.next_question() # Next question
 
     def game_over(self): # Define game over function
         if self.timer_id: self.root.after_cancel(self.timer_id) # Cancel timer
+        self.set_timer_text("") # Hide timer text
         
-        self.clear_ui() # Clear screen
         self.draw_transparent_box(500, 300, 600, 400, COLOR_TURQUOISE) # Draw result box
-        
-        tid_over = self.scene_canvas.create_text(500, 200, text="SESSION COMPLETE", font=FONT_TITLE, fill=COLOR_TURQUOISE) # Draw title
-        self.text_ids.append(tid_over) # Store ID
-
-        grade = "F" # Default grade
-        if self.score >= 90: grade = "A+" # Check A+
-        elif self.score >= 80: grade = "A" # Check A
-        elif self.score >= 70: grade = "B" # Check B
-        elif self.score >= 60: grade = "C" # Check C
-
-        tid_score = self.scene_canvas.create_text(500, 300, text=f"SCORE: {self.score}\nRANK: {grade}", font=("Courier", 30, "bold"), fill=COLOR_WHITE, justify="center") # Draw score
-        self.text_ids.append(tid_score) # Store ID
+        texts = self.show_screen("result")["texts"] # Show retained result screen
 
-        btn_menu = tk.Button(self.root, text="RETURN TO MENU", font=FONT_MAIN, # Create menu button
-                             bg="#0d0212", fg=COLOR_PRIMARY, command=self.show_menu) # Command
-        btn_menu.place(relx=0.5, rely=0.75, anchor="center") # Place button
-        self.ui_elements.append(btn_menu) # Store widget
+        self.scene_canvas.itemconfig(texts["score"], text=f"SCORE: {self.session.score}\nRANK: {self.session.rank()}") # Update score text
 
 if __name__ == "__main__": # Main entry check
     root = tk.Tk() # Create root window
@@ -0,0 +1,56 @@
+import sys # Import sys module
+import time # Import time module
+import random # Import random module
+from quiz_engine import generate_question, generate_batch # Import question generators
+
+def legacy_generate(difficulty, rng): # Define the old eval-based generate_math for comparison
+    if difficulty == "easy": # Easy mode
+        op = rng.choice(['+', '-']) # Pick operation
+        a, b = rng.randint(1, 100), rng.randint(1, 100) # Pick numbers
+        if op == '-': a, b = max(a,b), min(a,b) # Ensure positive result
+        return f"{a} {op} {b}", eval(f"{a} {op} {b}") # Return Q and A
+    elif difficulty == "hard": # Hard mode
+        op = rng.choice(['+', '-', '*', '/', '**']) # Pick operation
+        if op == '**': a, b = rng.randint(2, 15), rng.randint(2, 3) # Power
+        elif op == '*': a, b = rng.randint(20, 100), rng.randint(10, 50) # Multiply
+        elif op == '/': # Divide
+            b = rng.randint(5, 50) # Divisor
+            a = b * rng.randint(10, 100) # Dividend
+        else: a, b = rng.randint(100, 1000), rng.randint(100, 1000) # + or -
+        expression = f"{a} {op} {b}" # Create string
+        return expression.replace('**', '^').replace('/', '÷'), int(eval(expression)) # Return Q and A
+    op = rng.choice(['+', '-', '*', '/']) # Medium (and fallback) mode
+    if op in ['+', '-']: a, b = rng.randint(50, 500), rng.randint(10, 200) # + or -
+    elif op == '*': a, b = rng.randint(10, 50), rng.randint(2, 12) # Multiply
+    else: # Divide
+        b = rng.randint(2, 20) # Divisor
+        a = b * rng.randint(2, 50) # Dividend
+    expression = f"{a} {op} {b}" # Create string
+    return expression.replace('/', '÷'), int(eval(expression)) # Return formatted
+
+def rate(fn, difficulty, count, seed): # Define throughput measurement
+    rng = random.Random(seed) # Seeded generator
+    start = time.perf_counter() # Start timer
+    for _ in range(count): fn(difficulty, rng) # Generate questions
+    return count / (time.perf_counter() - start) # Questions per second
+
+def main(): # Define benchmark entry
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000 # Questions per run
+    seed = 1234 # Fixed seed so both generators see the same draws
+    print(f"{'mode':<10}{'legacy q/s':>14}{'table q/s':>14}{'speedup':>10}  match") # Header
+    for difficulty in ("easy", "medium", "hard", "marathon"): # Each mode (marathon falls back to medium)
+        old_rng, new_rng = random.Random(seed), random.Random(seed) # Twin generators
+        match = all(legacy_generate(difficulty, old_rng) == generate_question(difficulty, new_rng) for _ in range(count)) # Same text and answer
+        old = rate(legacy_generate, difficulty, count, seed) # Old speed
+        new = rate(generate_question, difficulty, count, seed) # New speed
+        print(f"{difficulty:<10}{old:>14,.0f}{new:>14,.0f}{new / old:>9.1f}x  {'yes' if match else 'NO'}") # Report row
+
+    batch = 10000000 # Batch size for the numpy generator
+    print(f"\n{'mode':<10}{'batch q/s':>16}  ({batch:,} per batch, seed {seed})") # Header
+    for difficulty in ("easy", "medium", "hard"): # Each mode
+        start = time.perf_counter() # Start timer
+        generate_batch(difficulty, batch, seed) # Generate batch
+        print(f"{difficulty:<10}{batch / (time.perf_counter() - start):>16,.0f}") # Report row
+
+if __name__ == "__main__": # Main entry check
+    main() # Run benchmark
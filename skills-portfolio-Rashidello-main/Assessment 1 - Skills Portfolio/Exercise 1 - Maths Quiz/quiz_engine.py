@@ -0,0 +1,155 @@
+import random # Import random module
+import operator # Import operator module
+import time # Import time module
+import numpy as np # Import numpy library
+
+def divide(a, b): # Define division with int() truncation
+    return int(a / b) # Same result as int(eval("a / b"))
+
+OPERATORS = {"+": operator.add, "-": operator.sub, "*": operator.mul, "/": divide, "**": operator.pow} # Operator functions
+SYMBOLS = {"/": "÷", "**": "^"} # Display symbols that differ from Python
+
+QUESTION_TABLE = { # Difficulty -> list of (operator, first range, second range)
+    "easy": [ # Easy mode
+        ("+", (1, 100), (1, 100)), # Addition
+        ("-", (1, 100), (1, 100)) # Subtraction
+    ],
+    "medium": [ # Medium mode
+        ("+", (50, 500), (10, 200)), # Addition
+        ("-", (50, 500), (10, 200)), # Subtraction
+        ("*", (10, 50), (2, 12)), # Multiply
+        ("/", (2, 20), (2, 50)) # Divide: divisor range, answer range
+    ],
+    "hard": [ # Hard mode
+        ("+", (100, 1000), (100, 1000)), # Addition
+        ("-", (100, 1000), (100, 1000)), # Subtraction
+        ("*", (20, 100), (10, 50)), # Multiply
+        ("/", (5, 50), (10, 100)), # Divide: divisor range, answer range
+        ("**", (2, 15), (2, 3)) # Power
+    ]
+}
+ORDERED_SUBTRACTION = {"easy"} # Modes where a - b is never negative
+
+def generate_question(difficulty, rng=random): # Define pure question generator
+    rules = QUESTION_TABLE.get(difficulty, QUESTION_TABLE["medium"]) # Unknown modes use medium
+    op, first, second = rng.choice(rules) # Pick operation
+    if op == "/": # Divide
+        b = rng.randint(*first) # Divisor
+        a = b * rng.randint(*second) # Dividend from the answer
+    else: # Other operations
+        a, b = rng.randint(*first), rng.randint(*second) # Pick numbers
+        if op == "-" and difficulty in ORDERED_SUBTRACTION: a, b = max(a, b), min(a, b) # Ensure positive result
+    return f"{a} {SYMBOLS.get(op, op)} {b}", OPERATORS[op](a, b) # Return Q and A
+
+OP_CODES = ("+", "-", "*", "/", "**") # Operator code -> operator used in batch arrays
+
+def generate_batch(difficulty, n, seed=None): # Define vectorized question generator
+    rng = np.random.default_rng(seed) # Reproducible generator
+    rules = QUESTION_TABLE.get(difficulty, QUESTION_TABLE["medium"]) # Unknown modes use medium
+    pick = rng.integers(0, len(rules), n, dtype=np.int8) # Rule index per question
+    a = np.empty(n, dtype=np.int64) # First operands
+    b = np.empty(n, dtype=np.int64) # Second operands
+    op = np.empty(n, dtype=np.int8) # Operator codes
+    answer = np.empty(n, dtype=np.int64) # Answers
+
+    for k, (sym, first, second) in enumerate(rules): # Fill each rule's rows at once
+        rows = np.flatnonzero(pick == k) # Rows using this rule
+        m = len(rows) # Row count
+        x = rng.integers(first[0], first[1] + 1, m) # First draw
+        y = rng.integers(second[0], second[1] + 1, m) # Second draw
+        if sym == "/": # Divide: x is the divisor, y the answer
+            a[rows], b[rows], answer[rows] = x * y, x, y # Exact division
+        else: # Other operations
+            if sym == "-" and difficulty in ORDERED_SUBTRACTION: x, y = np.maximum(x, y), np.minimum(x, y) # Ensure positive result
+            a[rows], b[rows] = x, y # Store operands
+            answer[rows] = OPERATORS[sym](x, y) # Vectorized answer
+        op[rows] = OP_CODES.index(sym) # Store operator code
+    return a, b, op, answer # Return columns
+
+def format_question(a, b, op_code): # Define display text for one batch row
+    sym = OP_CODES[op_code] # Operator
+    return f"{a} {SYMBOLS.get(sym, sym)} {b}" # Same text as generate_question
+
+class QuestionPool: # Define pre-generated question pool
+    def __init__(self, difficulty, size=10000, seed=None): # Initialize pool
+        self.difficulty = difficulty # Difficulty
+        self.size = size # Questions per refill
+        self.seed_seq = np.random.SeedSequence(seed) # Reproducible refill seeds
+        self.position = size # Force a refill on first draw
+        self.columns = None # Current batch
+
+    def refill(self): # Define refill function
+        seed = self.seed_seq.spawn(1)[0] # Next child seed
+        self.columns = generate_batch(self.difficulty, self.size, seed) # Generate a batch
+        self.position = 0 # Rewind
+
+    def draw(self, count): # Define session draw
+        questions = [] # Drawn questions
+        while len(questions) < count: # Until enough
+            if self.position >= self.size: self.refill() # Batch used up
+            a, b, op, answer = self.columns # Unpack columns
+            i = self.position # Current row
+            questions.append((format_question(int(a[i]), int(b[i]), int(op[i])), int(answer[i]))) # Text and answer
+            self.position += 1 # Advance
+        return questions # Return session questions
+
+CORRECT = "correct" # Answer accepted
+RETRY = "retry" # Wrong, one more attempt allowed
+WRONG = "wrong" # Wrong twice, question lost
+MAX_ATTEMPTS = 2 # Attempts per question
+MARATHON_QUESTIONS = 15 # Questions in marathon mode
+MARATHON_SECONDS = 30 # Marathon time limit
+SESSION_QUESTIONS = 10 # Questions in normal modes
+
+def rank_for(score): # Define rank calculation
+    if score >= 90: return "A+" # Check A+
+    elif score >= 80: return "A" # Check A
+    elif score >= 70: return "B" # Check B
+    elif score >= 60: return "C" # Check C
+    return "F" # Default grade
+
+class QuizSession: # Define headless quiz session
+    def __init__(self, mode, pool=None, clock=time.monotonic): # Initialize session
+        self.mode = mode # Difficulty or marathon
+        self.is_marathon = mode == "marathon" # Marathon flag
+        self.max_questions = MARATHON_QUESTIONS if self.is_marathon else SESSION_QUESTIONS # Question limit
+        self.duration = MARATHON_SECONDS if self.is_marathon else None # Time limit
+        self.clock = clock # Time source (injectable for simulations)
+        self.start_time = clock() # Session start
+
+        self.questions = pool.draw(self.max_questions) if pool else [generate_question(mode) for _ in range(self.max_questions)] # Whole session up front
+        self.score = 0 # Points
+        self.question_count = 0 # Questions shown
+        self.attempts = 0 # Wrong attempts on the current question
+        self.question = None # Current question text
+        self.answer = None # Current answer
+        self.finished = False # Session over
+
+    def next_question(self): # Define advance function
+        if self.finished or self.question_count >= self.max_questions or self.expired(): # Nothing left
+            self.finished = True # End session
+            return None # No question
+        self.question, self.answer = self.questions[self.question_count] # Take next question
+        self.question_count += 1 # Increment count
+        self.attempts = 0 # Reset attempts
+        return self.question # Return text
+
+    def submit(self, value): # Define answer check
+        if self.finished: raise RuntimeError("Session is over") # Guard
+        if value == self.answer: # Check correct
+            points = 10 if self.attempts == 0 else 5 # 10 first try, 5 second
+            self.score += points # Add score
+            return CORRECT, points # Result
+        self.attempts += 1 # Count wrong attempt
+        if self.attempts < MAX_ATTEMPTS: return RETRY, 0 # One more try
+        return WRONG, 0 # Out of attempts
+
+    def time_left(self): # Define marathon countdown
+        if not self.is_marathon: return None # No limit
+        return int(self.duration - (self.clock() - self.start_time)) # Whole seconds left
+
+    def expired(self): # Define time-out check
+        return self.is_marathon and self.time_left() <= 0 # Out of time
+
+    def rank(self): # Define rank function
+        return rank_for(self.score) # Grade for this score
@@ -0,0 +1,59 @@
+import sys # Import sys module
+import time # Import time module
+import os # Import os module
+import random # Import random module
+from quiz_engine import QuizSession, QuestionPool, RETRY # Import headless quiz engine
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "shared")) # Modules shared by the exercises
+from bench_stats import percentile # Import percentile helper
+
+class FakeClock: # Define simulated clock for marathon time limits
+    def __init__(self): # Initialize clock
+        self.now = 0.0 # Simulated seconds
+
+    def __call__(self): # Define clock read
+        return self.now # Current simulated time
+
+def scripted_answer(answer, attempt, rng): # Define simulated player
+    roll = rng.random() # Player skill roll
+    if attempt == 0 and roll < 0.7: return answer # Right first time
+    if attempt == 1 and roll < 0.5: return answer # Right on the retry
+    return answer + 1 # Wrong
+
+def run_session(mode, pool, rng, clock, timings): # Define one simulated session
+    session = QuizSession(mode, pool, clock) # Start session
+    while True: # Loop questions
+        t0 = time.perf_counter() # Start timer
+        question = session.next_question() # Advance
+        timings["next_question"].append(time.perf_counter() - t0) # Record latency
+        if question is None: break # Session over
+        attempt = 0 # Attempts on this question
+        while True: # Loop attempts
+            clock.now += rng.uniform(0.5, 3.0) # Thinking time
+            value = scripted_answer(session.answer, attempt, rng) # Player answer
+            t0 = time.perf_counter() # Start timer
+            result, _ = session.submit(value) # Check answer
+            timings["submit"].append(time.perf_counter() - t0) # Record latency
+            if result != RETRY: break # Move on after correct or second miss
+            attempt += 1 # Retry
+    return session # Return finished session
+
+def main(): # Define load driver entry
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 20000 # Sessions per mode
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 7 # Seed for reproducible runs
+    print(f"{'mode':<10}{'sessions/s':>12}{'avg score':>11}{'next p50/p99 us':>18}{'submit p50/p99 us':>20}") # Header
+    for mode in ("easy", "medium", "hard", "marathon"): # Each mode
+        rng = random.Random(seed) # Player randomness
+        pool = QuestionPool(mode, seed=seed) # Shared question pool
+        timings = {"next_question": [], "submit": []} # Latency samples
+        total_score = 0 # Score sum
+        start = time.perf_counter() # Start timer
+        for _ in range(sessions): # Loop sessions
+            total_score += run_session(mode, pool, rng, FakeClock(), timings).score # Run and keep score
+        elapsed = time.perf_counter() - start # Wall time
+        nq = [t * 1e6 for t in timings["next_question"]] # Microseconds
+        sb = [t * 1e6 for t in timings["submit"]] # Microseconds
+        print(f"{mode:<10}{sessions / elapsed:>12,.0f}{total_score / sessions:>11.1f}" # Throughput and score
+              f"{percentile(nq, 50):>9.2f}/{percentile(nq, 99):<8.2f}{percentile(sb, 50):>11.2f}/{percentile(sb, 99):<8.2f}") # Latency
+
+if __name__ == "__main__": # Main entry check
+    main() # Run driver
@@ -0,0 +1,137 @@
+import asyncio # Import asyncio module
+import argparse # Import argparse module
+import json # Import json module
+import itertools # Import itertools module
+from quiz_engine import QuizSession, QuestionPool, RETRY, WRONG, MARATHON_SECONDS # Import headless quiz engine
+
+def whole_number(value): # Define strict answer parsing
+    if isinstance(value, bool): raise ValueError("Answer must be a whole number") # JSON true/false
+    if isinstance(value, float): # JSON number with a fraction part
+        if not value.is_integer(): raise ValueError("Answer must be a whole number") # 12.9 is not 12
+        return int(value) # 12.0 is 12
+    if isinstance(value, str): value = value.strip() # Answers typed as text
+    return int(value) # Raises ValueError or TypeError for anything else
+
+class QuizServer: # Define multi-session quiz server
+    def __init__(self, seed=None): # Initialize server
+        self.seed = seed # Seed for question pools
+        self.pools = {} # Question pool per mode
+        self.sessions = {} # Session ID -> session
+        self.writers = {} # Session ID -> owning connection
+        self.owned = {} # Connection -> IDs of its running sessions
+        self.timers = {} # Session ID -> marathon deadline handle
+        self.ids = itertools.count(1) # Session ID source
+        self.loop = None # Event loop (set when serving)
+
+    def pool(self, mode): # Define pool lookup
+        if mode not in self.pools: self.pools[mode] = QuestionPool(mode, seed=self.seed) # Create on first use
+        return self.pools[mode] # Return pool
+
+    def send(self, writer, message): # Define line writer
+        if not writer.is_closing(): writer.write((json.dumps(message) + "\n").encode()) # One JSON object per line
+
+    def start(self, mode, writer): # Define session start
+        if mode not in ("easy", "medium", "hard", "marathon"): raise ValueError(f"Unknown mode: {mode}") # Validate mode
+        sid = next(self.ids) # New ID
+        session = QuizSession(mode, self.pool(mode), self.loop.time) # Session on the loop clock
+        self.sessions[sid] = session # Store session
+        self.writers[sid] = writer # Remember connection
+        self.owned[writer].add(sid) # Connection owns it
+        if session.is_marathon: # Marathon deadline
+            self.timers[sid] = self.loop.call_at(session.start_time + MARATHON_SECONDS, self.expire, sid) # One timer, no polling
+        question = session.next_question() # First question
+        return {"ok": True, "session": sid, "question": question, "number": session.question_count, # Reply
+                "of": session.max_questions, "time_left": session.time_left()} # Session shape
+
+    def owned_session(self, sid, writer): # Define session lookup for one connection
+        session = self.sessions.get(sid) # Find session
+        if session is None or self.writers.get(sid) is not writer: raise KeyError(f"No session {sid}") # Unknown, finished or someone else's
+        return session # Return session
+
+    def answer(self, sid, value, writer): # Define answer handling
+        session = self.owned_session(sid, writer) # Only the owning connection may answer
+        result, points = session.submit(whole_number(value)) # Score answer
+        reply = {"ok": True, "session": sid, "result": result, "points": points, "score": session.score} # Base reply
+        if result == WRONG: reply["answer"] = session.answer # Reveal answer
+        if result == RETRY: # Same question again
+            reply["question"] = session.question # Repeat text
+        else: # Move on
+            reply["question"] = session.next_question() # Next question or None
+        reply["number"] = session.question_count # Progress
+        reply["time_left"] = session.time_left() # Marathon countdown
+        if reply["question"] is None: reply.update(self.finish(sid)) # Session over
+        return reply # Return reply
+
+    def finish(self, sid): # Define session end
+        session = self.sessions.pop(sid) # Remove session
+        writer = self.writers.pop(sid, None) # Forget connection
+        if writer in self.owned: self.owned[writer].discard(sid) # Release ownership
+        timer = self.timers.pop(sid, None) # Marathon deadline
+        if timer: timer.cancel() # No longer needed
+        return {"finished": True, "score": session.score, "rank": session.rank()} # Final result
+
+    def expire(self, sid): # Define marathon deadline callback
+        self.timers.pop(sid, None) # Timer fired
+        writer = self.writers.get(sid) # Owning connection
+        if sid in self.sessions: # Still running
+            result = self.finish(sid) # End it
+            if writer: self.send(writer, {"event": "timeout", "session": sid, **result}) # Tell the client
+
+    def dispatch(self, msg, writer): # Define request router
+        op = msg.get("op") # Operation
+        if op == "start": return self.start(msg.get("mode", "medium"), writer) # New session
+        if op == "answer": return self.answer(msg["session"], msg["value"], writer) # Submit answer
+        if op == "end": # Leave early
+            self.owned_session(msg["session"], writer) # Only the owning connection may end it
+            return {"ok": True, "session": msg["session"], **self.finish(msg["session"])} # Final result
+        raise ValueError(f"Unknown op: {op}") # Bad request
+
+    async def handle(self, reader, writer): # Define connection handler
+        self.owned[writer] = set() # Sessions started on this connection
+        try: # Try block
+            while True: # Loop requests
+                line = await reader.readline() # Read one request
+                if not line: break # Client closed
+                msg = {} # Parsed request
+                try: # Try block
+                    msg = json.loads(line) # Parse JSON
+                    reply = self.dispatch(msg, writer) # Handle request
+                except (ValueError, KeyError, TypeError, AttributeError, RuntimeError) as e: # Bad request
+                    reply = {"ok": False, "error": str(e)} # Error reply
+                if isinstance(msg, dict) and "id" in msg: reply["id"] = msg["id"] # Echo request ID
+                self.send(writer, reply) # Send reply
+                if writer.transport.get_write_buffer_size() > 65536: await writer.drain() # Only wait when the buffer is large
+        except ConnectionError: # Client vanished
+            pass # Clean up below
+        finally: # Always
+            for sid in list(self.owned.pop(writer)): # Abandoned sessions
+                self.finish(sid) # Release them
+            writer.close() # Close socket
+
+async def serve(host, port, unix_path=None, seed=None): # Define server runner
+    server = QuizServer(seed) # Create server
+    server.loop = asyncio.get_running_loop() # Bind loop clock
+    if unix_path: # Unix socket
+        srv = await asyncio.start_unix_server(server.handle, path=unix_path) # Listen on socket file
+        print(f"listening on unix:{unix_path}", flush=True) # Report address
+    else: # TCP
+        srv = await asyncio.start_server(server.handle, host, port, limit=65536) # Listen on TCP
+        addr = srv.sockets[0].getsockname() # Bound address
+        print(f"listening on {addr[0]}:{addr[1]}", flush=True) # Report address
+    async with srv: # Keep serving
+        await srv.serve_forever() # Run until cancelled
+
+def main(): # Define CLI entry
+    parser = argparse.ArgumentParser(description="Line-delimited JSON math quiz server") # Create parser
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host (default 127.0.0.1)") # Host option
+    parser.add_argument("--port", type=int, default=8765, help="TCP port, 0 picks a free one (default 8765)") # Port option
+    parser.add_argument("--unix", help="serve on this Unix socket path instead of TCP") # Unix socket option
+    parser.add_argument("--seed", type=int, help="seed for reproducible question pools") # Seed option
+    args = parser.parse_args() # Parse arguments
+    try: # Try block
+        asyncio.run(serve(args.host, args.port, args.unix, args.seed)) # Run server
+    except KeyboardInterrupt: # Ctrl+C
+        pass # Exit quietly
+
+if __name__ == "__main__": # Main entry check
+    main() # Run server
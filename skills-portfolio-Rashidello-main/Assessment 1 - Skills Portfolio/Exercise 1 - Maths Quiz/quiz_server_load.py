@@ -0,0 +1,106 @@
+import sys # Import sys module
+import os # Import os module
+import time # Import time module
+import json # Import json module
+import random # Import random module
+import asyncio # Import asyncio module
+import argparse # Import argparse module
+import itertools # Import itertools module
+from quiz_engine import OPERATORS, SYMBOLS # Import operator tables
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "shared")) # Modules shared by the exercises
+from bench_stats import percentile # Import percentile helper
+
+PARSE_SYMBOLS = {v: k for k, v in SYMBOLS.items()} # Display symbol -> operator
+
+def solve(question): # Define answer lookup for the simulated player
+    a, sym, b = question.split() # "a op b"
+    return OPERATORS[PARSE_SYMBOLS.get(sym, sym)](int(a), int(b)) # Compute answer
+
+class Connection: # Define multiplexed client connection
+    def __init__(self, reader, writer): # Initialize connection
+        self.reader = reader # Stream reader
+        self.writer = writer # Stream writer
+        self.pending = {} # Request ID -> future
+        self.ids = itertools.count(1) # Request ID source
+        self.timeouts = 0 # Marathon timeout events seen
+        self.task = asyncio.create_task(self.read_loop()) # Start reader
+
+    async def read_loop(self): # Define reply dispatcher
+        while True: # Loop replies
+            line = await self.reader.readline() # Read one reply
+            if not line: break # Server closed
+            msg = json.loads(line) # Parse reply
+            if msg.get("event") == "timeout": # Server-pushed marathon expiry
+                self.timeouts += 1 # Count it
+                continue # No request waits for it
+            future = self.pending.pop(msg.get("id"), None) # Request this reply answers
+            if future and not future.done(): future.set_result(msg) # Wake the waiting request
+            else: print(f"stray reply ignored: {line.decode(errors='replace').strip()}", file=sys.stderr) # Unknown, missing or repeated ID
+
+    async def request(self, msg): # Define request/reply call
+        rid = next(self.ids) # New request ID
+        future = asyncio.get_running_loop().create_future() # Reply slot
+        self.pending[rid] = future # Register
+        self.writer.write((json.dumps({**msg, "id": rid}) + "\n").encode()) # Send request
+        return await future # Wait for reply
+
+async def run_session(conn, reply, rng, latencies, think): # Define one simulated player
+    sid, question, attempt = reply["session"], reply["question"], 0 # Session state
+    while question is not None: # Loop questions
+        if think: await asyncio.sleep(rng.uniform(0, think)) # Thinking time
+        answer = solve(question) # Correct answer
+        value = answer if rng.random() < (0.7 if attempt == 0 else 0.5) else answer + 1 # Scripted right or wrong
+        t0 = time.perf_counter() # Start timer
+        reply = await conn.request({"op": "answer", "session": sid, "value": value}) # Submit answer
+        latencies.append((time.perf_counter() - t0) * 1000) # Record latency
+        if not reply.get("ok"): return None # Session timed out or errored
+        attempt = attempt + 1 if reply["result"] == "retry" else 0 # Track attempts
+        question = None if reply.get("finished") else reply["question"] # Next question
+    return reply.get("score") # Final score
+
+async def spawn_server(): # Define local server launcher
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "quiz_server.py") # Server script
+    proc = await asyncio.create_subprocess_exec(sys.executable, script, "--port", "0", stdout=asyncio.subprocess.PIPE) # Start on a free port
+    line = (await proc.stdout.readline()).decode().split()[-1] # "listening on host:port"
+    host, port = line.rsplit(":", 1) # Split address
+    return proc, host, int(port) # Return process and address
+
+async def main_async(args): # Define load test
+    proc = None # Spawned server
+    if args.connect: # Use a running server
+        host, port = args.connect.rsplit(":", 1) # Split address
+    else: # Start our own
+        proc, host, port = await spawn_server() # Spawn server
+    rng = random.Random(args.seed) # Player randomness
+    conns = [Connection(*await asyncio.open_connection(host, int(port), limit=65536)) for _ in range(args.connections)] # Open connections
+    modes = ["easy", "medium", "hard", "marathon"] if args.mode == "mixed" else [args.mode] # Modes to play
+    latencies = [] # Answer latencies (ms)
+    players = [conns[i % len(conns)] for i in range(args.sessions)] # Connection per player
+    opened = await asyncio.gather(*(c.request({"op": "start", "mode": modes[i % len(modes)]}) for i, c in enumerate(players))) # Open every session first
+    t0 = time.perf_counter() # Start timer
+    scores = await asyncio.gather(*(run_session(c, r, rng, latencies, args.think) for c, r in zip(players, opened))) # Play them all at once
+    elapsed = time.perf_counter() - t0 # Wall time
+
+    done = [s for s in scores if s is not None] # Completed sessions
+    print(f"{args.sessions} concurrent sessions over {args.connections} connections ({args.mode})") # Setup
+    print(f"completed {len(done)} in {elapsed:.2f}s -> {len(done) / elapsed:,.0f} sessions/s, {len(latencies) / elapsed:,.0f} answers/s") # Throughput
+    print(f"answer latency p50={percentile(latencies, 50):.2f} ms p99={percentile(latencies, 99):.2f} ms max={max(latencies):.2f} ms") # Latency
+    print(f"marathon timeouts: {sum(c.timeouts for c in conns)}") # Expiries
+
+    for c in conns: c.writer.close() # Close connections
+    if proc: # Spawned server
+        proc.terminate() # Stop it
+        await proc.wait() # Reap it
+
+def main(): # Define CLI entry
+    parser = argparse.ArgumentParser(description="Load generator for quiz_server.py") # Create parser
+    parser.add_argument("--sessions", type=int, default=10000, help="concurrent sessions (default 10000)") # Session count
+    parser.add_argument("--connections", type=int, default=100, help="TCP connections to spread them over (default 100)") # Connection count
+    parser.add_argument("--mode", default="mixed", help="easy, medium, hard, marathon or mixed (default)") # Mode
+    parser.add_argument("--think", type=float, default=0.0, help="max random think time per answer in seconds") # Think time
+    parser.add_argument("--connect", help="host:port of a running server (default: spawn one)") # Server address
+    parser.add_argument("--seed", type=int, default=7, help="seed for scripted answers") # Seed
+    asyncio.run(main_async(parser.parse_args())) # Run load test
+
+if __name__ == "__main__": # Main entry check
+    main() # Run load generator
@@ -0,0 +1,43 @@
+import sys # Import sys module
+import os # Import os module
+import time # Import time module
+import importlib.util # Import module loader
+import tkinter as tk # Import tkinter library
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "shared")) # Modules shared by the exercises
+from bench_stats import percentile # Import percentile helper
+
+def load_app(path): # Define module loader
+    spec = importlib.util.spec_from_file_location("mathquiz_under_test", path) # Load by path so old versions can be compared
+    module = importlib.util.module_from_spec(spec) # Create module
+    spec.loader.exec_module(module) # Run module
+    module.MathQuizApp.init_video_background = lambda self: None # Measure the UI only
+    return module.MathQuizApp # Return app class
+
+def main(): # Define benchmark entry
+    base_folder = os.path.dirname(os.path.abspath(__file__)) # Get base folder
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(base_folder, "mathquiz.py") # App file to test
+    sessions = int(sys.argv[2]) if len(sys.argv) > 2 else 100 # Sessions to run
+
+    root = tk.Tk() # Create root window
+    app = load_app(path)(root) # Create app
+    root.update() # Draw first screen
+
+    samples = [] # Transition times (ms)
+    for n in range(sessions): # Loop sessions
+        app.start_game("medium") # Start session (shows question 1)
+        for _ in range(app.session.max_questions - 1): # Loop remaining questions
+            t0 = time.perf_counter() # Start timer
+            app.next_question() # Transition to next question
+            root.update_idletasks() # Include geometry and redraw work
+            samples.append((time.perf_counter() - t0) * 1000) # Record time
+        app.game_over() # Finish session
+        app.show_menu() # Back to menu
+        root.update_idletasks() # Flush work
+        if n in (0, sessions - 1): # First and last session
+            print(f"after session {n + 1}: widgets={len(root.winfo_children())} canvas_items={len(app.scene_canvas.find_all())}") # Widget count
+
+    print(f"{len(samples)} transitions: p50={percentile(samples, 50):.3f} ms p99={percentile(samples, 99):.3f} ms max={max(samples):.3f} ms") # Latency summary
+    root.destroy() # Close window
+
+if __name__ == "__main__": # Main entry check
+    main() # Run benchmark
@@ -0,0 +1,63 @@
+import sys # Import sys module
+import os # Import os module
+import time # Import time module
+import tkinter as tk # Import tkinter library
+import imageio # Import imageio library
+from PIL import Image, ImageTk # Import PIL library
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "shared")) # Modules shared by the exercises
+from video_stream import to_image # Import frame conversion
+
+SIZE = (1000, 600) # Display size used by the apps
+
+def bench_legacy(video_path, frames, tk_ok): # Define old stream_video path
+    reader = imageio.get_reader(video_path) # Native-size reader
+    decode = convert = blit = 0.0 # Stage timers
+    for _ in range(frames): # Loop frames
+        t0 = time.perf_counter() # Start timer
+        frame_data = reader.get_next_data() # Full-resolution decode
+        t1 = time.perf_counter() # Decode done
+        img = Image.fromarray(frame_data).resize(SIZE) # Convert and resample
+        t2 = time.perf_counter() # Convert done
+        if tk_ok: ImageTk.PhotoImage(img) # New Tk image per frame
+        t3 = time.perf_counter() # Blit done
+        decode += t1 - t0; convert += t2 - t1; blit += t3 - t2 # Add stage times
+    reader.close() # Close reader
+    return decode, convert, blit # Return totals
+
+def bench_scaled(video_path, frames, tk_ok): # Define decoder-scaled path
+    reader = imageio.get_reader(video_path, "ffmpeg", size=SIZE, pixelformat="rgb24") # ffmpeg scales for us
+    photo = ImageTk.PhotoImage("RGB", SIZE) if tk_ok else None # One reused Tk image
+    decode = convert = blit = 0.0 # Stage timers
+    for _ in range(frames): # Loop frames
+        t0 = time.perf_counter() # Start timer
+        frame_data = reader.get_next_data() # Display-size decode
+        t1 = time.perf_counter() # Decode done
+        img = to_image(frame_data, SIZE) # Zero-copy wrap
+        t2 = time.perf_counter() # Convert done
+        if tk_ok: photo.paste(img) # Blit into existing image
+        t3 = time.perf_counter() # Blit done
+        decode += t1 - t0; convert += t2 - t1; blit += t3 - t2 # Add stage times
+    reader.close() # Close reader
+    return decode, convert, blit # Return totals
+
+def main(): # Define benchmark entry
+    base_folder = os.path.dirname(os.path.abspath(__file__)) # Get base folder
+    video_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(base_folder, "assets", "hld_mainmenu.mp4") # Video to test
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 60 # Frames per run
+
+    try: # Try block
+        root = tk.Tk() # Tk is needed for PhotoImage
+        root.withdraw() # Keep window hidden
+        tk_ok = True # Tk stage measured
+    except tk.TclError: # No display
+        tk_ok = False # Skip Tk stage
+        print("No display: Tk blit stage skipped") # Report
+
+    print(f"{'path':<8}{'decode':>10}{'convert':>10}{'blit':>10}{'total':>10}  (ms/frame, {frames} frames)") # Header
+    for name, fn in (("legacy", bench_legacy), ("scaled", bench_scaled)): # Each path
+        decode, convert, blit = fn(video_path, frames, tk_ok) # Run path
+        total = decode + convert + blit # Sum stages
+        print(f"{name:<8}{decode/frames*1000:>10.2f}{convert/frames*1000:>10.2f}{blit/frames*1000:>10.2f}{total/frames*1000:>10.2f}") # Report row
+
+if __name__ == "__main__": # Main entry check
+    main() # Run benchmark
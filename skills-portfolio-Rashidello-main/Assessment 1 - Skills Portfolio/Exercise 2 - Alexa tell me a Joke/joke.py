@@ -1,8 +1,10 @@
 import tkinter as tk # Import tkinter library
 import random # Import random library
 import os # Import os library
-import imageio # Import imageio library
 from PIL import Image, ImageTk # Import PIL library
+import sys # Import sys module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "shared")) # Modules shared by the exercises
+from video_stream import VideoBackground # Import background video player
 
 COLOR_BG = "#000000" # Background color
 COLOR_PRIMARY = "#D6008D" # Primary neon pink color
@@ -48,18 +50,18 @@ class JokeApp: # Define main app class
         self.scene_canvas = tk.Canvas(root, bg="black", highlightthickness=0) # Create background canvas
         self.scene_canvas.place(relx=0, rely=0, relwidth=1, relheight=1) # Place canvas
 
-        self.video_reader = None # Initialize video reader
+        self.video = None # Initialize video player
         self.bg_item_id = None # Initialize bg item id
+        self.root.bind("<F3>", self.print_video_stats) # Bind video stats key
         
         try: # Try block for video loading
             base_folder = os.path.dirname(os.path.abspath(__file__)) # Get base folder
             video_path = os.path.join(base_folder, "assets", "hld.mp4") # Build video path
             
-            self.video_reader = imageio.get_reader(video_path) # Create video reader
+            self.video = VideoBackground(self.root, self.scene_canvas, video_path, (self.win_width, self.win_height), cache="palette", disk_cache=True) # Create player with loop and disk caches
+            self.bg_item_id = self.video.item_id # Store bg item id
             
-            self.bg_item_id = self.scene_canvas.create_image(0, 0, anchor="nw") # Create placeholder image
-            
-            self.stream_video() # Start video stream
+            self.video.start() # Start video stream
             
         except Exception: # Catch errors
             self.scene_canvas.create_text( # Create error text
@@ -91,21 +93,8 @@ class JokeApp: # Define main app class
         self.btn_next = TextButton(self.button_frame, text="NEXT", command=self.next_joke) # Create Next button
         self.btn_next.pack(side="left", expand=True, fill="x") # Pack Next button
 
-    def stream_video(self): # Define video stream function
-        try: # Try block
-            frame_data = self.video_reader.get_next_data() # Get next frame
-            img = Image.fromarray(frame_data) # Convert to PIL image
-            img = img.resize((self.win_width, self.win_height)) # Resize image
-            self.current_frame_img = ImageTk.PhotoImage(img) # Convert to Tkinter image
-            self.scene_canvas.itemconfig(self.bg_item_id, image=self.current_frame_img) # Update canvas image
-            self.root.after(33, self.stream_video) # Schedule next frame
-            
-        except IndexError: # Handle end of video
-            self.video_reader.set_image_index(0) # Reset video
-            self.stream_video() # Restart stream
-            
-        except Exception: # Catch other errors
-            pass # Ignore
+    def print_video_stats(self, event=None): # Define stats printer
+        if self.video: print(f"Video: {self.video.stats()}") # Print queue depth and drops
 
     def load_jokes(self): # Define load jokes function
         try: # Try block
@@ -1,16 +1,34 @@
 import tkinter as tk # Import tkinter library
-from tkinter import messagebox, simpledialog # Import specific modules
+from tkinter import messagebox, simpledialog, filedialog # Import specific modules
 import os # Import os module
+import argparse # Import argparse module
+import queue # Import queue module
+import threading # Import threading module
 from PIL import Image, ImageTk # Import PIL library
+from student_store import StudentStore, GRADES, grade_code, parse_record # Import columnar student store
+from student_journal import ChangeJournal, COMPACT_EVERY # Import change journal
+from student_files import data_path, save_snapshot, load_file # Import file persistence
+from report_view import VirtualReport # Import virtual scrolling view
+from student_sqlite import SqliteStore, db_path # Import SQLite student store
+from student_bulk import import_csv, export_csv, format_import, format_export, format_progress # Import bulk CSV pipeline
 
 COLOR_BG = "#000000" # Background color
 COLOR_PRIMARY = "#D6008D" # Primary neon pink color
 COLOR_TURQUOISE = "#00f2ff" # Turquoise color
 COLOR_WHITE = "#ffffff" # White color
 
+REPORT_HEADER = ("--- CLASS REPORT ---", "") # Lines above the students
+STUDENT_LINES = 4 # Lines per student in format_student
+SEARCH_DELAY_MS = 150 # Typing pause before a name search runs
+STORAGES = ("memory", "sqlite") # studentMarks.txt + change journal, or studentMarks.db
+STORAGE = os.environ.get("STUDENT_STORAGE", "memory") # Default backend, overridden by --storage
+PROGRESS_MS = 200 # Terminal refresh interval during bulk import/export
+FUZZY_SEARCH_LIMIT = 200000 # Largest class that gets the n-gram index (about 9 s and 600 MB per million names)
+
 class StudentManager: # Define class
-    def __init__(self, root): # Initialize class
+    def __init__(self, root, storage=STORAGE): # Initialize class
         self.root = root # Set root window
+        self.storage = storage # "memory" or "sqlite"
         self.root.title("STUDENT DATA TERMINAL | EXERCISE 3") # Set window title
         
         self.win_width = 1000 # Set window width
@@ -18,7 +36,16 @@ class StudentManager: # Define class
         self.root.geometry(f"{self.win_width}x{self.win_height}") # Apply geometry
         self.root.configure(bg=COLOR_BG) # Set background color
 
-        self.students = [] # Initialize empty student list
+        self.students = StudentStore() # Initialize empty student store
+        self.journal = None # Change journal (opened by load_data)
+        self.load_error = None # Why edits cannot be saved, when the data file failed to load
+        self.compacting = False # Background compaction running
+        self.load_report = None # Counts from the last load
+        self.sort_order = None # None (file order), "asc" or "desc" for VIEW ALL
+        self.listing = None # (header lines, student count, position -> row, footer lines) for the report view
+        self.search_job = None # Pending name search
+        self.busy = None # "IMPORT" or "EXPORT" while a bulk job runs
+        self.progress = queue.Queue() # (finished, text) messages from bulk jobs
         self.load_data() # Load data from file
 
         self.scene_canvas = tk.Canvas(root, bg="black", highlightthickness=0) # Create background canvas
@@ -39,6 +66,7 @@ class StudentManager: # Define class
 
         ROW_1_Y = 0.105 # Set Row 1 Y position
         ROW_2_Y = 0.245 # Set Row 2 Y position
+        ROW_3_Y = 0.345 # Set Row 3 Y position (search and bulk jobs)
 
         COL_1_X = 0.125 # Set Column 1 X position
         COL_2_X = 0.375 # Set Column 2 X position
@@ -55,6 +83,25 @@ class StudentManager: # Define class
         self.create_nav_btn("DELETE",      COL_3_X, ROW_2_Y, self.delete_student) # Create Delete button
         self.create_nav_btn("UPDATE",      COL_4_X, ROW_2_Y, self.update_student) # Create Update button
 
+        self.create_nav_btn("IMPORT CSV",  COL_1_X, ROW_3_Y, self.import_marks) # Create bulk import button
+        self.create_nav_btn("EXPORT CSV",  COL_4_X, ROW_3_Y, self.export_marks) # Create bulk export button
+
+        self.search_var = tk.StringVar() # Name search text
+        self.search_var.trace_add("write", self.schedule_search) # Search as you type
+        tk.Label(root, text="SEARCH NAME:", bg=COLOR_BG, fg=COLOR_WHITE, font=("Courier", 11, "bold")).place(relx=0.32, rely=ROW_3_Y, anchor="e") # Search label
+        self.search_entry = tk.Entry( # Create search box
+            root, # Parent is root
+            textvariable=self.search_var, # Bound to search text
+            bg=COLOR_BG, # Background color
+            fg=COLOR_TURQUOISE, # Text color
+            insertbackground=COLOR_PRIMARY, # Cursor color
+            highlightbackground=COLOR_TURQUOISE, # Border color
+            highlightthickness=1, # Thin border
+            font=("Courier", 11), # Font settings
+            bd=0 # No border
+        )
+        self.search_entry.place(relx=0.33, rely=ROW_3_Y, anchor="w", relwidth=0.35) # Place search box
+
         self.terminal_frame = tk.Frame(root, bg=COLOR_BG, highlightbackground=COLOR_TURQUOISE, highlightthickness=2) # Create terminal frame
         self.terminal_frame.place(relx=0.5, rely=0.68, anchor="center", relwidth=0.9, relheight=0.55) # Place terminal frame
 
@@ -66,15 +113,20 @@ class StudentManager: # Define class
             bd=0, # No border
             padx=20, pady=20 # Padding
         )
-        self.output_text.pack(fill="both", expand=True) # Pack text widget
+        self.scrollbar = tk.Scrollbar(self.terminal_frame, bg=COLOR_BG, troughcolor=COLOR_BG, activebackground=COLOR_PRIMARY) # Report scrollbar
+        self.output_text.pack(side="left", fill="both", expand=True) # Pack text widget
+        self.report = VirtualReport(self.output_text, self.scrollbar) # Renders only the visible report lines
         
-        self.log("Hello :D") # Log initial message
+        message = "Hello :D" # Initial message
+        if self.load_report and (self.load_report["malformed"] or self.load_report["duplicates"]): # Problems in the data file
+            message += f"\n\nSkipped {self.load_report['malformed']} malformed lines and {self.load_report['duplicates']} repeated IDs in studentMarks.txt." # Mention them
+        self.log(message) # Log initial message
 
     def create_nav_btn(self, text, relx, rely, command): # Define button creation function
         btn = tk.Button( # Create button widget
             self.root, # Parent is root
             text=text, # Set button text
-            command=command, # Set click command
+            command=lambda: self.run_command(command), # Set click command
             bg=COLOR_BG, # Background color
             fg=COLOR_WHITE, # Text color
             activebackground=COLOR_BG, # Active bg color
@@ -85,44 +137,82 @@ class StudentManager: # Define class
         )
         btn.place(relx=relx, rely=rely, anchor="center") # Place button
 
+    def run_command(self, command): # Define button dispatch
+        if self.busy: # Bulk job running
+            self.root.bell() # Store is being changed in the background
+            return # Ignore click
+        command() # Run command
+
     def load_data(self): # Define load data function
-        self.students = [] # Clear students list
+        if self.storage == "sqlite": return self.open_database() # Indexed database instead of the text file
+        self.students = StudentStore() # Clear student store
+        file_path = data_path() # Data file next to this script
+        self.data_path = file_path # Remember data file
+        self.load_error = None # No problem yet
+        if self.journal: self.journal.close() # Close previous journal
+        self.journal = None # Edits are blocked until the journal is open
         try: # Try block
-            base_folder = os.path.dirname(os.path.abspath(__file__)) # Get base folder
-            file_path = os.path.join(base_folder, "studentMarks.txt") # Build file path
-            
-            with open(file_path, "r") as f: # Open file read mode
-                lines = f.readlines() # Read all lines
-                for line in lines[1:]: # Loop through lines skipping first
-                    parts = line.strip().split(',') # Split line by comma
-                    if len(parts) >= 6: # Check if valid line
-                        s_id = parts[0] # Get ID
-                        name = parts[1] # Get Name
-                        c1, c2, c3 = int(parts[2]), int(parts[3]), int(parts[4]) # Get coursework marks
-                        exam = int(parts[5]) # Get exam mark
-                        
-                        total_coursework = c1 + c2 + c3 # Calculate total coursework
-                        total_score = total_coursework + exam # Calculate total score
-                        percentage = (total_score / 160) * 100 # Calculate percentage
-                        grade = self.calculate_grade(percentage) # Calculate grade
-                        
-                        self.students.append({ # Add student dict to list
-                            "id": s_id, "name": name, # Store ID and Name
-                            "c_total": total_coursework, "exam": exam, # Store scores
-                            "total": total_score, "percent": percentage, # Store totals
-                            "grade": grade, "raw_parts": parts # Store grade and raw parts
-                        })
+            report = load_file(file_path, self.students) # Stream and parse the data file
+            self.load_report = report # Keep for the terminal
+            if report["malformed"] or report["duplicates"]: # Problems found
+                print(f"Load: skipped {report['malformed']} malformed lines and {report['duplicates']} repeated IDs") # Report them
+        except FileNotFoundError: # First run: start an empty class
+            self.students = StudentStore() # Nothing loaded
+            print(f"Load: {file_path} not found, starting an empty class") # Report it
+        except Exception as e: # Unreadable data file: compaction would overwrite it, so edits stay blocked
+            self.students = StudentStore() # Drop partial rows
+            self.load_error = f"Failed to load data: {e}" # Remember why
+            messagebox.showerror("Error", f"{self.load_error}\nChanges cannot be saved until the file is fixed.") # Show error message
+            return # Return
+
+        try: # Try block
+            self.journal = ChangeJournal(file_path + ".journal") # Open change journal
+            applied, skipped = self.journal.replay(self.students) # Apply edits made since the last compaction
+            if skipped: print(f"Journal: skipped {skipped} damaged entries") # Report damage
+            self.students.build_name_index(len(self.students) <= FUZZY_SEARCH_LIMIT) # Name search over the loaded class
+            self.maybe_compact() # Fold a long journal back in
+        except Exception as e: # Catch errors
+            if self.journal: self.journal.close() # Damaged replay: do not append to it
+            self.journal = None # Edits stay blocked
+            self.load_error = f"Failed to open the change journal: {e}" # Remember why
+            messagebox.showerror("Error", self.load_error) # Show error message
+
+    def open_database(self): # Define SQLite load
+        try: # Try block
+            self.data_path = data_path() # Text file for the first import
+            self.students = SqliteStore(db_path()) # Open or create database
+            if not len(self.students) and os.path.exists(self.data_path): # New database
+                self.load_report = self.students.import_text(self.data_path) # Import studentMarks.txt once
         except Exception as e: # Catch errors
             messagebox.showerror("Error", f"Failed to load data: {e}") # Show error message
 
+    def record_change(self, *fields): # Define journaled edit, written before the store changes
+        if isinstance(self.students, SqliteStore): return # SQLite commits each edit itself
+        if self.journal is None: raise OSError(self.load_error or "change journal is not open") # Nowhere to persist the edit
+        self.journal.append(*fields) # Persist the edit
+
+    def maybe_compact(self): # Define compaction trigger
+        if self.journal is None: return # SQLite, or edits blocked
+        if self.journal.entries >= COMPACT_EVERY and not self.compacting: # Long journal, no compaction running
+            self.compacting = True # Mark running
+            offset, entries = self.journal.mark() # Journal position covered by the snapshot
+            snapshot = self.students.snapshot() # Copy live rows
+            threading.Thread(target=self.compact_worker, args=(snapshot, offset, entries), daemon=True).start() # Write in background
+
+    def compact_worker(self, snapshot, offset, entries): # Define background compaction
+        try: # Try block
+            if self.save_all_to_file(snapshot): # Data file now holds the snapshot
+                self.journal.trim(offset, entries) # Drop entries now in the data file
+        except Exception as e: # Catch errors
+            print(f"Compaction Error: {e}") # Print error
+        finally: # Always
+            self.compacting = False # Allow the next one
+
     def calculate_grade(self, percent): # Define grade calculation
-        if percent >= 70: return 'A' # Check for A
-        elif percent >= 60: return 'B' # Check for B
-        elif percent >= 50: return 'C' # Check for C
-        elif percent >= 40: return 'D' # Check for D
-        else: return 'F' # Else F
+        return GRADES[grade_code(percent)] # Look up grade letter
 
     def log(self, message): # Define log function
+        self.report.hide() # Leave report mode
         self.output_text.delete("1.0", tk.END) # Clear text box
         self.output_text.insert("1.0", message) # Insert message
 
@@ -133,42 +223,85 @@ class StudentManager: # Define class
                 f"{'-'*60}\n") # Format separator
 
     def view_all(self): # Define view all function
-        report = "--- CLASS REPORT ---\n\n" # Initialize report string
-        total_percent = 0 # Initialize total percent
-        for s in self.students: # Loop through students
-            report += self.format_student(s) # Add formatted student
-            total_percent += s['percent'] # Add to total percent
-        
-        avg = total_percent / len(self.students) if self.students else 0 # Calculate average
-        report += f"\nCLASS SUMMARY:\nStudents: {len(self.students)}\nAverage Score: {avg:.1f}%" # Add summary
-        self.log(report) # Log report
+        summary_lines = self.format_summary().split("\n") # Summary from cached aggregates
+        self.show_listing(REPORT_HEADER, len(self.students), lambda position: self.students.row_at(position, self.sort_order), summary_lines) # File or score order
+
+    def show_listing(self, header, count, row_of, footer): # Define paged student listing
+        self.listing = (header, count, row_of, footer) # What report_lines draws from
+        line_count = len(header) + STUDENT_LINES * count + len(footer) # Lines in the whole listing
+        self.report.show(line_count, self.report_lines) # Format rows only as they scroll into view
+
+    def report_lines(self, start, end): # Define report lines for a scroll window
+        header, count, row_of, footer = self.listing # Current listing
+        lines = [] # Window lines
+        body_end = len(header) + STUDENT_LINES * count # First footer line
+        cached = (None, None) # (position, formatted lines) of the last student
+        for n in range(start, end): # Loop requested lines
+            if n < len(header): # Listing title
+                lines.append(header[n]) # Header line
+            elif n < body_end: # Student block
+                position, part = divmod(n - len(header), STUDENT_LINES) # Student and line within it
+                if cached[0] != position: # New student
+                    row = row_of(position) # Store row of that student
+                    cached = (position, self.format_student(self.students.record(row)).split("\n")) # Format once
+                lines.append(cached[1][part]) # Student line
+            else: # Footer
+                lines.append(footer[n - body_end]) # Footer line
+        return lines # Return window
+
+    def schedule_search(self, *args): # Define debounced search trigger
+        if self.busy: return # Store is being changed in the background
+        if self.search_job: self.root.after_cancel(self.search_job) # Drop the search for older text
+        self.search_job = self.root.after(SEARCH_DELAY_MS, self.search_names) # Run once typing pauses
+
+    def search_names(self): # Define name search
+        self.search_job = None # No search pending
+        query = self.search_var.get().strip() # Search text
+        if not query: # Box cleared
+            self.log("") # Clear terminal
+            return # Return
+        matches = self.students.find_names(query) # Prefix, substring, then fuzzy matches
+        if not len(matches): # Nothing found
+            self.log(f"No student names match '{query}'.") # Log not found
+            return # Return
+        header = (f"--- SEARCH: '{query}' ({len(matches)} MATCHES) ---", "") # Listing title
+        self.show_listing(header, len(matches), matches.__getitem__, ()) # Page matches into the terminal
+
+    def format_summary(self): # Define class summary text
+        stats = self.students.stats() # Cached class statistics
+        grades = " | ".join(f"{g}: {n}" for g, n in stats["grades"].items()) # Grade distribution
+        percentiles = " | ".join(f"P{p}: {v:.1f}%" for p, v in stats["percentiles"].items()) # Percentiles
+        return (f"\nCLASS SUMMARY:\nStudents: {stats['count']}\nAverage Score: {stats['mean']:.1f}%" # Count and average
+                f"\nMedian: {stats['median']:.1f}% | Std Dev: {stats['std']:.1f}% | Range: {stats['min']:.1f}-{stats['max']:.1f}%" # Spread
+                f"\nGrades: {grades}\nPercentiles: {percentiles}") # Distribution
 
     def view_individual(self): # Define view individual function
         target_id = simpledialog.askstring("Input", "Enter Student ID:") # Ask for ID
         if target_id: # If ID provided
-            for s in self.students: # Loop through students
-                if s['id'] == target_id: # Check ID match
-                    self.log(self.format_student(s)) # Log formatted student
-                    return # Exit function
+            s = self.students.get(target_id) # Hash lookup
+            if s: # Found
+                rank = self.students.rank(target_id) # Position by total
+                self.log(self.format_student(s) + f"RANK: {rank} of {len(self.students)}") # Log formatted student
+                return # Exit function
             self.log(f"Student ID {target_id} not found.") # Log not found
 
     def show_highest(self): # Define show highest function
         if not self.students: return # Return if no students
-        top = max(self.students, key=lambda x: x['total']) # Find max total
+        top = self.students.highest() # Find max total
         self.log("--- HIGHEST PERFORMING STUDENT ---\n\n" + self.format_student(top)) # Log result
 
     def show_lowest(self): # Define show lowest function
         if not self.students: return # Return if no students
-        low = min(self.students, key=lambda x: x['total']) # Find min total
+        low = self.students.lowest() # Find min total
         self.log("--- LOWEST PERFORMING STUDENT ---\n\n" + self.format_student(low)) # Log result
 
     def sort_records(self): # Define sort function
         choice = simpledialog.askstring("Sort", "Type 'A' for Ascending or 'D' for Descending:") # Ask sort order
         if choice and choice.upper() == 'A': # If Ascending
-            self.students.sort(key=lambda x: x['total'])  # Sort list
+            self.sort_order = "asc" # Ascending view, file order untouched
             self.log("Sorted: Ascending Order") # Log status
         else: # If Descending
-            self.students.sort(key=lambda x: x['total'], reverse=True) # Sort reverse
+            self.sort_order = "desc" # Descending view, file order untouched
             self.log("Sorted: Descending Order (Highest First)") # Log status
         self.view_all() # View all records
 
@@ -179,38 +312,38 @@ class StudentManager: # Define class
                 if data.count(',') != 5: # Validate format
                     self.log("Error: Invalid format. Please use commas.") # Log error
                     return # Return
-                with open("studentMarks.txt", "a") as f: # Open file append mode
-                    f.write("\n" + data) # Write data
-                self.load_data() # Reload data
+                record = parse_record(data) # Parse new record
+                if record[0] in self.students: # ID already used
+                    self.log(f"Error: Student ID {record[0]} already exists.") # Log error
+                    return # Return
+                self.record_change("A", *map(str, record)) # Journal the add first
+                self.students.add(*record) # Insert into store
+                self.maybe_compact() # Compact when the journal is long
                 self.log("Student added successfully.") # Log success
-            except: # Catch errors
-                self.log("Error saving to file.") # Log error
+            except ValueError as e: # Non-numeric or out-of-range marks
+                self.log(f"Error: {e}.") # Log error
+            except OSError as e: # Journal write failed: store untouched
+                self.log(f"Error saving to file, nothing was changed: {e}") # Log error
 
     def delete_student(self): # Define delete student function
         target_id = simpledialog.askstring("Delete", "Enter ID to delete:") # Ask for ID
         if target_id: # If ID provided
-            found = False # Initialize found flag
-            new_list = [] # Initialize new list
-            for s in self.students: # Loop through students
-                if s['id'] == target_id: # Check ID match
-                    found = True # Set found true
-                else: # Else
-                    new_list.append(s) # Add to new list
-            if found: # If found
-                self.students = new_list # Update students list
-                self.save_all_to_file() # Save to file
-                self.log(f"Student {target_id} deleted.") # Log success
-            else: # Else
+            if target_id not in self.students: # Unknown ID
                 self.log("Student ID not found.") # Log not found
+                return # Return
+            try: # Try block
+                self.record_change("D", target_id) # Journal the delete first
+            except OSError as e: # Journal write failed: store untouched
+                self.log(f"Error saving to file, nothing was changed: {e}") # Log error
+                return # Return
+            self.students.delete(target_id) # Remove row
+            self.maybe_compact() # Compact when the journal is long
+            self.log(f"Student {target_id} deleted.") # Log success
 
     def update_student(self): # Define update student function
         target_id = simpledialog.askstring("Update", "Enter ID to update:") # Ask for ID
         if target_id: # If ID provided
-            target_student = None # Initialize target
-            for s in self.students: # Loop through students
-                if s['id'] == target_id: # Check ID match
-                    target_student = s # Set target
-                    break # Break loop
+            target_student = self.students.get(target_id) # Hash lookup
             
             if not target_student: # If not found
                 self.log("ID not found.") # Log error
@@ -220,24 +353,88 @@ class StudentManager: # Define class
             new_data = simpledialog.askstring("Update", f"Enter NEW data for {target_id}:\nFormat: ID,Name,C1,C2,C3,Exam") # Ask new data
             
             if new_data: # If new data provided
-                self.students = [s for s in self.students if s['id'] != target_id] # Remove old student
-                self.save_all_to_file() # Save to file
-                with open("studentMarks.txt", "a") as f: # Open file append mode
-                    f.write("\n" + new_data) # Write new data
-                self.load_data() # Reload data
-                self.log("Student record updated.") # Log success
-
-    def save_all_to_file(self): # Define save function
+                try: # Try block
+                    record = parse_record(new_data) # Parse new record
+                    if record is None: # Too few fields
+                        self.log("Error: Invalid format. Please use commas.") # Log error
+                        return # Return
+                    if record[0] != target_id and record[0] in self.students: # New ID taken
+                        self.log(f"Error: Student ID {record[0]} already exists.") # Log error
+                        return # Return
+                    self.record_change("U", target_id, *map(str, record)) # Journal the update first
+                    self.students.update(target_id, *record) # Update row in place
+                    self.maybe_compact() # Compact when the journal is long
+                    self.log("Student record updated.") # Log success
+                except ValueError as e: # Non-numeric or out-of-range marks
+                    self.log(f"Error: {e}.") # Log error
+                except OSError as e: # Journal write failed: store untouched
+                    self.log(f"Error saving to file, nothing was changed: {e}") # Log error
+
+    def import_marks(self): # Define bulk import
+        if self.journal is None and not isinstance(self.students, SqliteStore): # Edits blocked
+            self.log(f"Error: {self.load_error or 'change journal is not open'}") # Log error
+            return # Return
+        if self.compacting: # Background compaction writing the data file
+            self.log("Please wait: saving recent changes.") # Log status
+            return # Return
+        path = filedialog.askopenfilename(title="Import marks", filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]) # Ask for file
+        if path: self.start_bulk("IMPORT", self.import_worker, path) # Run in background
+
+    def export_marks(self): # Define bulk export
+        path = filedialog.asksaveasfilename(title="Export marks", defaultextension=".csv", filetypes=[("CSV files", "*.csv")]) # Ask for file
+        if path: self.start_bulk("EXPORT", self.export_worker, path) # Run in background
+
+    def start_bulk(self, label, worker, path): # Define background bulk job
+        self.busy = label # Block other commands
+        self.log(f"--- {label}: {os.path.basename(path)} ---\n\nStarting...") # Log status
+        threading.Thread(target=worker, args=(path,), daemon=True).start() # Work off the Tk thread
+        self.root.after(PROGRESS_MS, self.poll_bulk) # Watch progress
+
+    def bulk_progress(self, label, path): # Define progress callback for a worker
+        return lambda done, report: self.progress.put((False, format_progress(label, path, done, report))) # Queue text for the Tk thread
+
+    def import_worker(self, path): # Define background import
+        try: # Try block
+            report = import_csv(path, self.students, self.bulk_progress("IMPORT", path), self.journal) # Stream, validate, merge, journal
+            if self.journal and report["imported"]: # Text backend: one write of the whole class
+                offset, entries = self.journal.mark() # Journal position covered by the snapshot
+                report["saved"] = self.save_all_to_file() # Temp file, fsync, rename
+                if report["saved"]: self.journal.trim(offset, entries) # Edits now in the data file
+            text = format_import(report, path) # Summary
+        except Exception as e: # Catch errors
+            text = f"Import failed, nothing was added: {e}" # Batch rolled back
+        self.progress.put((True, text)) # Hand result to the Tk thread
+
+    def export_worker(self, path): # Define background export
+        try: # Try block
+            text = format_export(export_csv(path, self.students, self.bulk_progress("EXPORT", path)), path) # Stream totals, percent and grade
+        except Exception as e: # Catch errors
+            text = f"Export failed: {e}" # Old file left intact
+        self.progress.put((True, text)) # Hand result to the Tk thread
+
+    def poll_bulk(self): # Define progress display
+        finished, text = False, None # Latest message
+        while not finished: # Drain queue
+            try: finished, text = self.progress.get_nowait() # Next message
+            except queue.Empty: break # Nothing more
+        if text: self.log(text) # Show latest state
+        if finished: self.busy = None # Allow commands again
+        else: self.root.after(PROGRESS_MS, self.poll_bulk) # Keep watching
+
+    def save_all_to_file(self, snapshot=None): # Define save function
         try: # Try block
-            with open("studentMarks.txt", "w") as f: # Open file write mode
-                f.write(str(len(self.students)) + "\n") # Write count
-                for s in self.students: # Loop through students
-                    line = ",".join(s['raw_parts']) # Join raw parts
-                    f.write(line + "\n") # Write line
+            if snapshot is None: snapshot = self.students.snapshot() # Copy live rows
+            save_snapshot(self.data_path, snapshot) # Temp file, fsync, rename
+            return True # Saved
         except Exception as e: # Catch errors
             print(f"Save Error: {e}") # Print error
+            return False # Old file left intact
 
 if __name__ == "__main__": # Main entry check
+    parser = argparse.ArgumentParser(description="Student data terminal") # Create parser
+    parser.add_argument("--storage", choices=STORAGES, default=STORAGE, help="memory: studentMarks.txt with a change journal; sqlite: studentMarks.db (default $STUDENT_STORAGE or memory)") # Backend
+    args = parser.parse_args() # Parse arguments
+    if args.storage not in STORAGES: parser.error(f"STUDENT_STORAGE must be one of: {', '.join(STORAGES)}") # Bad environment value
     root = tk.Tk() # Create root window
-    app = StudentManager(root) # Create app instance
+    app = StudentManager(root, args.storage) # Create app instance
     root.mainloop() # Start main loop
\ No newline at end of file
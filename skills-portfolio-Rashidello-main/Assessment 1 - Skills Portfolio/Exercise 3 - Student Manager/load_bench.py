@@ -0,0 +1,64 @@
+import os # Import os module
+import time # Import time module
+import argparse # Import argparse module
+import tempfile # Import tempfile module
+import numpy as np # Import numpy library
+from student_store import StudentStore # Import columnar student store
+from student_files import load_file, format_lines, BLOCK_ROWS # Import file loader and writer
+
+def write_synthetic(path, n, bad_every=100000): # Define fake data file generator
+    rng = np.random.default_rng(1) # Reproducible marks
+    with open(path, "w") as f: # Open file
+        f.write(f"{n}\n") # Count header
+        for start in range(0, n, BLOCK_ROWS): # Loop blocks
+            end = min(n, start + BLOCK_ROWS) # Block end
+            ids = [str(100000000 + i) for i in range(start, end)] # Unique IDs
+            names = [f"Student {i}" for i in range(start, end)] # Names
+            marks = np.column_stack([rng.integers(0, 21, end - start), rng.integers(0, 21, end - start), # Coursework
+                                     rng.integers(0, 21, end - start), rng.integers(0, 101, end - start)]) # Exam
+            f.write(format_lines(ids, names, marks)) # Write block
+            if bad_every and end // bad_every != start // bad_every: f.write("not,a,valid,line\n1,Bad Marks,x,1,1,1\n") # Sprinkle malformed lines
+
+def load_legacy(path): # Define old readlines + dicts loader
+    students = [] # Student list
+    with open(path, "r") as f: # Open file read mode
+        lines = f.readlines() # Read all lines
+        for line in lines[1:]: # Loop through lines skipping first
+            parts = line.strip().split(',') # Split line by comma
+            if len(parts) >= 6: # Check if valid line
+                try: c1, c2, c3, exam = int(parts[2]), int(parts[3]), int(parts[4]), int(parts[5]) # Marks
+                except ValueError: continue # The old loader aborted here
+                total = c1 + c2 + c3 + exam # Total score
+                students.append({"id": parts[0], "name": parts[1], "c_total": c1 + c2 + c3, "exam": exam, # Same dict as before
+                                 "total": total, "percent": total / 160 * 100, "raw_parts": parts}) # Totals
+    return len(students) # Rows loaded
+
+def main(): # Define benchmark entry
+    parser = argparse.ArgumentParser(description="Student data file load benchmark") # Create parser
+    parser.add_argument("rows", nargs="?", type=int, default=10_000_000, help="synthetic rows (default 10M)") # Row count
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="worker processes for the parallel run") # Workers
+    parser.add_argument("--legacy", action="store_true", help="also time the old readlines loader") # Old path
+    args = parser.parse_args() # Parse arguments
+
+    path = os.path.join(tempfile.mkdtemp(), "studentMarks.txt") # Scratch file
+    t0 = time.perf_counter() # Start timer
+    write_synthetic(path, args.rows) # Build file
+    print(f"{args.rows:,} rows, {os.path.getsize(path) / 2**20:.0f} MB (generated in {time.perf_counter() - t0:.1f}s)") # Setup
+
+    runs = [("streaming", 1)] + ([("process pool", args.jobs)] if args.jobs > 1 else []) # Loader variants
+    for name, jobs in runs: # Each variant
+        store = StudentStore() # Empty store
+        report = load_file(path, store, jobs) # Load file
+        print(f"{name:<14}{report['seconds']:>8.2f}s {report['rows'] / report['seconds']:>12,.0f} rows/s  malformed={report['malformed']} duplicates={report['duplicates']}") # Report
+        del store # Free memory
+    if args.jobs <= 1: print("process pool   skipped (one CPU)") # Explain
+    if args.legacy: # Old loader
+        t0 = time.perf_counter() # Start timer
+        rows = load_legacy(path) # Load file
+        elapsed = time.perf_counter() - t0 # Time
+        print(f"{'legacy':<14}{elapsed:>8.2f}s {rows / elapsed:>12,.0f} rows/s") # Report
+    os.remove(path) # Clean up
+    os.rmdir(os.path.dirname(path)) # Remove folder
+
+if __name__ == "__main__": # Main entry check
+    main() # Run benchmark
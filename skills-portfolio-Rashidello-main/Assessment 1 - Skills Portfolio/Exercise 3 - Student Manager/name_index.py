@@ -0,0 +1,119 @@
+import bisect # Import bisect module
+from array import array # Import compact int array
+from collections import Counter # Import Counter class
+
+SEPARATOR = "\0" # Between the name text and the row in a key
+GRAM = 3 # Characters per n-gram
+FUZZY_SHARE = 0.6 # Share of query n-grams a fuzzy match must contain
+FUZZY_POSTING_LIMIT = 50000 # N-grams on more rows than this are too common to rank by
+INSERT_LIMIT = 64 # New keys inserted in place; larger runs are merged in one pass
+
+def normalize(text): # Define search form of a name
+    return " ".join(text.casefold().split()) # Case-insensitive, single spaces
+
+def name_keys(name, row): # Define prefix keys for one name
+    words = normalize(name).split(" ") # Words of the name
+    tag = f"{SEPARATOR}{row}" # Row suffix
+    return [" ".join(words[i:]) + tag for i in range(len(words)) if words[i]] # Full name, then from each later word
+
+def key_rows(keys): # Define rows of many prefix keys
+    parts = SEPARATOR.join(keys).split(SEPARATOR) # Name text and row, alternating
+    return array("q", map(int, parts[1::2])) # Rows in key order
+
+def merge_runs(keys, rows, new, new_rows): # Define linear merge of two sorted key runs
+    merged, merged_rows = [], array("q") # Result
+    done = 0 # Old keys copied so far
+    for key, row in zip(new, new_rows): # New keys in order
+        at = bisect.bisect_left(keys, key, done) # Old keys that sort before it
+        merged += keys[done:at] # Copy them
+        merged_rows += rows[done:at] # And their rows
+        merged.append(key) # New key
+        merged_rows.append(row) # Its row
+        done = at # Continue after them
+    merged += keys[done:] # Tail
+    merged_rows += rows[done:] # Tail rows
+    return merged, merged_rows # Merged run
+
+def name_grams(name): # Define n-grams of a name
+    text = normalize(name) # Search form
+    return {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)} # Distinct n-grams
+
+class NameIndex: # Define name search index
+    def __init__(self, fuzzy=False): # Initialize index
+        self.keys = [] # Sorted "name from word k" + row keys
+        self.rows = array("q") # Row of each key, same order
+        self.grams = {} if fuzzy else None # N-gram -> rows, or None when fuzzy search is off
+
+    def build(self, names, rows): # Define bulk build
+        self.keys = [] # Start empty
+        self.rows = array("q") # Start empty
+        if self.grams is not None: self.grams = {} # Start empty
+        self.extend(names, rows) # Add everything
+
+    def extend(self, names, rows): # Define bulk insert
+        new = [key for name, row in zip(names, rows) for key in name_keys(name, row)] # Keys of the new rows
+        new.sort() # One sorted run
+        if not self.keys: self.keys, self.rows = new, key_rows(new) # First run
+        elif len(new) <= INSERT_LIMIT: # A few keys: one memmove each, like add()
+            for key, row in zip(new, key_rows(new)): # New keys
+                i = bisect.bisect_left(self.keys, key) # O(log n) search
+                self.keys.insert(i, key) # Insert key
+                self.rows.insert(i, row) # Insert row
+        else: self.keys, self.rows = merge_runs(self.keys, self.rows, new, key_rows(new)) # One pass over the old keys
+        if self.grams is not None: # Fuzzy search on
+            grams = self.grams # Local for speed
+            for name, row in zip(names, rows): # Loop new rows
+                for gram in name_grams(name): # Each n-gram
+                    posting = grams.get(gram) # Rows with it
+                    if posting is None: grams[gram] = {row} # First row
+                    else: posting.add(row) # One more row
+
+    def add(self, name, row): # Define single insert
+        for key in name_keys(name, row): # Each key of the name
+            i = bisect.bisect_left(self.keys, key) # O(log n) search
+            self.keys.insert(i, key) # One memmove
+            self.rows.insert(i, row) # One memmove
+        if self.grams is not None: # Fuzzy search on
+            for gram in name_grams(name): self.grams.setdefault(gram, set()).add(row) # Post row
+
+    def remove(self, name, row): # Define single removal
+        for key in name_keys(name, row): # Each key of the name
+            i = bisect.bisect_left(self.keys, key) # Find it
+            if i < len(self.keys) and self.keys[i] == key: # Found
+                del self.keys[i] # Drop it
+                del self.rows[i] # Drop its row
+        if self.grams is not None: # Fuzzy search on
+            for gram in name_grams(name): # Each n-gram
+                posting = self.grams.get(gram) # Rows with it
+                if posting is None: continue # Nothing posted
+                posting.discard(row) # Unpost row
+                if not posting: del self.grams[gram] # Drop empty posting
+
+    def prefix(self, query): # Define prefix search
+        text = normalize(query) # Search form
+        if not text: return [] # Nothing typed
+        low = bisect.bisect_left(self.keys, text) # First key with the prefix
+        high = bisect.bisect_left(self.keys, text + "\U0010ffff", low) # Past the last one
+        return list(dict.fromkeys(self.rows[low:high])) # Each student once, at their first matching word
+
+    def substring(self, query, names): # Define substring search over the n-gram index
+        text = normalize(query) # Search form
+        if self.grams is None or len(text) < GRAM: return [] # Needs the n-gram index and a full n-gram
+        postings = [self.grams.get(gram, ()) for gram in name_grams(text)] # Rows per query n-gram
+        postings.sort(key=len) # Rarest first
+        rows = set(postings[0]) # Candidates
+        for posting in postings[1:]: # Narrow down
+            if not rows: break # No candidates left
+            rows &= posting # Must contain every n-gram
+        return sorted(row for row in rows if text in normalize(names[row])) # Confirm and keep file order
+
+    def fuzzy(self, query, limit=100): # Define typo-tolerant search
+        text = normalize(query) # Search form
+        if self.grams is None or len(text) < GRAM: return [] # Needs the n-gram index and a full n-gram
+        wanted = name_grams(text) # Query n-grams
+        hits = Counter() # Row -> shared n-grams
+        for gram in wanted: # Each query n-gram
+            posting = self.grams.get(gram, ()) # Rows with it
+            if len(posting) <= FUZZY_POSTING_LIMIT: hits.update(posting) # Skip n-grams that say nothing
+        needed = max(1, int(len(wanted) * FUZZY_SHARE)) # Minimum shared n-grams
+        return [row for row, shared in hits.most_common(limit) if shared >= needed] # Best matches first
@@ -0,0 +1,102 @@
+import tkinter as tk # Import tkinter library
+from tkinter import font as tkfont # Import font metrics
+
+class VirtualReport: # Define virtual scrolling text view
+    def __init__(self, text, scrollbar, overscan=20): # Initialize view
+        self.text = text # Text widget that shows the window
+        self.scrollbar = scrollbar # Scrollbar driven by the virtual position
+        self.overscan = overscan # Extra lines rendered above and below
+        self.line_count = 0 # Lines in the whole report
+        self.get_lines = None # Callback: (start, end) -> list of lines
+        self.top = 0 # First visible report line
+        self.window = None # Report lines currently in the widget
+        self.active = False # Virtual mode on
+        self.font = None # Font option the line height was measured for
+        self.line_height = 1 # Pixels per line
+        self.measure_font() # Measure once up front
+        self.scrollbar.config(command=self.on_scrollbar) # Scrollbar drives us
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"): self.text.bind(sequence, self.on_wheel) # Wheel on all platforms
+        for key, step in (("<Up>", -1), ("<Down>", 1), ("<Prior>", "page-"), ("<Next>", "page+")): # Keyboard scrolling
+            self.text.bind(key, lambda event, step=step: self.on_key(step)) # Bind key
+        self.text.bind("<Configure>", self.on_configure) # Refill on resize
+
+    def measure_font(self): # Define line height refresh when the font changes
+        font = str(self.text.cget("font")) # Current font option
+        if font == self.font: return # Same font, cached height holds
+        self.font = font # Remember font
+        self.line_height = max(1, tkfont.Font(font=font).metrics("linespace")) # Pixels per line
+
+    def on_configure(self, event): # Define resize or reconfigure handler
+        self.measure_font() # Font may have changed with the geometry
+        if self.active: self.render() # Refill window
+
+    def visible_lines(self): # Define lines that fit in the widget
+        height = self.text.winfo_height() # Widget height
+        if height <= 1: return int(self.text.cget("height")) # Not drawn yet
+        return max(1, (height - 2 * int(self.text.cget("pady"))) // self.line_height) # Whole lines
+
+    def show(self, line_count, get_lines): # Define start of virtual mode
+        self.line_count = line_count # Report size
+        self.get_lines = get_lines # Line source
+        self.top = 0 # Start at the top
+        self.window = None # Force a redraw
+        self.active = True # Virtual mode on
+        self.scrollbar.pack(side="right", fill="y") # Show scrollbar
+        self.render() # Draw first window
+
+    def hide(self): # Define end of virtual mode
+        if not self.active: return # Already off
+        self.active = False # Virtual mode off
+        self.get_lines = None # Release line source
+        self.window = None # Nothing rendered
+        self.scrollbar.pack_forget() # Hide scrollbar
+
+    def render(self): # Define window refresh
+        visible = self.visible_lines() # Lines on screen
+        self.top = max(0, min(self.top, self.line_count - visible)) # Clamp position
+        start = max(0, self.top - self.overscan) # Window start
+        end = min(self.line_count, self.top + visible + self.overscan) # Window end
+        if (start, end) != self.window: # New lines needed
+            self.text.delete("1.0", tk.END) # Clear text box
+            self.text.insert("1.0", "\n".join(self.get_lines(start, end))) # Insert only this window
+            self.window = (start, end) # Remember window
+        self.text.yview(f"{self.top - start + 1}.0") # Put the top line first
+        self.update_scrollbar(visible) # Move thumb
+
+    def update_scrollbar(self, visible): # Define thumb position
+        if not self.line_count: return self.scrollbar.set(0, 1) # Empty report
+        self.scrollbar.set(self.top / self.line_count, min(1, (self.top + visible) / self.line_count)) # Fractions of the whole report
+
+    def scroll_to(self, top): # Define virtual scroll
+        visible = self.visible_lines() # Lines on screen
+        self.top = max(0, min(int(top), self.line_count - visible)) # Clamp position
+        start, end = self.window # Rendered window
+        margin = self.overscan // 4 # Lines kept in reserve before re-rendering
+        above = start == 0 or self.top - start >= margin # Room above
+        below = end == self.line_count or end - self.top - visible >= margin # Room below
+        if above and below: # Still inside the window
+            self.text.yview(f"{self.top - start + 1}.0") # Native scroll within the window
+            self.update_scrollbar(visible) # Move thumb
+        else: # Near the edge
+            self.render() # Re-centre the window
+
+    def on_scrollbar(self, *args): # Define scrollbar callback
+        if not self.active: return self.text.yview(*args) # Normal text scrolling
+        visible = self.visible_lines() # Lines on screen
+        if args[0] == "moveto": self.scroll_to(float(args[1]) * self.line_count) # Drag
+        elif args[2] == "pages": self.scroll_to(self.top + int(args[1]) * visible) # Page click
+        else: self.scroll_to(self.top + int(args[1])) # Arrow click
+
+    def on_wheel(self, event): # Define wheel handler
+        if not self.active: return None # Let Tk scroll normally
+        if event.num == 4 or getattr(event, "delta", 0) > 0: self.scroll_to(self.top - 3) # Up
+        else: self.scroll_to(self.top + 3) # Down
+        return "break" # Stop native scrolling
+
+    def on_key(self, step): # Define keyboard handler
+        if not self.active: return None # Let Tk handle it
+        visible = self.visible_lines() # Lines on screen
+        if step == "page-": self.scroll_to(self.top - visible) # Page up
+        elif step == "page+": self.scroll_to(self.top + visible) # Page down
+        else: self.scroll_to(self.top + step) # One line
+        return "break" # Stop native scrolling
@@ -0,0 +1,38 @@
+import os # Import os module
+import sys # Import sys module
+import time # Import time module
+import tempfile # Import tempfile module
+from student_files import save_snapshot # Import atomic file persistence
+from store_bench import build_store # Import synthetic class builder
+
+def save_legacy(path, store): # Define old save_all_to_file loop
+    with open(path, "w") as f: # Open file write mode
+        f.write(str(len(store)) + "\n") # Write count
+        for row in store.rows(): # Loop through students
+            line = ",".join(store.raw_parts(row)) # Join raw parts
+            f.write(line + "\n") # Write line
+
+def main(): # Define benchmark entry
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000 # Class size
+    store = build_store(n) # Synthetic class
+    folder = tempfile.mkdtemp() # Scratch folder
+    legacy_path = os.path.join(folder, "legacy.txt") # Old output
+    atomic_path = os.path.join(folder, "atomic.txt") # New output
+
+    t0 = time.perf_counter() # Start timer
+    save_legacy(legacy_path, store) # Old path (no fsync, not atomic)
+    legacy = time.perf_counter() - t0 # Old time
+
+    t0 = time.perf_counter() # Start timer
+    save_snapshot(atomic_path, store.snapshot()) # New path (fsync + rename)
+    atomic = time.perf_counter() - t0 # New time
+
+    same = open(legacy_path, "rb").read() == open(atomic_path, "rb").read() # Byte-identical output
+    print(f"{n:,} records, {os.path.getsize(atomic_path) / 2**20:.1f} MB, identical output: {same}") # Setup
+    print(f"legacy line-by-line write: {legacy:.2f}s") # Old row
+    print(f"atomic buffered save:      {atomic:.2f}s (includes fsync)") # New row
+    for path in (legacy_path, atomic_path): os.remove(path) # Clean up
+    os.rmdir(folder) # Remove folder
+
+if __name__ == "__main__": # Main entry check
+    main() # Run benchmark
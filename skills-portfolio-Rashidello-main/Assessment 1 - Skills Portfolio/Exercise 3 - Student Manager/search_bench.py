@@ -0,0 +1,70 @@
+import sys # Import sys module
+import os # Import os module
+import time # Import time module
+import random # Import random module
+import tracemalloc # Import memory tracer
+import numpy as np # Import numpy library
+from student_store import StudentStore # Import columnar student store
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "shared")) # Modules shared by the exercises
+from bench_stats import percentile # Import percentile helper
+
+SYLLABLES = ("an", "bel", "cor", "da", "el", "fin", "ga", "hal", "is", "jo", "ka", "lem", "mar", "na", "ol", # Name parts
+             "pe", "qui", "ra", "sol", "ta", "ul", "ven", "wil", "xan", "ya", "zor", "ben", "chi", "dor", "eth") # More name parts
+
+def make_name(rng): # Define fake name
+    word = lambda: "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize() # One word
+    return f"{word()} {word()}" # First and last name
+
+def build(n, seed=1): # Define fake class
+    rng = random.Random(seed) # Reproducible names
+    store = StudentStore() # Empty store
+    marks = np.random.default_rng(seed).integers(0, 21, size=(n, 4), dtype=np.int16) # Random marks
+    store.extend([str(100000 + i) for i in range(n)], [make_name(rng) for _ in range(n)], marks) # Bulk load
+    return store # Return store
+
+def first_page(store, matches, students=10): # Define first screen of results
+    return [store.record(matches[i]) for i in range(min(students, len(matches)))] # Records the terminal shows first
+
+def type_out(store, queries): # Define search-as-you-type simulation
+    samples = [] # Keystroke times (ms)
+    for query in queries: # Each search
+        for end in range(1, len(query) + 1): # Each keystroke
+            t0 = time.perf_counter() # Start timer
+            first_page(store, store.find_names(query[:end])) # Search and fetch the first page
+            samples.append((time.perf_counter() - t0) * 1000) # Record time
+    return samples # Return samples
+
+def report(label, samples): # Define latency line
+    print(f"{label:<22}{len(samples):>6} keystrokes  p50={percentile(samples, 50):.3f} ms  p99={percentile(samples, 99):.3f} ms  max={max(samples):.3f} ms") # Summary
+
+def main(): # Define benchmark entry
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000 # Class size
+    store = build(n) # Fake class
+    rng = random.Random(2) # Query picker
+    names = [store.names[rng.randrange(n)] for _ in range(50)] # Names staff might look for
+    print(f"{n:,} students") # Setup
+
+    for fuzzy in (False, True): # Prefix index alone, then with n-grams
+        store.name_index = None # Drop previous index
+        tracemalloc.start() # Start tracing
+        store.build_name_index(fuzzy) # Build once for memory
+        size = tracemalloc.get_traced_memory()[0] # Retained bytes
+        tracemalloc.stop() # Stop tracing (it slows the build down)
+        store.name_index = None # Drop traced index
+        t0 = time.perf_counter() # Start timer
+        store.build_name_index(fuzzy) # Build again for time
+        elapsed = time.perf_counter() - t0 # Build time
+        print(f"\nindex {'prefix + n-gram' if fuzzy else 'prefix only'}: built in {elapsed:.2f}s, {size / 2**20:.0f}MB") # Build cost
+        report("full name prefix", type_out(store, names)) # Typing first names
+        report("surname prefix", type_out(store, [name.split()[1] for name in names])) # Typing last names
+        if fuzzy: # N-gram searches
+            report("substring", type_out(store, [name.lower()[2:9] for name in names])) # Middle of a name
+            report("misspelled", type_out(store, [name[:3] + "x" + name[4:] for name in names])) # One wrong letter
+
+    t0 = time.perf_counter() # Start timer
+    for i in range(1000): # Edits with the index live
+        store.update(store.ids[i], store.ids[i], make_name(rng), 10, 10, 10, 50) # Rename
+    print(f"\nrename with index: {(time.perf_counter() - t0):.3f} ms each") # 1000 edits, so seconds = ms each
+
+if __name__ == "__main__": # Main entry check
+    main() # Run benchmark
@@ -0,0 +1,99 @@
+import os # Import os module
+import math # Import math module
+import sys # Import sys module
+import random # Import random module
+import tempfile # Import tempfile module
+import numpy as np # Import numpy library
+from student_store import StudentStore # Import columnar student store
+from student_sqlite import SqliteStore # Import SQLite student store
+from student_files import snapshot_blocks # Import data file formatter
+from search_bench import make_name # Import fake name generator
+
+ORDERS = (None, "asc", "desc") # row_at orders compared
+
+def random_marks(rng): # Define random C1, C2, C3, Exam
+    return rng.randint(0, 20), rng.randint(0, 20), rng.randint(0, 20), rng.randint(0, 100) # Marks
+
+def edit(stores, rng, n): # Define one random edit applied to every store
+    ids = [record["id"] for record in stores[0].records()] # Live IDs
+    op = rng.random() # Pick an operation
+    if op < 0.3 or not ids: # Add
+        row = (f"a{n}", make_name(rng)) + random_marks(rng) # New student
+        for store in stores: store.add(*row) # Same add
+    elif op < 0.55: # Update, sometimes the ID too
+        old_id = rng.choice(ids) # Target
+        row = (f"u{n}" if rng.random() < 0.2 else old_id, make_name(rng)) + random_marks(rng) # New values
+        for store in stores: store.update(old_id, *row) # Same update
+    elif op < 0.65: # Upsert an existing or new ID
+        row = (rng.choice(ids) if rng.random() < 0.5 else f"p{n}", make_name(rng)) + random_marks(rng) # Overwrite or insert
+        for store in stores: store.upsert(*row) # Same upsert
+    elif op < 0.85: # Delete
+        s_id = rng.choice(ids) # Target
+        for store in stores: store.delete(s_id) # Same delete
+    else: # Batched bulk append with repeats
+        block_ids = [f"b{n}_{i}" for i in range(rng.randint(1, 40))] + rng.sample(ids, min(3, len(ids))) # New IDs plus repeats
+        names = [make_name(rng) for _ in block_ids] # Names
+        marks = np.array([random_marks(rng) for _ in block_ids], np.int16) # Marks
+        for store in stores: # Each store
+            with store.batch(): store.extend(block_ids, names, marks) # Same import
+
+def word_prefixes(store, rng): # Define searches both stores answer with the prefix rule
+    names = [record["name"] for record in store.records()] # Live names
+    words = [word for name in rng.sample(names, min(10, len(names))) for word in name.split()] # Words of a few students
+    return sorted({word[:rng.randint(1, len(word))] for word in words} | {name[:name.find(" ") + 2] for name in names[:3]}) # Word starts and "First L"
+
+def summary(store, queries): # Define everything both stores must agree on
+    ids = lambda records: [record["id"] for record in records] # Record IDs
+    records = list(store.records()) # File order
+    return { # Name -> value
+        "count": len(store), # Live rows
+        "records": records, # Every record, file order
+        "ascending": ids(store.sorted_records()), # Low to high, ties in file order
+        "descending": ids(store.sorted_records(reverse=True)), # High to low, ties in file order
+        "top": ids(store.top(10)), # Highest 10
+        "bottom": ids(store.bottom(10)), # Lowest 10
+        "highest": (store.highest() or {}).get("id"), # Top scorer
+        "lowest": (store.lowest() or {}).get("id"), # Bottom scorer
+        "rank": [store.rank(record["id"]) for record in records], # Every rank
+        "row_at": [store.record(store.row_at(i, order))["id"] for order in ORDERS for i in range(0, len(store), 7)], # Positional access
+        "stats": store.stats(), # Class summary
+        "results": [row for rows in store.result_blocks(1000) for row in rows], # Export columns
+        "names": [sorted(store.record(row)["id"] for row in store.find_names(query)) for query in queries], # Search hits
+        "existing": sorted(store.existing([record["id"] for record in records[::5]] + ["missing"])), # Bulk membership
+    } # Summary
+
+def same(a, b): # Define equality that allows float rounding (SQLite sums in a different order than numpy)
+    if isinstance(a, float) or isinstance(b, float): return math.isclose(a, b, rel_tol=1e-12, abs_tol=1e-12) # Last-bit differences
+    if isinstance(a, dict): return isinstance(b, dict) and a.keys() == b.keys() and all(same(a[k], b[k]) for k in a) # Key by key
+    if isinstance(a, (list, tuple)): return isinstance(b, (list, tuple)) and len(a) == len(b) and all(map(same, a, b)) # Item by item
+    return a == b # Plain values
+
+def text(store): # Define data file text of a store
+    if isinstance(store, SqliteStore): return "".join(store.text_blocks()) # Database export
+    return "".join(snapshot_blocks(store.snapshot())) # Memory snapshot
+
+def main(): # Define parity run entry
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000 # Random edits
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 1 # Random seed
+    rng = random.Random(seed) # Reproducible run
+    with tempfile.TemporaryDirectory() as folder: # Throwaway database
+        memory, sqlite = StudentStore(), SqliteStore(os.path.join(folder, "parity.db")) # Stores under test
+        memory.build_name_index() # Prefix search for the memory store
+        stores = (memory, sqlite) # Same edits to both
+        try: # Try block
+            for n in range(operations): # Loop edits
+                edit(stores, rng, n) # Apply one edit
+                if n % 250 == 0 or n == operations - 1: # Compare every 250 edits and at the end
+                    queries = word_prefixes(memory, rng) # Same searches for both
+                    want, got = summary(memory, queries), summary(sqlite, queries) # Both summaries
+                    failed = [name for name in want if not same(want[name], got[name])] + (["text"] if text(memory) != text(sqlite) else []) # Differences
+                    if failed: # Mismatch
+                        print(f"operation {n}: {', '.join(failed)} differ (seed {seed})") # Report
+                        return 1 # Failure
+        finally: # Always
+            sqlite.close() # Close database
+    print(f"{operations:,} operations, {len(memory):,} students: SqliteStore matches StudentStore") # Summary
+    return 0 # Success
+
+if __name__ == "__main__": # Main entry check
+    sys.exit(main()) # Run parity check
@@ -0,0 +1,63 @@
+import sys # Import sys module
+import time # Import time module
+import random # Import random module
+import tracemalloc # Import memory tracer
+from student_store import StudentStore, GRADES, grade_code, MAX_TOTAL # Import columnar student store
+
+def synthetic_rows(n, seed=1): # Define fake class generator
+    rng = random.Random(seed) # Reproducible marks
+    for i in range(n): # Loop students
+        yield str(100000 + i), f"Student {i}", rng.randint(0, 20), rng.randint(0, 20), rng.randint(0, 20), rng.randint(0, 100) # ID, name, marks
+
+def build_dicts(n): # Define old list-of-dicts layout
+    students = [] # Student list
+    for s_id, name, c1, c2, c3, exam in synthetic_rows(n): # Loop rows
+        parts = [s_id, name, str(c1), str(c2), str(c3), str(exam)] # Raw file fields
+        total = c1 + c2 + c3 + exam # Total score
+        percent = (total / MAX_TOTAL) * 100 # Percentage
+        students.append({"id": s_id, "name": name, "c_total": c1 + c2 + c3, "exam": exam, # Same dict as load_data used
+                         "total": total, "percent": percent, "grade": GRADES[grade_code(percent)], "raw_parts": parts}) # Totals and grade
+    return students # Return list
+
+def build_store(n): # Define columnar layout
+    store = StudentStore() # Empty store
+    for row in synthetic_rows(n): store.add(*row) # Add rows
+    return store # Return store
+
+def measure(build, n): # Define memory measurement
+    tracemalloc.start() # Start tracing
+    t0 = time.perf_counter() # Start timer
+    data = build(n) # Build structure
+    elapsed = time.perf_counter() - t0 # Build time
+    peak = tracemalloc.get_traced_memory()[0] # Retained bytes
+    tracemalloc.stop() # Stop tracing
+    return data, peak, elapsed # Return results
+
+def lookup_dicts(students, s_id): # Define old linear lookup
+    for s in students: # Loop through students
+        if s['id'] == s_id: return s # Check ID match
+    return None # Not found
+
+def main(): # Define benchmark entry
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000 # Class size
+    probes = [str(100000 + random.randrange(n)) for _ in range(20)] # IDs to look up
+
+    students, dict_bytes, dict_time = measure(build_dicts, n) # Old layout
+    t0 = time.perf_counter() # Start timer
+    for s_id in probes: lookup_dicts(students, s_id) # Linear scans
+    dict_lookup = (time.perf_counter() - t0) / len(probes) # Per lookup
+    del students # Free memory
+
+    store, store_bytes, store_time = measure(build_store, n) # New layout
+    t0 = time.perf_counter() # Start timer
+    for _ in range(1000): # Repeat for resolution
+        for s_id in probes: store.get(s_id) # Hash lookups
+    store_lookup = (time.perf_counter() - t0) / (len(probes) * 1000) # Per lookup
+
+    print(f"{n:,} students") # Setup
+    print(f"{'layout':<14}{'memory':>12}{'per row':>10}{'build':>10}{'lookup':>14}") # Header
+    print(f"{'dict list':<14}{dict_bytes / 2**20:>10.1f}MB{dict_bytes / n:>9.0f}B{dict_time:>9.2f}s{dict_lookup * 1e3:>11.3f} ms") # Old row
+    print(f"{'columnar+hash':<14}{store_bytes / 2**20:>10.1f}MB{store_bytes / n:>9.0f}B{store_time:>9.2f}s{store_lookup * 1e3:>11.3f} ms") # New row
+
+if __name__ == "__main__": # Main entry check
+    main() # Run benchmark
@@ -0,0 +1,86 @@
+import sys # Import sys module
+import random # Import random module
+from collections import Counter # Import Counter class
+import numpy as np # Import numpy library
+from student_store import StudentStore # Import columnar student store
+
+def random_marks(rng): # Define random C1, C2, C3, Exam
+    return rng.randint(0, 20), rng.randint(0, 20), rng.randint(0, 20), rng.randint(0, 100) # Marks
+
+def step(store, model, rng, n): # Define one random edit applied to both
+    op = rng.random() # Pick an operation
+    ids = list(model) # Live IDs in file order
+    if op < 0.35 or not ids: # Add
+        s_id = f"a{n}" # New ID
+        model[s_id] = (f"Student {n}",) + random_marks(rng) # Model row
+        store.add(s_id, *model[s_id]) # Store row
+    elif op < 0.6: # Update marks, sometimes the ID too
+        old_id = rng.choice(ids) # Target
+        new_id = f"u{n}" if rng.random() < 0.2 else old_id # Renamed or not
+        row = (f"Renamed {n}",) + random_marks(rng) # New values
+        store.update(old_id, new_id, *row) # Store update
+        model = {new_id if k == old_id else k: row if k == old_id else v for k, v in model.items()} # Same place in file order
+    elif op < 0.8: # Delete
+        s_id = rng.choice(ids) # Target
+        store.delete(s_id) # Store delete
+        del model[s_id] # Model delete
+    elif op < 0.95: # Bulk append in blocks, like an import
+        block_ids = [f"b{n}_{i}" for i in range(rng.randint(1, 30))] + rng.sample(ids, min(3, len(ids))) # New IDs plus a few repeats
+        marks = np.array([random_marks(rng) for _ in block_ids], np.int16) # Block marks
+        with store.batch(): # One merge for the batch
+            for cut in range(0, len(block_ids), 10): # Several extends
+                store.extend(block_ids[cut:cut + 10], [f"Bulk {s_id}" for s_id in block_ids[cut:cut + 10]], marks[cut:cut + 10]) # Append block
+        for s_id, row in zip(block_ids, marks.tolist()): # Repeats keep the first row
+            if s_id not in model: model[s_id] = (f"Bulk {s_id}",) + tuple(row) # Model append
+    else: # Failed batch rolls back
+        try: # Try block
+            with store.batch(): # Batch that raises
+                store.extend([f"r{n}_{i}" for i in range(20)], ["Rolled Back"] * 20, np.ones((20, 4), np.int16)) # Append block
+                raise KeyboardInterrupt # Abort it
+        except KeyboardInterrupt: # Expected
+            pass # Nothing kept
+    return model # Updated model
+
+def expected(model): # Define brute-force score order
+    totals = [(s_id, sum(row[1:])) for s_id, row in model.items()] # ID and total in file order
+    ascending = [s_id for s_id, _ in sorted(totals, key=lambda item: item[1])] # Stable sort: ties in file order
+    descending = [s_id for s_id, _ in sorted(totals, key=lambda item: -item[1])] # Stable sort: ties in file order
+    per_total = Counter(total for _, total in totals) # Students per total
+    ranks = {s_id: 1 + sum(count for other, count in per_total.items() if other > total) for s_id, total in totals} # Competition rank
+    return ascending, descending, ranks # Orders and ranks
+
+def compare(store, model): # Define store vs brute force
+    ascending, descending, ranks = expected(model) # Reference answers
+    ids = lambda records: [record["id"] for record in records] # Record IDs
+    checks = { # Name -> (got, want)
+        "count": (len(store), len(model)), # Live rows
+        "records": ([(r["id"], r["name"], *map(int, r["raw_parts"][2:])) for r in store.records()], [(k,) + v for k, v in model.items()]), # File order
+        "ascending": (ids(store.sorted_records()), ascending), # Low to high
+        "descending": (ids(store.sorted_records(reverse=True)), descending), # High to low
+        "top": (ids(store.top(10)), descending[:10]), # Highest 10
+        "bottom": (ids(store.bottom(10)), ascending[:10]), # Lowest 10
+        "highest": ((store.highest() or {}).get("id"), descending[0] if descending else None), # Top scorer
+        "lowest": ((store.lowest() or {}).get("id"), ascending[0] if ascending else None), # Bottom scorer
+        "rank": ([store.rank(s_id) for s_id in model], [ranks[s_id] for s_id in model]), # Ranks
+        "row_at asc": ([store.ids[store.row_at(i, "asc")] for i in range(len(model))], ascending), # Positional ascending
+        "row_at desc": ([store.ids[store.row_at(i, "desc")] for i in range(len(model))], descending), # Positional descending
+    } # All checks
+    return [name for name, (got, want) in checks.items() if got != want] # Failed checks
+
+def main(): # Define check entry
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 6000 # Random edits
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 1 # Random seed
+    rng = random.Random(seed) # Reproducible run
+    store, model = StudentStore(), {} # Store under test and dict model
+    for n in range(operations): # Loop edits
+        model = step(store, model, rng, n) # Apply one edit to both
+        if n % 50 == 0 or n == operations - 1: # Check every 50 edits and at the end
+            failed = compare(store, model) # Compare
+            if failed: # Mismatch
+                print(f"operation {n}: {', '.join(failed)} differ (seed {seed})") # Report
+                return 1 # Failure
+    print(f"{operations:,} operations, {len(store):,} students: score order, ranks and records match brute force") # Summary
+    return 0 # Success
+
+if __name__ == "__main__": # Main entry check
+    sys.exit(main()) # Run check
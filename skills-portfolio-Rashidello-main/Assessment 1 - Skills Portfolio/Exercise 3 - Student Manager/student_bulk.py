@@ -0,0 +1,190 @@
+import io # Import io module
+import os # Import os module
+import csv # Import csv module
+import sys # Import sys module
+import time # Import time module
+import warnings # Import warnings module
+import argparse # Import argparse module
+import numpy as np # Import numpy library
+from student_store import StudentStore, MARK_RANGE, marks_valid # Import columnar student store and mark rule
+from student_files import data_path, read_blocks, atomic_write, load_file, save_snapshot, format_lines # Import file helpers
+from student_journal import ChangeJournal # Import change journal
+from student_sqlite import SqliteStore, db_path # Import SQLite student store
+
+EXPORT_HEADER = ("ID", "Name", "C1", "C2", "C3", "Exam", "Coursework", "Total", "Percent", "Grade") # Export columns
+EXPORT_ROWS = 65536 # Rows written per export block
+MAX_ERRORS = 20 # Rejected rows listed in a report
+IMPORT_CHUNK = 1 << 20 # Bytes of CSV validated per step (about 35,000 rows)
+
+def new_report(): # Define empty import report
+    return {"rows": 0, "imported": 0, "rejected": 0, "errors": [], "seconds": 0.0} # Counters
+
+def reject(report, line, reason): # Define rejected row
+    report["rejected"] += 1 # Count it
+    if len(report["errors"]) < MAX_ERRORS: report["errors"].append((line, reason)) # Keep the first few
+
+def parse_marks(fields, rows): # Define mark text -> int array
+    marks = np.zeros((rows, 4), np.int64) # Parsed marks
+    ok = np.ones(rows, bool) # Rows parsed
+    try: # Fast path: numpy parses the whole block in C
+        with warnings.catch_warnings(): # Older numpy only warns
+            warnings.simplefilter("error", DeprecationWarning) # Treat partial parses as failures
+            values = np.fromstring(",".join(fields), dtype=np.int64, sep=",") # Parse marks
+        if len(values) != rows * 4: raise ValueError("short parse") # Missing fields
+        marks[:] = values.reshape(-1, 4) # Store marks
+    except (ValueError, DeprecationWarning): # A bad mark somewhere in the block
+        for row in range(rows): # Parse rows one by one
+            try: marks[row] = [int(value) for value in fields[row * 4:row * 4 + 4]] # Python int() rules
+            except (ValueError, OverflowError): ok[row] = False # Non-numeric mark
+    return marks, ok # Marks and parse mask
+
+def check_rows(reader, first_line, store, report): # Define validation of one block of CSV rows
+    ids, names, fields, lines = [], [], [], [] # Candidate rows
+    for row in reader: # Loop rows
+        if not row: continue # Blank line
+        line = first_line + reader.line_num # File line of this row
+        report["rows"] += 1 # Count it
+        if len(row) != 6: # Wrong shape
+            reject(report, line, f"expected 6 fields, found {len(row)}") # Reject
+            continue # Next row
+        s_id, name = row[0].strip(), row[1].strip() # ID and Name
+        if not s_id or not name: reject(report, line, "missing ID or name") # Reject
+        elif "," in s_id or "," in name: reject(report, line, "commas are not allowed in the ID or name") # Would break studentMarks.txt
+        else: # Keep for mark checks
+            ids.append(s_id) # Store ID
+            names.append(name) # Store name
+            fields += [value.strip() for value in row[2:6]] # Store mark text
+            lines.append(line) # Store line
+    marks, ok = parse_marks(fields, len(ids)) # Parse marks
+    in_range = marks_valid(marks) # Range check
+    known = store.existing(ids) # IDs already in the store, including earlier blocks
+    seen = set() # IDs kept from this block
+    keep = [] # Rows that pass
+    for n, s_id in enumerate(ids): # Loop candidates
+        if not ok[n]: reject(report, lines[n], "marks must be whole numbers") # Reject
+        elif not in_range[n]: reject(report, lines[n], f"marks out of range ({MARK_RANGE})") # Reject
+        elif s_id in known or s_id in seen: reject(report, lines[n], f"duplicate student ID {s_id}") # Reject
+        else: # Valid row
+            seen.add(s_id) # Remember ID
+            keep.append(n) # Keep row
+    return [ids[n] for n in keep], [names[n] for n in keep], marks[keep].astype(np.int16) # Valid columns
+
+def journal_rows(store, journal, start): # Define journal entries for rows added since start
+    text, entries = [], 0 # Formatted blocks and their row count
+    for ids, names, marks in store.added_blocks(start, EXPORT_ROWS): # Live rows from the batch
+        text.append(format_lines(ids, names, marks, "A,")) # Same entries as single adds
+        entries += len(ids) # Count them
+    journal.append_lines("".join(text), entries) # One durable append for the whole import
+
+def import_csv(path, store, progress=None, journal=None): # Define streaming CSV import
+    t0 = time.perf_counter() # Start timer
+    report = new_report() # Counters
+    start = store.size if journal else 0 # First row the import adds (text backend)
+    size = os.path.getsize(path) or 1 # Bytes to read
+    line_offset = 0 # Lines before the current block
+    with store.batch(), open(path, "rb") as f: # One transaction, streamed file
+        for text in read_blocks(f, chunk=IMPORT_CHUNK): # Whole-line blocks of bounded size
+            lines = text.splitlines() # Block lines
+            if not line_offset and lines and lines[0].lstrip("\ufeff").split(",")[0].strip().lower() == "id": # Header row
+                lines[0] = "" # Skip it
+            ids, names, marks = check_rows(csv.reader(lines), line_offset, store, report) # Validate block
+            line_offset += len(lines) # Lines done
+            store.extend(ids, names, marks) # Merge block
+            report["imported"] += len(ids) # Count rows
+            report["seconds"] = time.perf_counter() - t0 # Time so far
+            if progress: progress(f.tell() / size, report) # Report progress
+        if journal and report["imported"]: journal_rows(store, journal, start) # Durable before the data file is rewritten
+    report["errors"].sort() # Errors in file order
+    report["seconds"] = time.perf_counter() - t0 # Total time
+    return report # Return report
+
+def export_csv(path, store, progress=None): # Define streaming CSV export
+    t0 = time.perf_counter() # Start timer
+    report = {"rows": 0, "seconds": 0.0} # Counters
+    total = len(store) or 1 # Rows to write
+
+    def blocks(): # Define CSV text in blocks
+        buffer = io.StringIO() # Block buffer
+        writer = csv.writer(buffer, lineterminator="\n") # CSV writer
+        writer.writerow(EXPORT_HEADER) # Header row
+        for rows in store.result_blocks(EXPORT_ROWS): # Bounded blocks from the store
+            writer.writerows(rows) # Format block
+            yield buffer.getvalue() # Hand block to the writer
+            buffer.seek(0) # Reuse buffer
+            buffer.truncate() # Empty it
+            report["rows"] += len(rows) # Count rows
+            report["seconds"] = time.perf_counter() - t0 # Time so far
+            if progress: progress(report["rows"] / total, report) # Report progress
+        yield buffer.getvalue() # Header only when the store is empty
+
+    atomic_write(path, blocks()) # Temp file, fsync, rename
+    report["seconds"] = time.perf_counter() - t0 # Total time
+    return report # Return report
+
+def rate(report): # Define rows per second
+    return report["rows"] / report["seconds"] if report["seconds"] else 0.0 # Throughput
+
+def format_import(report, path): # Define import summary text
+    lines = [f"--- BULK IMPORT: {os.path.basename(path)} ---", "", # Title
+             f"Rows read: {report['rows']:,} | Imported: {report['imported']:,} | Rejected: {report['rejected']:,}", # Counts
+             f"Time: {report['seconds']:.2f}s ({rate(report):,.0f} rows/sec)"] # Speed
+    if report["errors"]: lines += ["", "Rejected rows:"] + [f"   line {line}: {reason}" for line, reason in report["errors"]] # First errors
+    if report["rejected"] > len(report["errors"]): lines.append(f"   ... and {report['rejected'] - len(report['errors']):,} more") # Rest
+    if report.get("saved") is False: lines += ["", "Saving the data file failed: the imported rows are kept in the change journal", # Save error
+                                               "and will be written to the data file at the next save."] # Nothing lost
+    return "\n".join(lines) # Return text
+
+def format_export(report, path): # Define export summary text
+    return (f"--- BULK EXPORT: {os.path.basename(path)} ---\n\n" # Title
+            f"Rows written: {report['rows']:,}\nTime: {report['seconds']:.2f}s ({rate(report):,.0f} rows/sec)") # Count and speed
+
+def format_progress(label, path, done, report): # Define progress text
+    return (f"--- {label}: {os.path.basename(path)} ---\n\n{done * 100:.0f}% | {report['rows']:,} rows" # Position
+            f" | {rate(report):,.0f} rows/sec") # Speed
+
+def open_store(sqlite): # Define store setup for the CLI
+    if sqlite: # Database
+        store = SqliteStore(db_path()) # Open database
+        if not len(store) and os.path.exists(data_path()): store.import_text(data_path()) # First run
+        return store, None # No journal
+    store = StudentStore() # Empty store
+    load_file(data_path(), store) # Load data file
+    journal = ChangeJournal(data_path() + ".journal") # Same journal as the GUI
+    journal.replay(store) # Apply edits since the last compaction
+    return store, journal # Store and journal
+
+def main(): # Define CLI entry
+    parser = argparse.ArgumentParser(description="Bulk import or export student marks as CSV") # Create parser
+    parser.add_argument("command", choices=("import", "export"), help="import ID,Name,C1,C2,C3,Exam rows, or export marks with totals, percent and grade") # Command
+    parser.add_argument("csv", help="CSV file to read or write") # CSV file
+    parser.add_argument("--sqlite", action="store_true", help="use studentMarks.db instead of studentMarks.txt") # Backend
+    args = parser.parse_args() # Parse arguments
+    store, journal = open_store(args.sqlite) # Open store
+    label = "IMPORT" if args.command == "import" else "EXPORT" # Progress label
+    show = lambda done, report: print("\r" + format_progress(label, args.csv, done, report).split("\n")[-1], end="", file=sys.stderr, flush=True) # Progress line
+    try: # Try block
+        if args.command == "import": # CSV -> store
+            report = import_csv(args.csv, store, show, journal) # Import, journaling the rows on the text backend
+            if journal and report["imported"]: # Text backend: one write of the whole class
+                offset, entries = journal.mark() # Journal position covered by the snapshot
+                try: # Try block
+                    save_snapshot(data_path(), store.snapshot()) # Temp file, fsync, rename
+                    report["saved"] = True # Saved
+                except OSError as e: # Disk full, permissions...
+                    print(f"\nSave error: {e}", file=sys.stderr) # Report
+                    report["saved"] = False # Rows stay in the journal
+                if report["saved"]: journal.trim(offset, entries) # Edits now in the data file
+            text = format_import(report, args.csv) # Summary
+        else: # Store -> CSV
+            text = format_export(export_csv(args.csv, store, show), args.csv) # Export
+    except OSError as e: # File problems
+        print(f"\nError: {e}", file=sys.stderr) # Report
+        return 2 # Failure
+    finally: # Always
+        if journal: journal.close() # Close journal
+        if args.sqlite: store.close() # Close database
+    print("\n" + text) # Summary
+    return 1 if args.command == "import" and (report["rejected"] or report.get("saved") is False) else 0 # Non-zero when rows were rejected or not saved
+
+if __name__ == "__main__": # Main entry check
+    sys.exit(main()) # Run CLI
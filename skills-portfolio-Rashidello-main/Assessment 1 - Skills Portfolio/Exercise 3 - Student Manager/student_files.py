@@ -0,0 +1,135 @@
+import os # Import os module
+import time # Import time module
+import warnings # Import warnings module
+import tempfile # Import tempfile module
+import numpy as np # Import numpy library
+from student_store import marks_valid # Import mark range check
+from concurrent.futures import ProcessPoolExecutor # Import process pool
+
+DATA_FILE = "studentMarks.txt" # Data file name
+WRITE_BUFFER = 1 << 20 # Bytes buffered per write
+BLOCK_ROWS = 65536 # Rows formatted per write
+PARSE_BATCH = 4096 # Rows converted per numpy call
+READ_CHUNK = 8 << 20 # Bytes parsed per step
+PARALLEL_BYTES = 64 << 20 # Files above this are parsed in a process pool
+
+def data_path(folder=None): # Define data file location
+    if folder is None: folder = os.path.dirname(os.path.abspath(__file__)) # Script folder, not the CWD
+    return os.path.join(folder, DATA_FILE) # Build file path
+
+def format_lines(ids, names, marks, prefix=""): # Define data file body (or journal entries, with prefix "A,")
+    return "".join(map((prefix + "{},{},{},{},{},{}\n").format, ids, names, *marks.T.tolist())) # Column lists avoid a tuple per row
+
+def snapshot_blocks(snapshot): # Define header + body in blocks
+    ids, names, marks = snapshot # Unpack snapshot
+    yield str(len(ids)) + "\n" # Count header always matches the rows written
+    for start in range(0, len(ids), BLOCK_ROWS): # Loop blocks
+        end = start + BLOCK_ROWS # Block end
+        yield format_lines(ids[start:end], names[start:end], marks[start:end]) # Formatted block
+
+def atomic_write(path, blocks): # Define crash-safe file replace
+    folder = os.path.dirname(os.path.abspath(path)) # Same directory so rename is atomic
+    fd, tmp_path = tempfile.mkstemp(prefix="." + os.path.basename(path) + ".", suffix=".tmp", dir=folder) # Temp file
+    try: # Try block
+        with open(fd, "w", buffering=WRITE_BUFFER, encoding="utf-8", newline="") as f: # Large buffered UTF-8 writer, "\n" kept as written
+            for block in blocks: f.write(block) # Write blocks
+            f.flush() # Push to OS
+            os.fsync(f.fileno()) # Push to disk
+        os.replace(tmp_path, path) # Atomic swap
+    except BaseException: # Any failure
+        os.unlink(tmp_path) # Old file is untouched
+        raise # Re-raise
+    if hasattr(os, "O_DIRECTORY"): # POSIX
+        dir_fd = os.open(folder, os.O_RDONLY | os.O_DIRECTORY) # Open folder
+        try: # Try block
+            os.fsync(dir_fd) # Persist the rename
+        finally: # Always
+            os.close(dir_fd) # Close folder
+
+def save_snapshot(path, snapshot): # Define full data file save
+    atomic_write(path, snapshot_blocks(snapshot)) # Header + students, all or nothing
+
+def parse_lines(text): # Define block parser
+    ids, names, fields = [], [], [] # Parsed columns
+    malformed = 0 # Bad lines
+    for line in text.splitlines(): # Loop lines
+        parts = line.strip().split(',') # Split line by comma
+        if len(parts) < 6: # Too few fields
+            if parts != [""]: malformed += 1 # Blank lines are not errors
+            continue # Skip line
+        ids.append(parts[0]) # Store ID
+        names.append(parts[1]) # Store name
+        fields += parts[2:6] # Store mark text
+    rows = len(ids) # Rows with six fields
+    marks = np.zeros((rows, 4), np.int64) # Parsed marks
+    ok = np.ones(rows, bool) # Rows parsed
+    for start in range(0, rows, PARSE_BATCH): # Loop batches
+        end = min(rows, start + PARSE_BATCH) # Batch end
+        try: # Fast path: numpy parses the whole batch in C
+            with warnings.catch_warnings(): # Older numpy only warns
+                warnings.simplefilter("error", DeprecationWarning) # Treat partial parses as failures
+                values = np.fromstring(",".join(fields[start * 4:end * 4]), dtype=np.int64, sep=",") # Parse marks
+            if len(values) != (end - start) * 4: raise ValueError("short parse") # Missing fields
+            marks[start:end] = values.reshape(-1, 4) # Store batch
+        except (ValueError, DeprecationWarning): # A bad mark somewhere in the batch
+            for row in range(start, end): # Parse rows one by one
+                try: marks[row] = [int(value) for value in fields[row * 4:row * 4 + 4]] # Python int() rules
+                except (ValueError, OverflowError): ok[row] = False # Non-numeric mark
+    ok &= marks_valid(marks) # Column ranges
+    if not ok.all(): # Drop bad rows
+        malformed += int((~ok).sum()) # Count them
+        keep = np.flatnonzero(ok).tolist() # Good rows
+        ids, names, marks = [ids[i] for i in keep], [names[i] for i in keep], marks[ok] # Filter columns
+    return ids, names, marks.astype(np.int16), malformed # Columns and bad-line count
+
+def read_blocks(f, end=None, chunk=READ_CHUNK): # Define whole-line block reader
+    rest = b"" # Partial line carried over
+    while True: # Loop reads
+        size = chunk if end is None else min(chunk, end - f.tell()) # Bytes to read
+        data = f.read(size) if size > 0 else b"" # Read chunk
+        if not data: break # Done
+        data = rest + data # Prepend carry
+        cut = data.rfind(b"\n") + 1 # End of last full line
+        rest = data[cut:] # Keep partial line
+        if cut: yield data[:cut].decode("utf-8", "replace") # Whole lines
+    if rest: yield rest.decode("utf-8", "replace") # Last line without newline
+
+def parse_range(path, start, end): # Define worker task
+    with open(path, "rb") as f: # Open file
+        f.seek(start) # Jump to range
+        if start == 0: f.readline() # Skip count header
+        parts = [parse_lines(text) for text in read_blocks(f, end)] # Parse blocks
+    ids = [s_id for block in parts for s_id in block[0]] # Merge IDs
+    names = [name for block in parts for name in block[1]] # Merge names
+    marks = np.concatenate([block[2] for block in parts]) if parts else np.zeros((0, 4), np.int16) # Merge marks
+    return ids, names, marks, sum(block[3] for block in parts) # Range result
+
+def split_ranges(path, pieces): # Define line-aligned byte ranges
+    size = os.path.getsize(path) # File size
+    cuts = [0] # Range starts
+    with open(path, "rb") as f: # Open file
+        for k in range(1, pieces): # Inner cuts
+            f.seek(size * k // pieces) # Approximate cut
+            f.readline() # Move to next line start
+            if f.tell() > cuts[-1]: cuts.append(f.tell()) # Keep increasing cuts
+    return list(zip(cuts, cuts[1:] + [size])) # (start, end) pairs
+
+def load_file(path, store, jobs=None): # Define data file loader
+    t0 = time.perf_counter() # Start timer
+    malformed = duplicates = 0 # Counters
+    if jobs is None: jobs = os.cpu_count() or 1 # Worker count
+    if jobs > 1 and os.path.getsize(path) > PARALLEL_BYTES: # Big file, several cores
+        with store.batch(), ProcessPoolExecutor(max_workers=jobs) as pool: # One merge of the indexes, start workers
+            futures = [pool.submit(parse_range, path, a, b) for a, b in split_ranges(path, jobs * 4)] # Parse ranges
+            for future in futures: # In file order
+                ids, names, marks, bad = future.result() # Range result
+                malformed += bad # Count bad lines
+                duplicates += store.extend(ids, names, marks) # Merge into store
+    else: # Stream in this process
+        with store.batch(), open(path, "rb") as f: # One merge of the indexes, open file
+            f.readline() # Skip count header
+            for text in read_blocks(f): # Loop blocks
+                ids, names, marks, bad = parse_lines(text) # Parse block
+                malformed += bad # Count bad lines
+                duplicates += store.extend(ids, names, marks) # Merge into store
+    return {"rows": len(store), "malformed": malformed, "duplicates": duplicates, "seconds": time.perf_counter() - t0} # Load report
@@ -0,0 +1,79 @@
+import os # Import os module
+import threading # Import threading module
+from student_store import parse_record # Import line parser
+
+COMPACT_EVERY = 1000 # Journal entries before folding them back into the data file
+
+def apply_entry(store, fields): # Define one journal entry replay
+    op = fields[0] # Operation code
+    if op == "A": # Add
+        store.upsert(*parse_record(",".join(fields[1:]))) # Insert or overwrite
+    elif op == "U": # Update
+        old_id, record = fields[1], parse_record(",".join(fields[2:])) # Old ID and new record
+        if old_id in store and (record[0] == old_id or record[0] not in store): store.update(old_id, *record) # Update in place
+        else: # Already applied or old row gone
+            store.delete(old_id) # Drop old ID if still there
+            store.upsert(*record) # Insert or overwrite
+    elif op == "D": # Delete
+        store.delete(fields[1]) # Remove if present
+    else: # Unknown
+        raise ValueError(f"Unknown journal entry {op}") # Bad line
+
+class ChangeJournal: # Define append-only change log
+    def __init__(self, path): # Initialize journal
+        self.path = path # Journal file path
+        self.lock = threading.Lock() # Guards the file against the compactor
+        self.entries = 0 # Entries not yet in the data file
+        self.file = open(path, "a", encoding="utf-8") # Append handle
+
+    def replay(self, store): # Define startup replay
+        skipped = 0 # Torn or bad lines
+        with open(self.path, "r", encoding="utf-8") as f: # Open journal
+            for line in f: # Loop entries
+                if not line.endswith("\n"): # Torn write from a crash
+                    skipped += 1 # Count it
+                    continue # Skip it
+                try: # Try block
+                    apply_entry(store, line.rstrip("\n").split(",")) # Apply entry
+                    self.entries += 1 # Count it
+                except (ValueError, TypeError, IndexError): # Malformed entry
+                    skipped += 1 # Count it
+        return self.entries, skipped # Return counts
+
+    def append(self, *fields): # Define durable append
+        with self.lock: # Exclusive access
+            self.file.write(",".join(fields) + "\n") # Write entry
+            self.file.flush() # Push to OS
+            os.fsync(self.file.fileno()) # Push to disk
+            self.entries += 1 # Count it
+
+    def append_lines(self, text, entries): # Define durable append of a formatted batch
+        with self.lock: # Exclusive access
+            self.file.write(text) # Write entries
+            self.file.flush() # Push to OS
+            os.fsync(self.file.fileno()) # One fsync for the batch
+            self.entries += entries # Count them
+
+    def mark(self): # Define compaction start point
+        with self.lock: # Exclusive access
+            self.file.flush() # Push to OS
+            return self.file.tell(), self.entries # Byte offset and entry count
+
+    def trim(self, offset, entries): # Define drop of compacted entries
+        with self.lock: # Exclusive access
+            self.file.close() # Release handle
+            with open(self.path, "r", encoding="utf-8") as f: # Open journal
+                f.seek(offset) # Skip compacted part
+                rest = f.read() # Entries written since the mark
+            tmp_path = self.path + ".tmp" # Temp file
+            with open(tmp_path, "w", encoding="utf-8") as f: # Write remainder
+                f.write(rest) # Copy entries
+                f.flush() # Push to OS
+                os.fsync(f.fileno()) # Push to disk
+            os.replace(tmp_path, self.path) # Swap in
+            self.file = open(self.path, "a", encoding="utf-8") # Reopen append handle
+            self.entries -= entries # Forget compacted entries
+
+    def close(self): # Define shutdown
+        with self.lock: # Exclusive access
+            self.file.close() # Close handle
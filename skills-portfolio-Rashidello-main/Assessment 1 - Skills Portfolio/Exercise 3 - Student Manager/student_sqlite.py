@@ -0,0 +1,338 @@
+import os # Import os module
+import sys # Import sys module
+import math # Import math module
+import bisect # Import bisect module
+import itertools # Import itertools module
+import sqlite3 # Import sqlite3 module
+import argparse # Import argparse module
+from contextlib import contextmanager # Import context manager decorator
+import numpy as np # Import numpy library
+from student_store import GRADES, PERCENTILES, MAX_TOTAL, MARK_RANGE, grade_code, grade_codes, check_marks, marks_valid # Import grading and mark rules
+from student_files import data_path, atomic_write, load_file # Import text format helpers
+
+DB_FILE = "studentMarks.db" # Database file name
+PAGE_ROWS = 256 # Rows fetched per positional page
+WALK_ROWS = PAGE_ROWS * 64 # Keys fetched per step when finding file order page starts
+EXPORT_ROWS = 65536 # Rows formatted per export block
+SEARCH_LIMIT = 10000 # Most name matches returned
+LOOKUP_IDS = 500 # IDs per membership query
+
+TABLE = """
+CREATE TABLE IF NOT EXISTS students (
+    seq INTEGER PRIMARY KEY, id TEXT NOT NULL UNIQUE, name TEXT NOT NULL,
+    c1 INTEGER NOT NULL, c2 INTEGER NOT NULL, c3 INTEGER NOT NULL, exam INTEGER NOT NULL,
+    c_total INTEGER NOT NULL, total INTEGER NOT NULL, percent REAL NOT NULL, grade INTEGER NOT NULL
+);
+""" # One row per student; seq is the file order
+INDEXES = """
+CREATE INDEX IF NOT EXISTS students_total ON students (total);
+CREATE INDEX IF NOT EXISTS students_name ON students (name COLLATE NOCASE);
+""" # (total) entries end in seq, so they also serve ties in file order
+MIGRATE = f"""
+BEGIN IMMEDIATE;
+DROP INDEX IF EXISTS students_total;
+DROP INDEX IF EXISTS students_total_desc;
+DROP INDEX IF EXISTS students_name;
+ALTER TABLE students RENAME TO students_rowid;
+{TABLE}
+INSERT INTO students SELECT rowid, * FROM students_rowid;
+DROP TABLE students_rowid;
+{INDEXES}
+COMMIT;
+""" # Databases from before seq: the implicit rowid becomes seq, same order
+
+ORDER_BY = {None: "seq", "asc": "total, seq", "desc": "total DESC, seq"} # Same tie order as StudentStore
+COLUMNS = "seq, id, name, c1, c2, c3, exam, c_total, total, percent, grade" # Columns of a record query
+INSERT = "INTO students (id, name, c1, c2, c3, exam, c_total, total, percent, grade) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)" # New rows get the next seq
+NEXT_TOTAL = {"asc": "SELECT MIN(total) FROM students WHERE total > ?", "desc": "SELECT MAX(total) FROM students WHERE total < ?"} # Next tie group
+FIRST_TOTAL = {"asc": "SELECT MIN(total) FROM students", "desc": "SELECT MAX(total) FROM students"} # First tie group
+
+def db_path(folder=None): # Define database location
+    return os.path.join(os.path.dirname(data_path(folder)), DB_FILE) # Next to the data file
+
+def derived(c1, c2, c3, exam): # Define computed columns for one row
+    c_total = c1 + c2 + c3 # Calculate total coursework
+    total = c_total + exam # Calculate total score
+    percent = (total / MAX_TOTAL) * 100 # Calculate percentage
+    return c_total, total, percent, grade_code(percent) # Same rules as the in-memory store
+
+class SqliteStore: # Define SQLite student store
+    def __init__(self, path): # Open or create database
+        self.path = path # Database file path
+        self.db = sqlite3.connect(path, isolation_level=None, check_same_thread=False) # Explicit transactions
+        self.db.execute("PRAGMA journal_mode=WAL") # Readers never block the writer
+        self.db.execute("PRAGMA synchronous=FULL") # Every commit survives a crash, like the journal
+        columns = [row[1] for row in self.db.execute("PRAGMA table_info(students)")] # Existing columns
+        if columns and "seq" not in columns: self.migrate() # Older database: add seq
+        self.db.executescript(TABLE + INDEXES) # Create table and indexes
+        self.count = self.db.execute("SELECT COUNT(*) FROM students").fetchone()[0] # Live rows
+        self.version = 0 # Bumped on every change
+        self.stats_cache = None # (version, stats) from the last stats() call
+        self.page_cache = None # (version, order, page start, seqs) for positional access
+        self.page_starts = (None, [None]) # (version, key before each file order page) for keyset paging
+        self.totals_cache = None # (version, totals low to high, students per total)
+        self.batching = False # Inside batch(): writes join its transaction
+
+    def migrate(self): # Define rebuild of a database without the seq column
+        try: # Try block
+            self.db.executescript(MIGRATE) # Copy rows in rowid order, one transaction
+        except BaseException: # Any failure
+            if self.db.in_transaction: self.db.execute("ROLLBACK") # Old table left as it was
+            raise # Re-raise
+
+    def __len__(self): # Define live row count
+        return self.count # Return count
+
+    def __contains__(self, s_id): # Define ID membership
+        return self.db.execute("SELECT 1 FROM students WHERE id = ?", (s_id,)).fetchone() is not None # Index lookup
+
+    def close(self): # Define close
+        self.db.close() # Close connection
+
+    def write(self, sql, rows): # Define one batched transaction
+        if self.batching: # Part of a larger transaction
+            before = self.db.total_changes # Rows changed so far
+            self.db.executemany(sql, rows) # Write rows
+            self.version += 1 # Data changed
+            return self.db.total_changes - before # Rows changed
+        self.db.execute("BEGIN IMMEDIATE") # Take the write lock
+        try: # Try block
+            before = self.db.total_changes # Rows changed so far
+            self.db.executemany(sql, rows) # All rows in one transaction
+            self.db.execute("COMMIT") # One fsync for the batch
+        except BaseException: # Any failure
+            self.db.execute("ROLLBACK") # Nothing half-written
+            raise # Re-raise
+        self.version += 1 # Data changed
+        return self.db.total_changes - before # Rows changed
+
+    @contextmanager
+    def batch(self): # Define one transaction around many writes
+        self.db.execute("BEGIN IMMEDIATE") # Take the write lock
+        self.batching = True # Writes join this transaction
+        try: # Try block
+            yield self # Caller writes
+            self.db.execute("COMMIT") # One fsync for everything
+        except BaseException: # Batch failed
+            self.db.execute("ROLLBACK") # Nothing half-written
+            self.count = self.db.execute("SELECT COUNT(*) FROM students").fetchone()[0] # Recount live rows
+            raise # Re-raise
+        finally: # Always
+            self.batching = False # Back to one transaction per write
+            self.version += 1 # Data changed
+
+    def existing(self, ids): # Define which IDs are already stored
+        found = set() # IDs in the table
+        for start in range(0, len(ids), LOOKUP_IDS): # Loop chunks
+            chunk = ids[start:start + LOOKUP_IDS] # IDs to check
+            found.update(row[0] for row in self.db.execute(f"SELECT id FROM students WHERE id IN ({','.join('?' * len(chunk))})", chunk)) # Index lookups
+        return found # Return IDs
+
+    def add(self, s_id, name, c1, c2, c3, exam): # Define insert
+        check_marks(c1, c2, c3, exam) # Same rule as StudentStore
+        try: # Try block
+            self.write("INSERT " + INSERT, [(s_id, name, c1, c2, c3, exam) + derived(c1, c2, c3, exam)]) # One row
+        except sqlite3.IntegrityError: # UNIQUE(id) violated
+            raise ValueError(f"Duplicate student ID {s_id}") # Same error as StudentStore
+        self.count += 1 # One more live row
+        return self.db.execute("SELECT seq FROM students WHERE id = ?", (s_id,)).fetchone()[0] # Return row
+
+    def update(self, s_id, new_id, name, c1, c2, c3, exam): # Define in-place update
+        row = self.db.execute("SELECT seq FROM students WHERE id = ?", (s_id,)).fetchone() # Find row
+        if row is None: raise KeyError(s_id) # Not found
+        check_marks(c1, c2, c3, exam) # Same rule as StudentStore
+        try: # Try block
+            self.write("UPDATE students SET id = ?, name = ?, c1 = ?, c2 = ?, c3 = ?, exam = ?, c_total = ?, total = ?, percent = ?, grade = ? WHERE seq = ?", # Rewrite row
+                       [(new_id, name, c1, c2, c3, exam) + derived(c1, c2, c3, exam) + (row[0],)]) # Keeps its seq, so file order is unchanged
+        except sqlite3.IntegrityError: # UNIQUE(id) violated
+            raise ValueError(f"Duplicate student ID {new_id}") # Same error as StudentStore
+        return row[0] # Return row
+
+    def upsert(self, s_id, name, c1, c2, c3, exam): # Define add-or-overwrite
+        if s_id in self: return self.update(s_id, s_id, name, c1, c2, c3, exam) # Overwrite row
+        return self.add(s_id, name, c1, c2, c3, exam) # Insert row
+
+    def delete(self, s_id): # Define delete
+        if not self.write("DELETE FROM students WHERE id = ?", [(s_id,)]): return False # Not found
+        self.count -= 1 # One less live row
+        return True # Deleted
+
+    def extend(self, ids, names, marks): # Define bulk insert
+        marks = np.asarray(marks, np.int64) # Raw marks
+        if not marks_valid(marks).all(): raise ValueError(f"marks out of range ({MARK_RANGE})") # Same rule as StudentStore
+        c_total = marks[:, :3].sum(axis=1) # Coursework
+        total = c_total + marks[:, 3] # Total score
+        percent = total / MAX_TOTAL * 100 # Percentage
+        grade = grade_codes(percent) # Grade codes
+        rows = zip(ids, names, *marks.T.tolist(), c_total.tolist(), total.tolist(), percent.tolist(), grade.tolist()) # Plain Python values
+        added = self.write("INSERT OR IGNORE " + INSERT, rows) # Repeated IDs keep the first row
+        self.count += added # Live rows
+        return len(ids) - added # Return repeats
+
+    def import_text(self, path): # Define text file import
+        return load_file(path, self, jobs=1) # Stream blocks in one transaction
+
+    def text_blocks(self): # Define text format in blocks
+        yield str(self.count) + "\n" # Count header
+        cursor = self.db.execute("SELECT id, name, c1, c2, c3, exam FROM students ORDER BY seq") # File order
+        while True: # Loop blocks
+            rows = cursor.fetchmany(EXPORT_ROWS) # Next block
+            if not rows: break # Done
+            yield "".join(map("{},{},{},{},{},{}\n".format, *zip(*rows))) # Formatted block
+
+    def export_text(self, path): # Define text file export
+        self.db.execute("BEGIN") # One read snapshot, so the header matches the rows
+        try: # Try block
+            self.count = self.db.execute("SELECT COUNT(*) FROM students").fetchone()[0] # Rows in the snapshot
+            atomic_write(path, self.text_blocks()) # Temp file, fsync, rename
+        finally: # Always
+            self.db.execute("COMMIT") # End read snapshot
+
+    def result_blocks(self, size): # Define marks and computed columns in blocks
+        cursor = self.db.execute("SELECT id, name, c1, c2, c3, exam, c_total, total, percent, SUBSTR(?, grade + 1, 1) FROM students ORDER BY seq", (GRADES,)) # File order, grade letters
+        while True: # Loop blocks
+            rows = cursor.fetchmany(size) # Next block
+            if not rows: break # Done
+            yield [row[:8] + (round(row[8], 1), row[9]) for row in rows] # Python rounding, like the terminal (SQL ROUND rounds halves up)
+
+    def keys_after(self, order, key, limit): # Define next (total, seq) keys in file, "asc" or "desc" order
+        if order is None: # File order
+            return self.db.execute("SELECT 0, seq FROM students WHERE seq > ? ORDER BY seq LIMIT ?", (key[1] if key else -1, limit)).fetchall() # Primary key range
+        total, seq = key if key else (self.db.execute(FIRST_TOTAL[order]).fetchone()[0], -1) # Continue a tie group or start the first
+        keys = [] # Keys found
+        while total is not None and len(keys) < limit: # Loop tie groups
+            keys += self.db.execute("SELECT total, seq FROM students WHERE total = ? AND seq > ? ORDER BY seq LIMIT ?", (total, seq, limit - len(keys))).fetchall() # Index range seek, ties in file order
+            if len(keys) < limit: total, seq = self.db.execute(NEXT_TOTAL[order], (total,)).fetchone()[0], -1 # Group done: next total
+        return keys # Return keys
+
+    def total_groups(self): # Define students per total, low to high
+        if not self.totals_cache or self.totals_cache[0] != self.version: # Data changed
+            rows = self.db.execute("SELECT total, COUNT(*) FROM students GROUP BY total").fetchall() # One pass over the total index
+            self.totals_cache = (self.version, [row[0] for row in rows], [row[1] for row in rows]) # Totals and counts
+        return self.totals_cache[1:] # Totals and counts
+
+    def page_start(self, order, page): # Define key before the first row of a page
+        position = page * PAGE_ROWS # First row of the page
+        if order is None: return self.file_page_start(page) # Seq gaps are unknown: walk
+        totals, counts = self.total_groups() # Tie groups
+        if order == "desc": totals, counts = totals[::-1], counts[::-1] # High to low
+        ends = list(itertools.accumulate(counts)) # Running counts
+        group = bisect.bisect_right(ends, position) # Tie group holding the position
+        if group == len(totals): raise IndexError(position) # Past the end
+        skip = position - (ends[group - 1] if group else 0) # Rows of the group before the page
+        if not skip: return (totals[group], -1) # Page starts the group
+        rows = self.db.execute("SELECT seq FROM students WHERE total = ? ORDER BY seq LIMIT ?", (totals[group], skip)).fetchall() # Walk this group only
+        return (totals[group], rows[-1][0]) # Last row before the page
+
+    def file_page_start(self, page): # Define key before the first row of a file order page
+        if self.page_starts[0] != self.version: self.page_starts = (self.version, [None]) # Data changed: page starts moved
+        starts = self.page_starts[1] # Known page starts
+        while len(starts) <= page: # Walk forward from the last known start
+            keys = self.keys_after(None, starts[-1], WALK_ROWS) # Next stretch of keys
+            starts += keys[PAGE_ROWS - 1::PAGE_ROWS] # Last key of each page starts the next
+            if len(keys) < WALK_ROWS: break # End of table
+        return starts[page] # Key before the page
+
+    def row_at(self, position, order=None): # Define seq of the n-th student in file, "asc" or "desc" order
+        start = position - position % PAGE_ROWS # Page holding the position
+        cache = self.page_cache # Last page fetched
+        if not cache or cache[:3] != (self.version, order, start): # Fetch page
+            keys = self.keys_after(order, self.page_start(order, start // PAGE_ROWS), PAGE_ROWS) # Keyset seek, no OFFSET walk
+            cache = self.page_cache = (self.version, order, start, [key[1] for key in keys]) # Keep page
+        return cache[3][position - start] # Row at position
+
+    def make_record(self, row): # Define query row -> dict
+        seq, s_id, name, c1, c2, c3, exam, c_total, total, percent, grade = row # Unpack row
+        return { # Same shape as StudentStore.record
+            "id": s_id, "name": name, "c_total": c_total, "exam": exam, "total": total, "percent": percent, # Scores
+            "grade": GRADES[grade], "raw_parts": [s_id, name, str(c1), str(c2), str(c3), str(exam)] # Grade and raw parts
+        }
+
+    def record(self, row): # Define seq -> dict
+        return self.make_record(self.db.execute(f"SELECT {COLUMNS} FROM students WHERE seq = ?", (row,)).fetchone()) # Primary key lookup
+
+    def get(self, s_id): # Define lookup by ID
+        row = self.db.execute(f"SELECT {COLUMNS} FROM students WHERE id = ?", (s_id,)).fetchone() # Index lookup
+        return None if row is None else self.make_record(row) # Record or None
+
+    def records(self): # Define record iterator
+        for row in self.db.execute(f"SELECT {COLUMNS} FROM students ORDER BY seq"): yield self.make_record(row) # Live records in order
+
+    def sorted_records(self, reverse=False): # Define records by total
+        for row in self.db.execute(f"SELECT {COLUMNS} FROM students ORDER BY {ORDER_BY['desc' if reverse else 'asc']}"): yield self.make_record(row) # Index order
+
+    def top(self, k): # Define k highest scorers
+        return [self.make_record(row) for row in self.db.execute(f"SELECT {COLUMNS} FROM students ORDER BY {ORDER_BY['desc']} LIMIT ?", (k,))] # First k
+
+    def bottom(self, k): # Define k lowest scorers
+        return [self.make_record(row) for row in self.db.execute(f"SELECT {COLUMNS} FROM students ORDER BY {ORDER_BY['asc']} LIMIT ?", (k,))] # First k
+
+    def highest(self): # Define top scorer
+        rows = self.top(1) # Highest total, first in file order
+        return rows[0] if rows else None # Record or None
+
+    def lowest(self): # Define bottom scorer
+        rows = self.bottom(1) # Lowest total, first in file order
+        return rows[0] if rows else None # Record or None
+
+    def rank(self, s_id): # Define competition rank (1 = highest total)
+        row = self.db.execute("SELECT total FROM students WHERE id = ?", (s_id,)).fetchone() # Student total
+        if row is None: return None # Not found
+        return self.db.execute("SELECT COUNT(*) FROM students WHERE total > ?", row).fetchone()[0] + 1 # Index range count; ties share a rank
+
+    def total_at(self, position): # Define n-th lowest total
+        totals, counts = self.total_groups() # Tie groups
+        return totals[bisect.bisect_right(list(itertools.accumulate(counts)), position)] # Group holding the position
+
+    def percentile(self, p): # Define percentile of percentages, interpolated like numpy
+        position = (self.count - 1) * p / 100 # Fractional position
+        low = math.floor(position) # Lower neighbour
+        value = self.total_at(low) # Lower total
+        if position > low: value += (self.total_at(low + 1) - value) * (position - low) # Interpolate
+        return value / MAX_TOTAL * 100 # As a percentage
+
+    def stats(self): # Define cached class statistics
+        if self.stats_cache and self.stats_cache[0] == self.version: return self.stats_cache[1] # Unchanged since last time
+        counts = dict(self.db.execute("SELECT grade, COUNT(*) FROM students GROUP BY grade").fetchall()) # Students per grade code
+        result = {"count": self.count, "grades": {g: counts.get(code, 0) for code, g in enumerate(GRADES)}} # Count and distribution
+        if self.count: # Non-empty class
+            mean, square, low, high = self.db.execute("SELECT AVG(percent), AVG(percent * percent), MIN(percent), MAX(percent) FROM students").fetchone() # One scan
+            marks = {p: self.percentile(p) for p in PERCENTILES} # Index walks
+            result.update(mean=mean, std=math.sqrt(max(0.0, square - mean * mean)), median=marks[50], # Centre and spread
+                          min=low, max=high, percentiles=marks) # Range and percentiles
+        else: # Empty class
+            result.update(mean=0.0, std=0.0, median=0.0, min=0.0, max=0.0, percentiles={p: 0.0 for p in PERCENTILES}) # Zeros
+        self.stats_cache = (self.version, result) # Cache until the data changes
+        return result # Return stats
+
+    def build_name_index(self, fuzzy=False): # Define name index setup
+        return None # students_name already indexes names
+
+    def find_names(self, query): # Define name search
+        text = " ".join(query.split()) # Single spaces
+        if not text: return [] # Nothing typed
+        pattern = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") # Escape LIKE wildcards
+        rows = self.db.execute("SELECT seq FROM students WHERE name LIKE ? ESCAPE '\\' OR name LIKE ? ESCAPE '\\' ORDER BY name COLLATE NOCASE LIMIT ?", # Whole name or a later word
+                               (pattern + "%", "% " + pattern + "%", SEARCH_LIMIT)).fetchall() # Scan of the covering students_name index
+        if not rows: rows = self.db.execute("SELECT seq FROM students WHERE name LIKE ? ESCAPE '\\' LIMIT ?", ("%" + pattern + "%", SEARCH_LIMIT)).fetchall() # Substring scan
+        return [row[0] for row in rows] # Seqs
+
+def main(): # Define CLI entry
+    parser = argparse.ArgumentParser(description="Import or export studentMarks.txt through the SQLite student store") # Create parser
+    parser.add_argument("command", choices=("import", "export"), help="import a text file into the database, or export the database as text") # Command
+    parser.add_argument("text", nargs="?", default=data_path(), help="text file (default studentMarks.txt next to this script)") # Text file
+    parser.add_argument("--db", default=db_path(), help="database file (default studentMarks.db next to this script)") # Database file
+    args = parser.parse_args() # Parse arguments
+    store = SqliteStore(args.db) # Open database
+    try: # Try block
+        if args.command == "import": # Text -> database
+            report = store.import_text(args.text) # Import
+            print(f"imported {report['rows']:,} students in {report['seconds']:.2f}s ({report['malformed']} malformed lines, {report['duplicates']} repeated IDs skipped)") # Report
+        else: # Database -> text
+            store.export_text(args.text) # Export
+            print(f"exported {len(store):,} students to {args.text}") # Report
+    finally: # Always
+        store.close() # Close database
+
+if __name__ == "__main__": # Main entry check
+    sys.exit(main()) # Run CLI
@@ -0,0 +1,351 @@
+import bisect # Import bisect module
+from contextlib import contextmanager # Import context manager decorator
+import numpy as np # Import numpy library
+from name_index import NameIndex # Import name search index
+
+GRADES = "ABCDF" # Grade letter per grade code
+GRADE_THRESHOLDS = (70, 60, 50, 40) # Minimum percent for A, B, C, D
+MAX_TOTAL = 160 # Coursework 60 + exam 100
+MARK_COLUMNS = ("c1", "c2", "c3", "exam", "c_total", "total") # Integer columns
+GRADE_EDGES = np.array(sorted(GRADE_THRESHOLDS)) # Thresholds in ascending order for searchsorted
+PERCENTILES = (10, 25, 50, 75, 90) # Percentiles in the class summary
+MARK_LOW = (0, 0, 0, 0) # Lowest C1, C2, C3, Exam
+MARK_HIGH = (20, 20, 20, 100) # Highest C1, C2, C3, Exam (coursework /60, exam /100)
+MARK_RANGE = "C1-C3 0-20, Exam 0-100" # Mark rule in error messages
+MARK_LIMIT = 8191 # Largest mark whose four-mark total still fits int16
+TOTAL_OFFSET = 4 * MARK_LIMIT + 1 # Shifts totals to be non-negative in sort keys
+ROW_BITS = 32 # Low bits of a sort key hold the row
+ROW_MASK = (1 << ROW_BITS) - 1 # Row part of a sort key
+
+def grade_code(percent): # Define scalar grade lookup
+    for code, limit in enumerate(GRADE_THRESHOLDS): # Check thresholds high to low
+        if percent >= limit: return code # First threshold reached
+    return len(GRADE_THRESHOLDS) # F
+
+def grade_codes(percent): # Define vectorized grade lookup
+    return (len(GRADE_THRESHOLDS) - np.searchsorted(GRADE_EDGES, percent, side="right")).astype(np.uint8) # Thresholds passed -> code
+
+def marks_valid(marks): # Define mark range check for an (n, 4) block
+    return ((marks >= MARK_LOW) & (marks <= MARK_HIGH)).all(axis=1) # True for rows in range
+
+def check_marks(c1, c2, c3, exam): # Define mark range check for one student
+    if not all(low <= mark <= high for mark, low, high in zip((c1, c2, c3, exam), MARK_LOW, MARK_HIGH)): # Any mark outside its range
+        raise ValueError(f"marks out of range ({MARK_RANGE})") # Same rule for every entry point
+
+def parse_record(line): # Define line parser
+    parts = line.strip().split(',') # Split line by comma
+    if len(parts) < 6: return None # Not a record
+    try: # Try block
+        marks = int(parts[2]), int(parts[3]), int(parts[4]), int(parts[5]) # C1, C2, C3, Exam
+    except ValueError: # Non-numeric mark
+        raise ValueError("marks must be whole numbers") from None # Readable message
+    check_marks(*marks) # Column ranges
+    return (parts[0], parts[1]) + marks # ID, name, marks
+
+class StudentStore: # Define columnar student store
+    def __init__(self, capacity=1024): # Initialize store
+        self.ids = [] # ID per row
+        self.names = [] # Name per row
+        for name in MARK_COLUMNS: setattr(self, name, np.zeros(capacity, np.int16)) # Mark columns
+        self.percent = np.zeros(capacity, np.float64) # Percentage column
+        self.grade = np.zeros(capacity, np.uint8) # Grade code column
+        self.alive = np.zeros(capacity, bool) # False for deleted rows
+        self.index = {} # ID -> row
+        self.size = 0 # Rows used, including deleted ones
+        self.count = 0 # Live rows
+        self.version = 0 # Bumped on every change to marks or membership
+        self.stats_cache = None # (version, stats) from the last stats() call
+        self.by_total = [] # Sorted (total, row) keys packed into ints
+        self.batching = False # Inside batch(): score order sorted once at the end
+        self.rows_cache = None # (version, live rows) for positional access
+        self.name_index = None # Name search index, once build_name_index has run
+
+    def __len__(self): # Define live row count
+        return self.count # Return count
+
+    def __contains__(self, s_id): # Define ID membership
+        return s_id in self.index # Hash lookup
+
+    def grow(self): # Define capacity doubling
+        capacity = max(1024, len(self.alive) * 2) # New capacity
+        for name in MARK_COLUMNS + ("percent", "grade", "alive"): # Each column
+            old = getattr(self, name) # Current array
+            new = np.zeros(capacity, old.dtype) # Bigger array
+            new[:self.size] = old[:self.size] # Copy used rows
+            setattr(self, name, new) # Swap in
+
+    def set_row(self, row, s_id, name, c1, c2, c3, exam): # Define row writer
+        c_total = c1 + c2 + c3 # Calculate total coursework
+        total = c_total + exam # Calculate total score
+        percent = (total / MAX_TOTAL) * 100 # Calculate percentage
+        self.ids[row] = s_id # Store ID
+        self.names[row] = name # Store name
+        self.c1[row], self.c2[row], self.c3[row], self.exam[row] = c1, c2, c3, exam # Store raw marks
+        self.c_total[row], self.total[row] = c_total, total # Store totals
+        self.percent[row] = percent # Store percentage
+        self.grade[row] = grade_code(percent) # Store grade code
+        self.version += 1 # Data changed
+
+    def add(self, s_id, name, c1, c2, c3, exam): # Define append
+        if s_id in self.index: raise ValueError(f"Duplicate student ID {s_id}") # IDs are unique
+        check_marks(c1, c2, c3, exam) # Reject before touching the columns
+        if self.size == len(self.alive): self.grow() # Make room
+        row = self.size # Next free row
+        self.ids.append(s_id) # Reserve ID slot
+        self.names.append(name) # Reserve name slot
+        self.set_row(row, s_id, name, c1, c2, c3, exam) # Fill row
+        self.alive[row] = True # Mark live
+        self.index[s_id] = row # Index it
+        self.insert_key(row) # Add to the score order
+        if self.name_index: self.name_index.add(name, row) # Searchable by name
+        self.size += 1 # One more row used
+        self.count += 1 # One more live row
+        return row # Return row
+
+    def update(self, s_id, new_id, name, c1, c2, c3, exam): # Define in-place update
+        row = self.index[s_id] # Find row
+        check_marks(c1, c2, c3, exam) # Reject before touching the row
+        if new_id != s_id: # ID changed
+            if new_id in self.index: raise ValueError(f"Duplicate student ID {new_id}") # IDs are unique
+            del self.index[s_id] # Drop old key
+            self.index[new_id] = row # Add new key
+        self.remove_key(row) # Old total leaves the score order
+        if self.name_index: self.name_index.remove(self.names[row], row) # Old name leaves the name index
+        self.set_row(row, new_id, name, c1, c2, c3, exam) # Rewrite row
+        self.insert_key(row) # New total joins it
+        if self.name_index: self.name_index.add(name, row) # New name joins it
+        return row # Return row
+
+    def extend(self, ids, names, marks): # Define bulk append
+        n = len(ids) # Rows to add
+        if not marks_valid(marks).all(): raise ValueError(f"marks out of range ({MARK_RANGE})") # Whole block or nothing
+        while self.size + n > len(self.alive): self.grow() # Make room
+        start, end = self.size, self.size + n # New row range
+        self.c1[start:end], self.c2[start:end], self.c3[start:end], self.exam[start:end] = marks.T # Store raw marks
+        self.ids.extend(ids) # Store IDs
+        self.names.extend(names) # Store names
+        self.alive[start:end] = True # Mark live
+        self.size = end # Rows used
+        self.derive(start, end) # Totals, percent and grade
+        duplicates = 0 # Repeated IDs
+        index = self.index # Local for speed
+        for row, s_id in enumerate(ids, start): # Index new rows
+            if s_id in index: # Seen before: keep the first row
+                self.alive[row] = False # Tombstone repeat
+                self.ids[row] = self.names[row] = None # Release strings
+                duplicates += 1 # Count it
+            else: # New ID
+                index[s_id] = row # Index it
+        self.count += n - duplicates # Live rows
+        self.version += 1 # Data changed
+        rows = np.arange(start, end)[self.alive[start:end]] # New live rows
+        self.by_total.extend(np.sort(self.total_keys(rows)).tolist()) # Append the new sorted run
+        if not self.batching: self.by_total.sort() # Timsort merges the two runs in place
+        if self.name_index: # Name search on
+            order = rows.tolist() # Plain ints
+            self.name_index.extend([self.names[r] for r in order], order) # Merge the new names in
+        return duplicates # Return repeats
+
+    @contextmanager
+    def batch(self): # Define all-or-nothing bulk append
+        start, keys = self.size, len(self.by_total) # First row of the batch, sorted keys before it
+        index, self.name_index = self.name_index, None # Hold name index updates until the end
+        self.batching = True # Hold score order merges until the end
+        try: # Try block
+            yield self # Caller extends the store
+        except BaseException: # Batch failed
+            self.batching = False # Back to merging on every extend
+            self.name_index = index # Restore index (the new rows were never in it)
+            self.truncate(start, keys) # Drop everything the batch added in one step
+            raise # Re-raise
+        self.batching = False # Back to merging on every extend
+        self.by_total.sort() # One merge of every block's run
+        self.name_index = index # Restore index
+        if index: # Name search on
+            rows = (start + np.flatnonzero(self.alive[start:self.size])).tolist() # Rows the batch added
+            index.extend([self.names[r] for r in rows], rows) # One merge for the whole batch
+
+    def truncate(self, size, keys): # Define rollback to an earlier size (batch rows only, never edited since)
+        added = (size + np.flatnonzero(self.alive[size:self.size])).tolist() # Live rows past the old end
+        for row in added: del self.index[self.ids[row]] # Unindex them (repeats were never indexed)
+        self.alive[size:self.size] = False # Clear tail
+        del self.ids[size:], self.names[size:] # Drop strings
+        del self.by_total[keys:] # Batch keys were only appended after the sorted ones
+        self.size = size # Rows used
+        self.count -= len(added) # Live rows
+        self.version += 1 # Data changed
+
+    def existing(self, ids): # Define which IDs are already stored
+        index = self.index # Local for speed
+        return {s_id for s_id in ids if s_id in index} # Hash lookups
+
+    def derive(self, start, end): # Define computed columns for a row range
+        self.c_total[start:end] = self.c1[start:end] + self.c2[start:end] + self.c3[start:end] # Coursework
+        self.total[start:end] = self.c_total[start:end] + self.exam[start:end] # Total score
+        self.percent[start:end] = self.total[start:end] / MAX_TOTAL * 100 # Percentage
+        self.grade[start:end] = grade_codes(self.percent[start:end]) # Grade code
+        self.version += 1 # Data changed
+
+    def upsert(self, s_id, name, c1, c2, c3, exam): # Define add-or-overwrite
+        if s_id in self.index: return self.update(s_id, s_id, name, c1, c2, c3, exam) # Overwrite row
+        return self.add(s_id, name, c1, c2, c3, exam) # Append row
+
+    def delete(self, s_id): # Define delete
+        row = self.index.pop(s_id, None) # Find and unindex
+        if row is None: return False # Not found
+        self.remove_key(row) # Leave the score order
+        if self.name_index: self.name_index.remove(self.names[row], row) # Leave the name index
+        self.alive[row] = False # Tombstone row
+        self.ids[row] = self.names[row] = None # Release strings
+        self.count -= 1 # One less live row
+        self.version += 1 # Data changed
+        if self.size > 1024 and self.count < self.size // 2: self.compact() # Reclaim space
+        return True # Deleted
+
+    def compact(self): # Define tombstone removal
+        self.reorder(self.rows()) # Keep live rows in order
+
+    def reorder(self, order): # Define row permutation
+        for name in MARK_COLUMNS + ("percent", "grade", "alive"): # Each column
+            column = getattr(self, name) # Current array
+            column[:len(order)] = column[order] # Gather rows
+        self.alive[len(order):self.size] = False # Clear tail
+        self.ids = [self.ids[row] for row in order] # Reorder IDs
+        self.names = [self.names[row] for row in order] # Reorder names
+        self.size = len(order) # Rows used
+        self.index = {s_id: row for row, s_id in enumerate(self.ids)} # Rebuild index
+        self.by_total = np.sort(self.total_keys(self.rows())).tolist() # Rebuild score order
+        if self.name_index: self.name_index.build(self.names, range(self.size)) # Rows moved: rebuild name index
+
+    def rows(self): # Define live rows in order
+        return np.flatnonzero(self.alive[:self.size]) # Row numbers
+
+    def row_at(self, position, order=None): # Define row of the n-th student in file, "asc" or "desc" order
+        keys = self.by_total # Sorted keys
+        if order == "asc": return keys[position] & ROW_MASK # Straight from the score order
+        if order == "desc": # Highest first, ties in file order
+            group = keys[len(keys) - 1 - position] & ~ROW_MASK # Total of that student
+            low = bisect.bisect_left(keys, group) # First key with this total
+            high = bisect.bisect_left(keys, group + (1 << ROW_BITS)) # Past the last one
+            return keys[low + position - (len(keys) - high)] & ROW_MASK # Same place within the tie group
+        if self.size == self.count: return position # No tombstones
+        if not self.rows_cache or self.rows_cache[0] != self.version: self.rows_cache = (self.version, self.rows()) # Live rows
+        return int(self.rows_cache[1][position]) # File order
+
+    def build_name_index(self, fuzzy=False): # Define name index setup
+        self.name_index = NameIndex(fuzzy) # Empty index
+        rows = self.rows().tolist() # Live rows
+        self.name_index.build([self.names[r] for r in rows], rows) # Index every live name
+        return self.name_index # Return index
+
+    def find_names(self, query): # Define name search
+        index = self.name_index # Name search index
+        if index is None: return [] # Not built
+        matches = index.prefix(query) # Names or later words starting with the query
+        if matches: return matches # Prefix matches, one per student
+        return index.substring(query, self.names) or index.fuzzy(query) # Anywhere in the name, then close spellings
+
+    def get(self, s_id): # Define lookup by ID
+        row = self.index.get(s_id) # Hash lookup
+        return None if row is None else self.record(row) # Record or None
+
+    def record(self, row): # Define row -> dict
+        return { # Same shape as the old student dicts
+            "id": self.ids[row], "name": self.names[row], # ID and Name
+            "c_total": int(self.c_total[row]), "exam": int(self.exam[row]), # Scores
+            "total": int(self.total[row]), "percent": float(self.percent[row]), # Totals
+            "grade": GRADES[self.grade[row]], "raw_parts": self.raw_parts(row) # Grade and raw parts
+        }
+
+    def raw_parts(self, row): # Define file fields for a row
+        return [self.ids[row], self.names[row], str(self.c1[row]), str(self.c2[row]), str(self.c3[row]), str(self.exam[row])] # ID,Name,C1,C2,C3,Exam
+
+    def records(self): # Define record iterator
+        for row in self.rows(): yield self.record(row) # Live records in order
+
+    def result_blocks(self, size): # Define marks and computed columns in blocks
+        for start in range(0, self.size, size): # Loop row ranges
+            rows = start + np.flatnonzero(self.alive[start:start + size]) # Live rows in range
+            order = rows.tolist() # Plain ints
+            yield list(zip([self.ids[r] for r in order], [self.names[r] for r in order], # ID and Name
+                           self.c1[rows].tolist(), self.c2[rows].tolist(), self.c3[rows].tolist(), self.exam[rows].tolist(), # Raw marks
+                           self.c_total[rows].tolist(), self.total[rows].tolist(), [round(p, 1) for p in self.percent[rows].tolist()], # Totals, percent rounded like the terminal
+                           [GRADES[g] for g in self.grade[rows].tolist()])) # Grade letters
+
+    def added_blocks(self, start, size): # Define live rows appended since an earlier size, in blocks
+        for block in range(start, self.size, size): # Loop row ranges
+            rows = block + np.flatnonzero(self.alive[block:min(self.size, block + size)]) # Live rows in range
+            order = rows.tolist() # Plain ints
+            yield [self.ids[r] for r in order], [self.names[r] for r in order], np.column_stack([self.c1[rows], self.c2[rows], self.c3[rows], self.exam[rows]]) # IDs, names, raw marks
+
+    def snapshot(self): # Define copy of live rows for background writers
+        rows = self.rows() # Live rows
+        if len(rows) == self.size: ids, names = list(self.ids), list(self.names) # No tombstones
+        else: # Skip deleted rows
+            order = rows.tolist() # Plain ints
+            ids, names = [self.ids[r] for r in order], [self.names[r] for r in order] # Live strings
+        marks = np.column_stack([self.c1[rows], self.c2[rows], self.c3[rows], self.exam[rows]]) # Raw marks
+        return ids, names, marks # Return copies
+
+    def stats(self): # Define cached class statistics
+        if self.stats_cache and self.stats_cache[0] == self.version: return self.stats_cache[1] # Unchanged since last time
+        live = self.alive[:self.size] # Live mask
+        percent = self.percent[:self.size][live] # Live percentages
+        counts = np.bincount(self.grade[:self.size][live], minlength=len(GRADES)) # Students per grade
+        result = {"count": len(percent), "grades": dict(zip(GRADES, counts.tolist()))} # Count and distribution
+        if len(percent): # Non-empty class
+            marks = dict(zip(PERCENTILES, np.percentile(percent, PERCENTILES).tolist())) # One partial sort for all percentiles
+            result.update(mean=float(percent.mean()), std=float(percent.std()), median=marks[50], # Centre and spread
+                          min=float(percent.min()), max=float(percent.max()), percentiles=marks) # Range and percentiles
+        else: # Empty class
+            result.update(mean=0.0, std=0.0, median=0.0, min=0.0, max=0.0, percentiles={p: 0.0 for p in PERCENTILES}) # Zeros
+        self.stats_cache = (self.version, result) # Cache until the data changes
+        return result # Return stats
+
+    def total_keys(self, rows): # Define vectorized sort keys
+        return ((self.total[rows].astype(np.int64) + TOTAL_OFFSET) << ROW_BITS) | rows # Total, then file row
+
+    def total_key(self, row): # Define sort key for one row
+        return ((int(self.total[row]) + TOTAL_OFFSET) << ROW_BITS) | row # Total, then file row
+
+    def insert_key(self, row): # Define score order insert
+        bisect.insort(self.by_total, self.total_key(row)) # O(log n) search, one memmove
+
+    def remove_key(self, row): # Define score order removal
+        del self.by_total[bisect.bisect_left(self.by_total, self.total_key(row))] # Find and drop
+
+    def ascending_rows(self): # Define lowest-first rows
+        for key in self.by_total: yield key & ROW_MASK # Ties in file order
+
+    def descending_rows(self): # Define highest-first rows
+        keys = self.by_total # Sorted keys
+        end = len(keys) # Walk groups from the top
+        while end: # Groups left
+            start = bisect.bisect_left(keys, keys[end - 1] & ~ROW_MASK) # First key with this total
+            for key in keys[start:end]: yield key & ROW_MASK # Ties in file order, like a stable reverse sort
+            end = start # Next lower total
+
+    def sorted_records(self, reverse=False): # Define records by total without reordering the store
+        for row in (self.descending_rows() if reverse else self.ascending_rows()): yield self.record(row) # Ordered view
+
+    def top(self, k): # Define k highest scorers
+        rows = self.descending_rows() # Highest first
+        return [self.record(row) for row, _ in zip(rows, range(k))] # First k
+
+    def bottom(self, k): # Define k lowest scorers
+        return [self.record(key & ROW_MASK) for key in self.by_total[:k]] # First k keys
+
+    def rank(self, s_id): # Define competition rank (1 = highest total)
+        row = self.index.get(s_id) # Hash lookup
+        if row is None: return None # Not found
+        higher = self.count - bisect.bisect_left(self.by_total, (int(self.total[row]) + TOTAL_OFFSET + 1) << ROW_BITS) # Students with a higher total
+        return higher + 1 # Ties share a rank
+
+    def highest(self): # Define top scorer
+        if not self.count: return None # Empty
+        keys = self.by_total # Sorted keys
+        return self.record(keys[bisect.bisect_left(keys, keys[-1] & ~ROW_MASK)] & ROW_MASK) # First row with the top total
+
+    def lowest(self): # Define bottom scorer
+        if not self.count: return None # Empty
+        return self.record(self.by_total[0] & ROW_MASK) # First row with the bottom total
@@ -0,0 +1,4 @@
+def percentile(values, pct): # Define nearest-rank percentile of timing samples
+    if not values: return 0.0 # Nothing measured yet
+    ordered = sorted(values) # Sort samples
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] # Nearest-rank value
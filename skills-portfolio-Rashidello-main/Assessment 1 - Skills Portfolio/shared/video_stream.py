@@ -0,0 +1,489 @@
+import threading # Import threading module
+import queue # Import queue module
+import time # Import time module
+import zlib # Import zlib module
+import math # Import math module
+import os # Import os module
+import mmap # Import mmap module
+import struct # Import struct module
+import hashlib # Import hashlib module
+import tempfile # Import tempfile module
+from collections import deque # Import deque class
+import imageio # Import imageio library
+from PIL import Image, ImageTk # Import PIL library
+
+from bench_stats import percentile # Import percentile helper
+
+LOOP_END = object() # Queue marker sent after a fully cached first pass
+CACHE_MODES = ("photo", "raw", "palette", "zlib") # Supported cache modes
+AUTO_MODES = ("photo", "raw", "zlib") # Lossless modes tried by cache="auto", cheapest replay first
+CACHE_LIMIT = 256 * 1024 * 1024 # Default loop cache cap in bytes
+DISK_MAGIC = b"NFC1" # Disk cache file signature
+DISK_HEADER = struct.Struct("<4sIIId") # Magic, width, height, frame count, fps
+
+def to_image(frame_data, size): # Define numpy frame to PIL conversion
+    h, w = frame_data.shape[:2] # Frame dimensions
+    if (w, h) == tuple(size) and frame_data.flags["C_CONTIGUOUS"]: # Already display size
+        return Image.frombuffer("RGB", size, frame_data, "raw", "RGB", 0, 1) # Zero-copy view of the numpy buffer
+    return Image.fromarray(frame_data).resize(size) # Full-size frame needs a resample
+
+def disk_cache_path(video_path, size, folder=None): # Define disk cache file name
+    st = os.stat(video_path) # Video file info
+    key = f"{os.path.abspath(video_path)}|{st.st_mtime_ns}|{size[0]}x{size[1]}" # Path, mtime and size key
+    folder = folder or os.path.join(tempfile.gettempdir(), "neon_frame_cache") # Shared cache folder
+    return os.path.join(folder, hashlib.sha1(key.encode()).hexdigest() + ".raw") # One file per key
+
+class MappedFrames: # Define reader over a memory-mapped frame file
+    def __init__(self, path, size): # Initialize reader
+        self.file = open(path, "rb") # Open cache file
+        try: # Try block
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) # Map read-only (shared page cache)
+            magic, w, h, count, fps = DISK_HEADER.unpack_from(self.map, 0) # Read header
+            self.size = (w, h) # Frame size
+            self.count = count # Frame count
+            self.fps = fps # Source fps
+            self.frame_bytes = w * h * 3 # Bytes per RGB frame
+            if magic != DISK_MAGIC or self.size != tuple(size) or count == 0: raise ValueError("Stale frame cache") # Validate header
+            if len(self.map) != DISK_HEADER.size + count * self.frame_bytes: raise ValueError("Truncated frame cache") # Validate length
+        except Exception: # Bad or unreadable file
+            self.file.close() # Release file
+            raise # Let caller fall back to decoding
+        self.view = memoryview(self.map) # View for zero-copy slices
+        self.index = 0 # Next frame index
+
+    def get_next_data(self): # Define frame fetch
+        if self.index >= self.count: raise IndexError("End of frame cache") # Same end signal as imageio
+        offset = DISK_HEADER.size + self.index * self.frame_bytes # Frame start
+        self.index += 1 # Advance
+        return Image.frombuffer("RGB", self.size, self.view[offset:offset + self.frame_bytes], "raw", "RGB", 0, 1) # Image over mapped bytes
+
+    def set_image_index(self, index): # Define seek
+        self.index = index # Set position
+
+    def get_meta_data(self): # Define metadata
+        return {"fps": self.fps, "nframes": self.count, "size": self.size} # Same keys as imageio
+
+    def close(self): # Define close
+        try: # Try block
+            self.view.release() # Release view
+            self.map.close() # Unmap
+        except BufferError: # Cached frames still point into the map
+            pass # Leave it mapped until they are gone
+        self.file.close() # Close file
+
+def loop_frames(meta): # Define frame count of one loop from reader metadata
+    frames = meta.get("nframes") # Exact count (disk cache) or inf (ffmpeg)
+    if frames and math.isfinite(frames): return int(frames) # Known count
+    duration, fps = meta.get("duration"), meta.get("fps") # Container estimate
+    return math.ceil(duration * fps) if duration and fps else None # Frames or unknown
+
+def frame_bytes(mode, size): # Define cached bytes per frame (None if it depends on the frame)
+    w, h = size # Frame size
+    if mode == "photo": return w * h * 4 # Tk stores 32-bit pixels
+    if mode == "raw": return w * h * 3 # RGB bytes
+    if mode == "palette": return w * h + 768 # Index bytes plus palette
+    return None # Compressed length varies
+
+def choose_cache_mode(mode, frames, size, limit): # Define cache mode that fits one loop under the cap
+    candidates = AUTO_MODES if mode == "auto" else (mode,) + tuple(m for m in ("raw", "zlib") if m != mode) # Requested mode, then fallbacks
+    for candidate in candidates: # Cheapest replay first
+        per_frame = frame_bytes(candidate, size) # Fixed frame size, if any
+        if frames is None or per_frame is None or frames * per_frame <= limit: return candidate # Fits, or cannot tell before decoding
+    return candidates[-1] # Unreachable: zlib is always accepted
+
+class DiskCacheWriter: # Define writer for the first decoded pass
+    def __init__(self, path, size, fps): # Initialize writer
+        os.makedirs(os.path.dirname(path), exist_ok=True) # Make cache folder
+        self.path = path # Final path
+        self.tmp_path = f"{path}.{os.getpid()}.tmp" # Private temp file
+        self.size = size # Frame size
+        self.fps = fps # Source fps
+        self.count = 0 # Frames written
+        self.file = open(self.tmp_path, "wb") # Open temp file
+        self.file.write(DISK_HEADER.pack(DISK_MAGIC, size[0], size[1], 0, fps)) # Placeholder header
+
+    def write(self, img): # Define frame write
+        self.file.write(img.tobytes()) # Append raw RGB bytes
+        self.count += 1 # Count frame
+
+    def finish(self): # Define commit
+        self.file.seek(0) # Back to header
+        self.file.write(DISK_HEADER.pack(DISK_MAGIC, self.size[0], self.size[1], self.count, self.fps)) # Real header
+        self.file.close() # Flush and close
+        os.replace(self.tmp_path, self.path) # Publish atomically for other processes
+
+    def abort(self): # Define discard
+        self.file.close() # Close file
+        try: # Try block
+            os.remove(self.tmp_path) # Remove partial file
+        except OSError: # Already gone
+            pass # Ignore
+
+class FrameCache: # Define in-memory loop cache
+    def __init__(self, mode, size, limit=CACHE_LIMIT): # Initialize cache
+        if mode not in CACHE_MODES: raise ValueError(f"Unknown cache mode: {mode}") # Validate mode
+        self.mode = mode # Storage mode
+        self.size = size # Frame (width, height)
+        self.limit = limit # Memory cap in bytes
+        self.frames = [] # Cached entries in loop order
+        self.nbytes = 0 # Bytes held so far
+        self.complete = False # True once a whole loop is cached
+        self.overflow = False # True if the loop did not fit under the cap
+
+    def encode(self, img): # Define encoder (runs on the decoder thread)
+        if self.mode == "raw": return img # Keep RGB image as is
+        if self.mode == "palette": return img.quantize(256, method=Image.Quantize.FASTOCTREE) # 1 byte per pixel
+        if self.mode == "zlib": return zlib.compress(img.tobytes(), 1) # Fast compression
+        return None # Photo mode is filled on the UI thread
+
+    def entry_size(self, entry): # Define size estimate
+        size = frame_bytes(self.mode, self.size) # Fixed per-frame size
+        return len(entry) if size is None else size # Compressed length otherwise
+
+    def reserve(self, entry): # Define memory accounting (decoder thread)
+        if self.overflow: return False # Already gave up
+        self.nbytes += self.entry_size(entry) # Account bytes
+        if self.nbytes > self.limit: # Over the cap
+            self.overflow = True # Give up caching
+            self.nbytes = 0 # Reset bytes
+        return not self.overflow # True if it still fits
+
+    def release(self): # Define memory release (only on the thread that appends frames)
+        self.frames = [] # Drop cached entries
+
+    def add(self, entry): # Define add function
+        if self.reserve(entry): self.frames.append(entry) # Store entry if it fits
+        else: self.release() # Thread-side modes append on the decoder thread too
+
+    def decode(self, index): # Define decoder for replay
+        entry = self.frames[index] # Get entry
+        if self.mode == "zlib": return Image.frombytes("RGB", self.size, zlib.decompress(entry)) # Inflate
+        if self.mode == "photo" and isinstance(entry, Image.Image): # Frame skipped on the first pass
+            entry = self.frames[index] = ImageTk.PhotoImage(entry) # Build its Tk image on first replay
+        return entry # Photo, raw and palette entries are used directly
+
+class FrameDecoder(threading.Thread): # Define background decoder thread
+    def __init__(self, video_path, size, max_queue=8, cache=None, disk_path=None, decoder_scale=True): # Initialize decoder
+        threading.Thread.__init__(self, daemon=True) # Daemon so it never blocks exit
+        self.video_path = video_path # Store video path
+        self.size = size # Store target (width, height)
+        self.frames = queue.Queue(maxsize=max_queue) # Bounded queue of ready frames
+        self.running = True # Running flag
+        self.awake = threading.Event() # Cleared while playback is paused
+        self.awake.set() # Start awake
+        self.hold = False # Wait instead of dropping when the queue is full
+        self.error = None # Last fatal error
+        self.cache = cache # Optional loop cache
+        self.decoder_scale = decoder_scale # Let ffmpeg scale to the display size
+
+        self.frames_decoded = 0 # Frames decoded counter
+        self.frames_dropped = 0 # Frames thrown away because the UI stalled
+        self.decode_time = 0.0 # Seconds spent decoding + resizing
+
+        self.disk_writer = None # Writer for a missing disk cache
+        self.disk_hit = False # True when frames come from the disk cache
+        self.reader = None # Frame source
+        if disk_path and os.path.exists(disk_path): # Disk cache available
+            try: # Try block
+                self.reader = MappedFrames(disk_path, size) # Read frames with no codec
+                self.disk_hit = True # Mark hit
+            except (OSError, ValueError, struct.error): # Unusable cache file
+                self.reader = None # Decode instead
+        if self.reader is None: # No usable disk cache
+            if decoder_scale: # Scaled decode
+                self.reader = imageio.get_reader(video_path, "ffmpeg", size=size, pixelformat="rgb24") # ffmpeg emits display-size RGB frames
+            else: # Native decode
+                self.reader = imageio.get_reader(video_path) # Open reader now so errors reach the caller
+            if disk_path: # Disk cache wanted
+                try: # Try block
+                    self.disk_writer = DiskCacheWriter(disk_path, size, self.reader.get_meta_data().get("fps", 30)) # Record first pass
+                except OSError: # Cache folder not writable
+                    self.disk_writer = None # Run without it
+
+    def run(self): # Define thread body
+        try: # Try block
+            while self.running: # Loop until stopped
+                if not self.awake.wait(0.5): continue # Sleep while paused
+                start = time.perf_counter() # Start timing
+                try: # Try block
+                    frame_data = self.reader.get_next_data() # Get next frame
+                except IndexError: # Handle end of video
+                    if self.disk_writer: # First pass fully recorded
+                        self.disk_writer.finish() # Publish disk cache
+                        self.disk_writer = None # Done writing
+                    if self.cache and not self.cache.overflow: # Whole loop fits in memory
+                        self.push(LOOP_END) # Tell the UI to replay from the cache
+                        break # No more decoding needed
+                    self.reader.set_image_index(0) # Rewind to loop
+                    continue # Decode first frame again
+                if self.disk_hit: # Mapped frame is already sized
+                    img = frame_data # Use it directly
+                else: # Decoded frame
+                    img = to_image(frame_data, self.size) # Wrap or resize off the UI thread
+                if self.disk_writer: self.disk_writer.write(img) # Record frame for later launches
+                if self.cache and self.cache.mode == "photo": # Photo mode
+                    self.cache.reserve(None) # UI thread stores the PhotoImage itself
+                elif self.cache: # Thread-side cache modes
+                    self.cache.add(self.cache.encode(img)) # Store encoded frame
+                self.decode_time += time.perf_counter() - start # Add decode cost
+                self.frames_decoded += 1 # Count frame
+                self.push(img) # Hand over to UI
+        except Exception as e: # Catch decoder errors
+            self.error = e # Remember error for stats
+        finally: # Always
+            if self.disk_writer: self.disk_writer.abort() # Drop incomplete disk cache
+            self.reader.close() # Release the video file
+
+    def push(self, img): # Define enqueue with backpressure
+        while self.running: # Loop until stored or stopped
+            try: # Try block
+                self.frames.put(img, timeout=0.5) # Wait for a free slot
+                return # Stored
+            except queue.Full: # UI has not taken a frame for a while
+                if self.hold or self.filling_photos(): continue # Throttled on purpose or every frame is needed, keep it
+                try: # Try block
+                    self.frames.get_nowait() # Drop the stalest frame
+                    self.frames_dropped += 1 # Count drop
+                except queue.Empty: # Consumer emptied it meanwhile
+                    pass # Retry put
+
+    def filling_photos(self): # Define photo cache check
+        return self.cache is not None and self.cache.mode == "photo" and not self.cache.overflow # UI builds the loop from every queued frame
+
+    def stop(self): # Define stop function
+        self.running = False # Clear running flag
+        self.awake.set() # Wake thread so it can exit
+
+class FramePacer: # Define wall-clock frame scheduler
+    def __init__(self, fps, window=300): # Initialize pacer
+        self.fps = fps # Target frames per second
+        self.start_time = 0.0 # Monotonic time of frame 0
+        self.frame_no = 0 # Frames accounted for so far
+        self.skipped = 0 # Frames skipped to catch up
+        self.shown_times = deque(maxlen=window) # Recent presentation times
+        self.lateness = deque(maxlen=window) # Recent lateness samples (ms)
+        self.work = deque(maxlen=window) # Recent UI work samples (ms)
+
+    def reset(self): # Define clock reset
+        self.start_time = time.monotonic() # Frame 0 is due now
+        self.frame_no = 0 # Nothing shown yet
+
+    def frames_due(self, now): # Define catch-up calculation
+        target = int((now - self.start_time) * self.fps) + 1 # Frames that should be on screen by now
+        steps = target - self.frame_no # Frames to advance
+        if steps > 1: self.skipped += steps - 1 # Count frames we jump over
+        self.frame_no = max(self.frame_no, target) # Never go backwards
+        return max(steps, 0) # Zero if the tick came early
+
+    def presented(self, now, done): # Define presentation record
+        due = self.start_time + (self.frame_no - 1) / self.fps # When this frame was due
+        self.shown_times.append(now) # Record time
+        self.lateness.append((now - due) * 1000) # Record lateness
+        self.work.append((done - now) * 1000) # Record UI cost
+
+    def delay_ms(self): # Define next tick delay
+        next_due = self.start_time + self.frame_no / self.fps # Next frame deadline
+        return max(1, int((next_due - time.monotonic()) * 1000)) # Sleep until then
+
+    def achieved_fps(self): # Define measured fps
+        if len(self.shown_times) < 2: return 0.0 # Not enough samples
+        span = self.shown_times[-1] - self.shown_times[0] # Sample time span
+        return (len(self.shown_times) - 1) / span if span > 0 else 0.0 # Frames per second
+
+class VideoBackground: # Define canvas video player
+    def __init__(self, root, canvas, video_path, size, fps=None, max_queue=8, cache=None, cache_limit=CACHE_LIMIT, disk_cache=False, decoder_scale=True, idle_after=120, idle_fps=2): # Initialize player
+        self.root = root # Store root window
+        self.canvas = canvas # Store canvas
+        self.after_id = None # Pending after() callback
+
+        self.idle_after = idle_after # Seconds without input before throttling (None disables)
+        self.idle_fps = idle_fps # Frame rate while idle (0 keeps a still frame)
+        self.state = "playing" # playing, idle or paused
+        self.state_since = time.monotonic() # When the state last changed
+        self.last_activity = self.state_since # Last user input
+        self.paused_time = 0.0 # Seconds spent paused
+        self.idle_time = 0.0 # Seconds spent throttled
+
+        self.replay_index = None # Cache position once replaying
+        disk_path = disk_cache_path(video_path, size) if disk_cache else None # Optional shared disk cache
+        self.decoder = FrameDecoder(video_path, size, max_queue, None, disk_path, decoder_scale) # Create decoder worker
+        meta = self.decoder.reader.get_meta_data() # Clip fps and length
+        self.cache = FrameCache(choose_cache_mode(cache, loop_frames(meta), size, cache_limit), size, cache_limit) if cache else None # Mode whose loop fits the cap
+        self.decoder.cache = self.cache # Decoder fills it from the first pass
+        self.full_fps = fps or meta.get("fps") or 30 # Normal playback rate
+        self.pacer = FramePacer(self.full_fps) # Pace at the video's own rate
+        self.photo = ImageTk.PhotoImage("RGB", size) # One Tk image reused for every frame
+        self.item_id = canvas.create_image(0, 0, image=self.photo, anchor="nw") # Canvas item showing it
+        self.shared_shown = True # Canvas shows the shared image
+
+        self.frames_shown = 0 # Frames blitted counter
+        self.underruns = 0 # Ticks where no frame was ready
+
+        self.root.bind("<Unmap>", self.on_unmap, add="+") # Minimized or withdrawn
+        self.root.bind("<Map>", self.on_map, add="+") # Restored
+        self.root.bind("<FocusOut>", self.on_focus_out, add="+") # Another app took focus
+        self.canvas.bind("<Visibility>", self.on_visibility, add="+") # Covered by other windows (X11)
+        for seq in ("<Motion>", "<KeyPress>", "<ButtonPress>", "<FocusIn>"): # User interaction events
+            self.root.bind(seq, self.on_activity, add="+") # Any of them wakes playback
+
+    def start(self): # Define start function
+        self.decoder.start() # Start worker
+        self.pacer.reset() # Start the clock
+        self.tick() # Start UI loop
+
+    def tick(self): # Define UI frame callback
+        self.after_id = None # Callback consumed
+        now = time.monotonic() # Tick time
+        steps = self.pacer.frames_due(now) # Frames owed since last tick
+        if steps and self.advance(steps): # Something was shown
+            self.pacer.presented(now, time.monotonic()) # Record timing
+        if self.state == "playing" and self.idle_after and now - self.last_activity > self.idle_after: # No input for a while
+            self.set_state("idle") # Throttle playback (reschedules itself)
+            return # Done
+        if self.state == "paused" or (self.state == "idle" and not self.idle_fps): return # Frozen on the current frame
+        if self.decoder.is_alive() or not self.decoder.frames.empty() or self.replay_index is not None: # Keep going while there is a source
+            self.after_id = self.root.after(self.pacer.delay_ms(), self.tick) # Schedule at the next deadline
+
+    def set_state(self, state): # Define playback state change
+        if state == self.state: return # Nothing to do
+        now = time.monotonic() # Change time
+        if self.state == "paused": self.paused_time += now - self.state_since # Account paused time
+        if self.state == "idle": self.idle_time += now - self.state_since # Account idle time
+        self.state = state # Store state
+        self.state_since = now # Restart timer
+
+        if state == "paused": self.decoder.awake.clear() # Stop decoding while hidden
+        else: self.decoder.awake.set() # Decode again
+        self.decoder.hold = state != "playing" # Never drop frames while throttled
+        self.pacer.fps = self.full_fps if state == "playing" else (self.idle_fps or self.full_fps) # Pick frame rate
+        self.pacer.reset() # Re-anchor the clock at the new rate
+
+        if self.after_id: self.root.after_cancel(self.after_id) # Drop the old schedule
+        self.after_id = None # Clear ID
+        if state == "playing" or (state == "idle" and self.idle_fps): # Still animating
+            self.after_id = self.root.after(self.pacer.delay_ms(), self.tick) # Schedule at the new rate
+
+    def on_unmap(self, event): # Define unmap handler
+        if event.widget is self.root: self.set_state("paused") # Window minimized
+
+    def on_map(self, event): # Define map handler
+        if event.widget is self.root: self.wake() # Window restored
+
+    def on_visibility(self, event): # Define visibility handler
+        if event.state == "VisibilityFullyObscured": self.set_state("paused") # Nothing to see
+        elif self.state == "paused": self.wake() # Visible again
+
+    def on_focus_out(self, event): # Define focus out handler
+        self.root.after(100, self.check_focus) # Focus may just be moving between our widgets
+
+    def check_focus(self): # Define focus check
+        try: # Try block
+            focused = self.root.focus_get() # Widget with focus, if ours
+        except KeyError: # Focus is on a widget Tk cannot name (dialogs)
+            focused = True # Treat as still ours
+        if focused is None and self.state == "playing": self.set_state("idle") # App lost focus
+
+    def on_activity(self, event=None): # Define input handler
+        self.last_activity = time.monotonic() # Remember input time
+        if self.state == "idle": self.wake() # Resume instantly
+
+    def wake(self): # Define resume function
+        self.last_activity = time.monotonic() # Count as activity
+        self.set_state("playing") # Back to full rate
+
+    def advance(self, steps): # Define frame advance with skipping
+        if self.replay_index is None: # Still streaming
+            frames = [] # Frames popped this tick
+            while len(frames) < steps: # Take up to the owed count
+                try: # Try block
+                    img = self.decoder.frames.get_nowait() # Pop a ready frame
+                except queue.Empty: # Decoder is behind
+                    break # Use what we have
+                if img is LOOP_END: # First pass finished
+                    if self.cache.frames: # Something to replay
+                        self.cache.complete = True # Mark cache ready
+                        self.replay_index = 0 # Replay from first frame
+                    break # Stop popping
+                frames.append(img) # Keep frame
+            for img in frames[:-1]: self.skip_frame(img) # Jump over late frames
+            if frames: # Newest frame available
+                self.show_frame(frames[-1]) # Blit it
+                return True # Shown
+            if self.replay_index is None: # Nothing at all
+                self.underruns += 1 # Count underrun
+                return False # Not shown
+            steps = 1 # Cache just became ready
+        if not self.cache.frames: return False # Nothing cached to replay
+        self.replay_index = (self.replay_index + steps - 1) % len(self.cache.frames) # Skip owed frames
+        self.show_cached() # Show cached frame
+        return True # Shown
+
+    def skip_frame(self, img): # Define skipped frame handling
+        if self.cache and self.cache.mode == "photo" and not self.cache.overflow: # Photo cache still filling
+            self.cache.frames.append(img) # Keep the loop complete; its Tk image is built on first replay
+        elif self.cache and self.cache.mode == "photo" and self.cache.frames: # Cap exceeded on the decoder thread
+            self.cache.release() # Free the partial loop here, where it is filled
+
+    def show_frame(self, img): # Define decoded frame display
+        if self.cache and self.cache.mode == "photo" and not self.cache.overflow: # Build photo cache on first pass
+            photo = ImageTk.PhotoImage(img) # One Tk image per loop frame
+            self.cache.frames.append(photo) # Keep it for replay
+            self.canvas.itemconfig(self.item_id, image=photo) # Show it
+            self.shared_shown = False # Canvas no longer shows the shared image
+        else: # Streaming or thread-side cache
+            if self.cache and self.cache.mode == "photo" and self.cache.frames: self.cache.release() # Free the abandoned photo loop
+            if not self.shared_shown: # Photo cache was abandoned
+                self.canvas.itemconfig(self.item_id, image=self.photo) # Switch back to the shared image
+                self.shared_shown = True # Shared image is on screen again
+            self.photo.paste(img) # Blit into the existing Tk image
+        self.frames_shown += 1 # Count frame
+
+    def show_cached(self): # Define cached frame display
+        entry = self.cache.decode(self.replay_index) # Fetch cached frame
+        if self.cache.mode == "photo": # Prebuilt Tk image
+            self.canvas.itemconfig(self.item_id, image=entry) # Swap image, no pixel work
+        else: # PIL image
+            self.photo.paste(entry) # Blit into the existing Tk image
+        self.replay_index = (self.replay_index + 1) % len(self.cache.frames) # Advance and wrap
+        self.frames_shown += 1 # Count frame
+
+    def decode_saved(self): # Define saved work estimate
+        now = time.monotonic() # Current time
+        paused = self.paused_time + (now - self.state_since if self.state == "paused" else 0) # Seconds paused
+        idle = self.idle_time + (now - self.state_since if self.state == "idle" else 0) # Seconds throttled
+        frames = paused * self.full_fps + idle * (self.full_fps - self.idle_fps) # Frames not produced
+        d = self.decoder # Short alias
+        per_frame = d.decode_time / d.frames_decoded if d.frames_decoded else 0 # Average cost of one decode
+        return frames, frames * per_frame # Frames and seconds saved
+
+    def stop(self): # Define stop function
+        self.decoder.stop() # Stop worker
+        if self.after_id: self.root.after_cancel(self.after_id) # Cancel pending tick
+        self.after_id = None # Clear ID
+
+    def stats(self): # Define stats function
+        d = self.decoder # Short alias
+        pc = self.pacer # Short alias
+        avg_ms = d.decode_time / d.frames_decoded * 1000 if d.frames_decoded else 0 # Average decode cost
+        saved_frames, saved_s = self.decode_saved() # Work avoided while hidden or idle
+        return { # Return snapshot
+            "queue_depth": d.frames.qsize(), "queue_size": d.frames.maxsize, # Queue state
+            "decoded": d.frames_decoded, "shown": self.frames_shown, # Throughput
+            "dropped": d.frames_dropped, "underruns": self.underruns, # Losses
+            "decode_ms_avg": round(avg_ms, 2), "error": d.error, # Cost and errors
+            "cache": self.cache.mode if self.cache else None, # Cache mode
+            "cached_frames": len(self.cache.frames) if self.cache else 0, # Cached loop length
+            "cache_mb": round(self.cache.nbytes / 1048576, 1) if self.cache else 0, # Cache memory
+            "replaying": self.replay_index is not None, # True once decoding has stopped
+            "disk_cache": "hit" if d.disk_hit else ("writing" if d.disk_writer else None), # Disk cache state
+            "target_fps": round(pc.fps, 2), "achieved_fps": round(pc.achieved_fps(), 2), # Frame rate
+            "skipped": pc.skipped, # Frames skipped to stay on the clock
+            "late_ms_p50": round(percentile(pc.lateness, 50), 2), # Median lateness
+            "late_ms_p95": round(percentile(pc.lateness, 95), 2), # 95th percentile lateness
+            "late_ms_p99": round(percentile(pc.lateness, 99), 2), # 99th percentile lateness
+            "work_ms_p50": round(percentile(pc.work, 50), 2), # Median UI cost per frame
+            "work_ms_p99": round(percentile(pc.work, 99), 2), # 99th percentile UI cost per frame
+            "state": self.state, # Playback state
+            "paused_s": round(self.paused_time, 1), "idle_s": round(self.idle_time, 1), # Time not at full rate
+            "frames_saved": int(saved_frames), "decode_s_saved": round(saved_s, 2) # Work avoided
+        }